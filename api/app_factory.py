@@ -5,6 +5,7 @@ Flask 应用工厂模式
 """
 
 from flask import Flask
+from flask_compress import Compress
 from flask_cors import CORS
 from flask_migrate import Migrate
 
@@ -12,6 +13,7 @@ from configs.app_config import Config
 from extensions.ext_database import db
 from extensions.ext_redis import redis_client
 from extensions.ext_storage import storage
+from libs.json_provider import OrjsonProvider
 
 
 def create_app(config_class=Config) -> Flask:
@@ -26,6 +28,9 @@ def create_app(config_class=Config) -> Flask:
     """
     app = Flask(__name__)
 
+    # 请求体 JSON 使用 orjson 解析
+    app.json = OrjsonProvider(app)
+
     # 加载配置
     app.config.from_object(config_class)
 
@@ -38,14 +43,20 @@ def create_app(config_class=Config) -> Flask:
     # 注册错误处理器
     register_error_handlers(app)
 
+    # 限制 JSON 接口请求体大小
+    register_request_limits(app)
+
     # 配置 CORS
     CORS(
         app,
         resources={
             r"/api/*": {
-                "origins": app.config.get("CORS_ALLOW_ORIGINS", "*"),
+                "origins": list(app.config.get("CORS_ALLOW_ORIGINS", ("*",))),
                 "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
                 "allow_headers": ["Content-Type", "Authorization"],
+                "send_wildcard": False,
+                # 允许浏览器缓存预检结果，减少 OPTIONS 请求
+                "max_age": 600,
             }
         },
     )
@@ -62,6 +73,10 @@ def initialize_extensions(app: Flask) -> None:
     """
     # 初始化数据库
     db.init_app(app)
+    if app.config.get("DB_USE_PGBOUNCER"):
+        app.logger.info("Database connection mode: PgBouncer (NullPool, prepared statements disabled)")
+    else:
+        app.logger.info("Database connection mode: direct (QueuePool)")
 
     # 初始化数据库迁移
     Migrate(app, db)
@@ -72,6 +87,9 @@ def initialize_extensions(app: Flask) -> None:
     # 初始化存储
     storage.init_app(app)
 
+    # 初始化响应压缩（仅压缩 JSON 响应）
+    Compress(app)
+
 
 def register_blueprints(app: Flask) -> None:
     """
@@ -96,6 +114,26 @@ def register_blueprints(app: Flask) -> None:
     app.register_blueprint(model_provider_bp)
 
 
+def register_request_limits(app: Flask) -> None:
+    """
+    为 /api/ 下的 JSON 接口设置请求体上限
+
+    全局 MAX_CONTENT_LENGTH 面向文件上传，JSON 接口使用更小的上限，
+    超限时读取请求体即返回 413，不会进入 JSON 解析
+
+    参数:
+        app: Flask 应用实例
+    """
+    from flask import request
+
+    limit = app.config.get("JSON_MAX_CONTENT_LENGTH")
+
+    @app.before_request
+    def limit_json_body():
+        if limit and request.path.startswith("/api/"):
+            request.max_content_length = limit
+
+
 def register_error_handlers(app: Flask) -> None:
     """
     注册全局错误处理器
@@ -104,6 +142,7 @@ def register_error_handlers(app: Flask) -> None:
         app: Flask 应用实例
     """
     from flask import jsonify
+    from pydantic import ValidationError as RequestValidationError
 
     from libs.errors import APIException
     from services.exceptions import (
@@ -124,43 +163,56 @@ def register_error_handlers(app: Flask) -> None:
     @app.errorhandler(ValidationError)
     def handle_validation_error(e):
         """处理验证错误"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "VALIDATION_ERROR"}), 400
+        return jsonify({"error": str(e), "code": getattr(e, "code", "VALIDATION_ERROR")}), 400
+
+    @app.errorhandler(RequestValidationError)
+    def handle_request_validation_error(e):
+        """处理请求体校验错误（pydantic）"""
+        error = e.errors(include_url=False)[0]
+        field = ".".join(str(loc) for loc in error["loc"])
+        message = f"{field}: {error['msg']}" if field else error["msg"]
+        return jsonify({"error": message, "code": "VALIDATION_ERROR"}), 400
 
     @app.errorhandler(AuthenticationError)
     def handle_authentication_error(e):
         """处理认证错误"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "AUTHENTICATION_ERROR"}), 401
+        return jsonify({"error": str(e), "code": getattr(e, "code", "AUTHENTICATION_ERROR")}), 401
 
     @app.errorhandler(AuthorizationError)
     def handle_authorization_error(e):
         """处理授权错误"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "AUTHORIZATION_ERROR"}), 403
+        return jsonify({"error": str(e), "code": getattr(e, "code", "AUTHORIZATION_ERROR")}), 403
 
     @app.errorhandler(ResourceNotFoundError)
     def handle_not_found_error(e):
         """处理资源未找到错误"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "NOT_FOUND"}), 404
+        return jsonify({"error": str(e), "code": getattr(e, "code", "NOT_FOUND")}), 404
 
     @app.errorhandler(ResourceConflictError)
     def handle_conflict_error(e):
         """处理资源冲突错误"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "CONFLICT"}), 409
+        return jsonify({"error": str(e), "code": getattr(e, "code", "CONFLICT")}), 409
 
     @app.errorhandler(BusinessLogicError)
     def handle_business_logic_error(e):
         """处理业务逻辑错误"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "BUSINESS_ERROR"}), 422
+        return jsonify({"error": str(e), "code": getattr(e, "code", "BUSINESS_ERROR")}), 422
 
     @app.errorhandler(ServiceError)
     def handle_service_error(e):
         """处理服务层错误（兜底）"""
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "SERVICE_ERROR"}), 500
+        return jsonify({"error": str(e), "code": getattr(e, "code", "SERVICE_ERROR")}), 500
 
     @app.errorhandler(404)
     def handle_not_found(e):
         """处理 404 错误"""
         return jsonify({"error": "Not Found", "message": str(e)}), 404
 
+    @app.errorhandler(413)
+    def handle_request_too_large(e):
+        """处理请求体过大错误"""
+        return jsonify({"error": "Request Entity Too Large", "code": "PAYLOAD_TOO_LARGE"}), 413
+
     @app.errorhandler(500)
     def handle_internal_error(e):
         """处理 500 错误"""
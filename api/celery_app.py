@@ -3,29 +3,47 @@ Celery 入口文件
 
 用于启动 Celery Worker 和 Beat
 """
-import os
+from typing import Optional
+
 from celery import Celery
-from app_factory import create_app
+from flask import Flask
 
-# 创建 Flask 应用
-flask_app = create_app()
+from configs.app_config import CelerySettings
 
-# 创建 Celery 实例
+# 创建 Celery 实例（仅读取 Celery 配置，不初始化数据库、Redis 等扩展）
 celery = Celery(
-    flask_app.import_name,
-    broker=flask_app.config['CELERY_BROKER_URL'],
-    backend=flask_app.config['CELERY_RESULT_BACKEND']
+    'shadow_agents',
+    broker=CelerySettings.CELERY_BROKER_URL,
+    backend=CelerySettings.CELERY_RESULT_BACKEND
 )
 
-# 从 Flask 配置更新 Celery 配置
-celery.conf.update(flask_app.config)
+# CELERY_ 前缀的配置映射为 Celery 的小写配置项，如 CELERY_TASK_SERIALIZER -> task_serializer
+celery.config_from_object(CelerySettings, namespace='CELERY')
+
+# Flask 应用在首次执行任务时才创建
+_flask_app: Optional[Flask] = None
+
+
+def get_flask_app() -> Flask:
+    """
+    获取 Flask 应用（延迟创建）
+
+    返回:
+        Flask 应用实例
+    """
+    global _flask_app
+    if _flask_app is None:
+        from app_factory import create_app
+        _flask_app = create_app()
+    return _flask_app
+
 
 # 设置 Flask 应用上下文
 class ContextTask(celery.Task):
     """带有 Flask 应用上下文的任务基类"""
     
     def __call__(self, *args, **kwargs):
-        with flask_app.app_context():
+        with get_flask_app().app_context():
             return self.run(*args, **kwargs)
 
 celery.Task = ContextTask
@@ -4,10 +4,85 @@
 从环境变量加载配置
 """
 import os
-from typing import Optional
+from typing import Any, Optional
 
+from sqlalchemy.pool import NullPool
 
-class Config:
+
+def _build_engine_options(
+    pool_size: int,
+    max_overflow: int,
+    use_pgbouncer: bool,
+    statement_timeout: int,
+    prepare_threshold: int,
+) -> dict[str, Any]:
+    """
+    构建 SQLAlchemy 引擎参数
+
+    连接池按进程创建，gunicorn/Celery 每个 worker 各持有一个连接池，
+    因此池大小按 CPU 数收敛，避免 worker 数 × 池大小超过 PostgreSQL 的 max_connections
+
+    参数:
+        pool_size: 配置的连接池大小上限
+        max_overflow: 连接池溢出数量
+        use_pgbouncer: 是否经由 PgBouncer（事务池模式）连接
+        statement_timeout: 语句超时时间（毫秒）
+        prepare_threshold: 同一语句执行多少次后由 psycopg 自动转为服务端预编译语句
+
+    返回:
+        引擎参数字典
+    """
+    if use_pgbouncer:
+        # PgBouncer 已负责连接复用，应用侧不再持有连接池；
+        # 事务池模式下也不转发 options 启动参数；
+        # 预编译语句绑定在服务端连接上，事务池会把后续执行路由到其他连接，必须关闭
+        return {'poolclass': NullPool, 'connect_args': {'prepare_threshold': None}}
+
+    return {
+        'pool_size': max(2, min(pool_size, (os.cpu_count() or 2) * 2)),
+        'max_overflow': max_overflow,
+        'pool_pre_ping': True,
+        'pool_recycle': 3600,
+        # 后进先出：优先复用最近归还的连接，空闲连接可被 pool_recycle 及时回收
+        'pool_use_lifo': True,
+        'connect_args': {
+            'options': f'-c statement_timeout={statement_timeout}',
+            # 列表查询等高频同形语句执行达到阈值后走服务端预编译，省去重复解析
+            'prepare_threshold': prepare_threshold,
+        },
+    }
+
+
+class CelerySettings:
+    """
+    Celery 配置
+
+    仅包含 broker/backend 与序列化相关的配置，
+    Celery worker 启动时直接读取，无需创建完整的 Flask 应用
+    """
+
+    CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/1')
+    CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/1')
+    CELERY_TASK_SERIALIZER = 'json'
+    CELERY_RESULT_SERIALIZER = 'json'
+    CELERY_ACCEPT_CONTENT = ['json']
+    CELERY_TIMEZONE = 'UTC'
+    CELERY_ENABLE_UTC = True
+
+    # Broker 连接池上限，限制每个 worker 持有的 Redis 连接数，避免触发 maxclients
+    CELERY_BROKER_POOL_LIMIT = int(os.getenv('CELERY_BROKER_POOL_LIMIT', 10))
+    CELERY_BROKER_TRANSPORT_OPTIONS = {'visibility_timeout': 3600, 'socket_keepalive': True}
+    # 每次只预取一个任务，避免长任务阻塞已预取的短任务
+    CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', 1))
+    # 任务执行完成后再确认，worker 异常退出时任务重新入队
+    CELERY_TASK_ACKS_LATE = True
+    CELERY_TASK_REJECT_ON_WORKER_LOST = True
+    # 定期回收子进程，控制内存增长
+    CELERY_WORKER_MAX_TASKS_PER_CHILD = int(os.getenv('CELERY_WORKER_MAX_TASKS_PER_CHILD', 1000))
+    CELERY_WORKER_MAX_MEMORY_PER_CHILD = int(os.getenv('CELERY_WORKER_MAX_MEMORY_PER_CHILD', 512000))  # KB
+
+
+class Config(CelerySettings):
     """应用配置类"""
     
     # 基础配置
@@ -23,42 +98,30 @@ class Config:
     DB_DATABASE = os.getenv('DB_DATABASE', 'shadow_agents')
     DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 30))
     DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_STATEMENT_TIMEOUT = int(os.getenv('DB_STATEMENT_TIMEOUT', 30000))  # 毫秒
+    DB_PREPARE_THRESHOLD = int(os.getenv('DB_PREPARE_THRESHOLD', 3))
+    # 只按显式配置切换 PgBouncer 模式（NullPool + 关闭预编译语句），不根据主机名推断
+    DB_USE_PGBOUNCER = os.getenv('DB_USE_PGBOUNCER', 'false').lower() == 'true'
     
-    # SQLAlchemy 配置
-    @property
-    def SQLALCHEMY_DATABASE_URI(self) -> str:
-        """构建数据库连接 URI"""
-        return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_DATABASE}"
-    
+    # SQLAlchemy 配置（导入时构建一次，from_object 可直接读取字符串）
+    SQLALCHEMY_DATABASE_URI = f"postgresql+psycopg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DATABASE}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ENGINE_OPTIONS = {
-        'pool_size': DB_POOL_SIZE,
-        'max_overflow': DB_MAX_OVERFLOW,
-        'pool_pre_ping': True,
-        'pool_recycle': 3600,
-    }
+    SQLALCHEMY_ENGINE_OPTIONS = _build_engine_options(
+        DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_USE_PGBOUNCER, DB_STATEMENT_TIMEOUT, DB_PREPARE_THRESHOLD
+    )
     
     # Redis 配置
     REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
     REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
     REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
     REDIS_DB = int(os.getenv('REDIS_DB', 0))
-    
-    @property
-    def REDIS_URL(self) -> str:
-        """构建 Redis 连接 URL"""
-        if self.REDIS_PASSWORD:
-            return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
-        return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
-    
-    # Celery 配置
-    CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/1')
-    CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND', 'redis://localhost:6379/1')
-    CELERY_TASK_SERIALIZER = 'json'
-    CELERY_RESULT_SERIALIZER = 'json'
-    CELERY_ACCEPT_CONTENT = ['json']
-    CELERY_TIMEZONE = 'UTC'
-    CELERY_ENABLE_UTC = True
+    REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 50))
+    REDIS_POOL_TIMEOUT = int(os.getenv('REDIS_POOL_TIMEOUT', 5))
+    REDIS_URL = (
+        f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+        if REDIS_PASSWORD
+        else f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+    )
     
     # 向量数据库配置
     VECTOR_STORE = os.getenv('VECTOR_STORE', 'milvus')
@@ -74,6 +137,9 @@ class Config:
     # OpenAI 配置
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
     OPENAI_API_BASE = os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')
+    # 每个进程同时进行的模型调用上限，以及等待空闲名额的最长时间（秒，超时返回 429）
+    LLM_MAX_CONCURRENT_REQUESTS = int(os.getenv('LLM_MAX_CONCURRENT_REQUESTS', 10))
+    LLM_REQUEST_SLOT_TIMEOUT = float(os.getenv('LLM_REQUEST_SLOT_TIMEOUT', 30))
     
     # Anthropic 配置
     ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY', '')
@@ -83,12 +149,36 @@ class Config:
     LOG_FILE = os.getenv('LOG_FILE', 'logs/app.log')
     
     # CORS 配置
-    CORS_ALLOW_ORIGINS = os.getenv('CORS_ALLOW_ORIGINS', 'http://localhost:3000').split(',')
+    CORS_ALLOW_ORIGINS = tuple(
+        origin.strip()
+        for origin in os.getenv('CORS_ALLOW_ORIGINS', 'http://localhost:3000').split(',')
+        if origin.strip()
+    )
+    
+    # 响应压缩配置（Flask-Compress），由 nginx 负责压缩时设置 COMPRESS_REGISTER=false
+    COMPRESS_REGISTER = os.getenv('COMPRESS_REGISTER', 'true').lower() == 'true'
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 500))
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_LEVEL = 1
     
     # JWT 配置
     JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
     JWT_ACCESS_TOKEN_EXPIRES = int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', 3600))
     JWT_REFRESH_TOKEN_EXPIRES = int(os.getenv('JWT_REFRESH_TOKEN_EXPIRES', 2592000))
+    # 进程内已验证令牌缓存：最大条目数（0 表示不缓存）与最长缓存时间（秒）
+    AUTH_JWT_CACHE_MAX = int(os.getenv('AUTH_JWT_CACHE_MAX', 10000))
+    AUTH_JWT_CACHE_TTL = int(os.getenv('AUTH_JWT_CACHE_TTL', 30))
+    # 每个 worker 同时进行的密码哈希计算上限（gevent worker 下密码哈希线程池的线程数）
+    PASSWORD_HASH_CONCURRENCY = int(os.getenv('PASSWORD_HASH_CONCURRENCY', 4))
+    # 进程内租户成员关系缓存：最大条目数与缓存时间（秒），成员变更在本进程内立即失效
+    TENANT_MEMBER_CACHE_MAX = int(os.getenv('TENANT_MEMBER_CACHE_MAX', 65536))
+    TENANT_MEMBER_CACHE_TTL = int(os.getenv('TENANT_MEMBER_CACHE_TTL', 15))
+    
+    # JSON 接口请求体上限（字节），在解析前拒绝超大请求体；认证接口单独使用更小的上限
+    JSON_MAX_CONTENT_LENGTH = int(os.getenv('JSON_MAX_CONTENT_LENGTH', 65536))
+    AUTH_MAX_CONTENT_LENGTH = int(os.getenv('AUTH_MAX_CONTENT_LENGTH', 4096))
     
     # 文件上传配置
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_CONTENT_LENGTH', 52428800))  # 50MB
@@ -4,18 +4,23 @@
 处理应用创建、管理等 HTTP 请求
 """
 
+from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
 
-from flask import Blueprint, g, jsonify, request
+import orjson
+import redis
+from flask import Blueprint, Response, g, request
 
+from controllers.console.app.schemas import CreateAppRequest, UpdateAppRequest
 from controllers.console.auth.auth_bp import jwt_required
-from models.app import AppMode, AppStatus
+from controllers.console.wraps import parse_uuid, uuid_path
+from extensions.ext_redis import redis_client
+from libs.response import json_response
+from models.app import App, AppStatus
 from services import (
     AppService,
     AuthorizationError,
-    BusinessLogicError,
-    ResourceNotFoundError,
     ValidationError,
 )
 
@@ -23,32 +28,150 @@ from services import (
 app_bp = Blueprint("app", __name__, url_prefix="/api/console/apps")
 
 
-# 初始化服务（延迟初始化）
-def get_app_service():
-    """获取应用服务实例"""
-    return AppService()
+# 服务实例（延迟初始化，首次使用时创建后复用）
+_app_service: Optional[AppService] = None
 
 
-def parse_uuid(uuid_string: str, name: str = "ID") -> Optional[UUID]:
+def get_app_service() -> AppService:
     """
-    解析 UUID 字符串
+    获取应用服务实例
+
+    AppService 本身无请求级状态（数据库会话来自 Flask-SQLAlchemy 的 scoped session），
+    因此在进程内复用同一个实例，避免每个请求重复构造服务和仓储对象
+    """
+    global _app_service
+    if _app_service is None:
+        _app_service = AppService()
+    return _app_service
+
+
+# 应用详情缓存（Redis），缓存值格式为 b"<版本>\n<tenant_id>\n<JSON 响应体>"；
+# 版本为 updated_at（UTC 微秒数）。失效时不删除键，而是写入只有版本的墓碑 b"<版本>\n"，
+# 写入统一经过 _APP_CACHE_SET_SCRIPT 比较版本：已有版本更新时放弃写入，
+# 与更新并发的读请求无法把更新前的响应体写回缓存
+_APP_CACHE_KEY = "app:v1:{}"
+_APP_CACHE_TTL = 60
+
+# 删除应用后的墓碑版本，高于任何 updated_at
+_APP_DELETED_VERSION = 2**62
+
+_EPOCH = datetime(1970, 1, 1)
+
+# 按版本比较写入：KEYS[1] 已有的版本大于 ARGV[1] 时放弃写入
+_APP_CACHE_SET_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    local version = tonumber(string.match(current, '^%d+'))
+    if version and version > tonumber(ARGV[1]) then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+# 已注册的写入脚本（首次写入时创建，之后复用）
+_app_cache_set_script = None
+
+
+def _app_version(app: App) -> int:
+    """
+    计算应用的缓存版本（updated_at 距 Unix 纪元的微秒数）
 
     参数:
-        uuid_string: UUID 字符串
-        name: 参数名称（用于错误消息）
+        app: 应用实例
 
     返回:
-        UUID 对象或 None（如果解析失败）
+        版本号
+    """
+    return (app.updated_at - _EPOCH) // timedelta(microseconds=1)
+
 
-    抛出:
-        ValueError: 如果 UUID 格式不正确
+def _store_app_cache(app_id: UUID, version: int, value: bytes) -> None:
     """
-    import uuid as uuid_module
+    按版本比较写入应用详情缓存
 
+    参数:
+        app_id: 应用 ID
+        version: 写入内容的版本
+        value: 缓存值（含版本前缀）
+    """
+    global _app_cache_set_script
     try:
-        return uuid_module.UUID(uuid_string)
-    except (ValueError, AttributeError):
-        raise ValueError(f"Invalid {name}: {uuid_string}")
+        if _app_cache_set_script is None:
+            _app_cache_set_script = redis_client.client.register_script(_APP_CACHE_SET_SCRIPT)
+        _app_cache_set_script(keys=[_APP_CACHE_KEY.format(app_id)], args=[version, value, _APP_CACHE_TTL])
+    except (RuntimeError, redis.RedisError):
+        pass
+
+
+def _get_cached_app(app_id: UUID) -> Optional[tuple[str, bytes]]:
+    """
+    读取应用详情缓存
+
+    Redis 未初始化或不可用时视为未命中，墓碑视为未命中
+
+    参数:
+        app_id: 应用 ID
+
+    返回:
+        (租户 ID, JSON 响应体) 或 None
+    """
+    try:
+        cached = redis_client.get(_APP_CACHE_KEY.format(app_id))
+    except (RuntimeError, redis.RedisError):
+        return None
+
+    if not cached:
+        return None
+
+    _, _, entry = cached.partition(b"\n")
+    if not entry:
+        return None
+
+    tenant_id, _, body = entry.partition(b"\n")
+    return tenant_id.decode(), body
+
+
+def _set_cached_app(app: App, body: bytes) -> None:
+    """
+    写入应用详情缓存
+
+    参数:
+        app: 应用实例
+        body: 已序列化的 JSON 响应体
+    """
+    version = _app_version(app)
+    _store_app_cache(app.id, version, f"{version}\n{app.tenant_id}\n".encode() + body)
+
+
+def _invalidate_cached_app(app_id: UUID, app: Optional[App] = None) -> None:
+    """
+    使应用详情缓存失效（写入墓碑）
+
+    参数:
+        app_id: 应用 ID
+        app: 更新后的应用实例；为 None 时表示应用已删除
+    """
+    version = _app_version(app) if app is not None else _APP_DELETED_VERSION
+    _store_app_cache(app_id, version, f"{version}\n".encode())
+
+
+def _conditional_json(body: bytes) -> Response:
+    """
+    构建带 ETag 的 JSON 响应
+
+    ETag 由响应体哈希得到；请求的 If-None-Match 匹配时返回无响应体的 304
+
+    参数:
+        body: 已序列化的 JSON 响应体
+
+    返回:
+        Flask Response
+    """
+    response = Response(body, status=200, mimetype="application/json")
+    response.add_etag()
+    return response.make_conditional(request)
 
 
 @app_bp.route("", methods=["POST"])
@@ -91,74 +214,22 @@ def create_app():
         - 403: 无权限（不是租户成员）
         - 404: 租户不存在
     """
-    try:
-        data = request.get_json()
-        app_service = get_app_service()
-        account = g.current_account
-
-        # 解析租户 ID
-        tenant_id_str = data.get("tenant_id")
-        if not tenant_id_str:
-            return jsonify({"error": "tenant_id is required", "code": "VALIDATION_ERROR"}), 400
-
-        try:
-            tenant_id = parse_uuid(tenant_id_str, "tenant ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        # 解析应用模式
-        mode_str = data.get("mode", "chat")
-        try:
-            mode = AppMode[mode_str.upper()]
-        except KeyError:
-            return (
-                jsonify(
-                    {
-                        "error": f"Invalid mode: {mode_str}. Must be one of: chat, completion, agent, workflow",
-                        "code": "VALIDATION_ERROR",
-                    }
-                ),
-                400,
-            )
-
-        # 调用服务层创建应用
-        app = app_service.create_app(
-            tenant_id=tenant_id,
-            account_id=account.id,
-            name=data.get("name"),
-            mode=mode,
-            description=data.get("description"),
-            icon=data.get("icon"),
-            icon_background=data.get("icon_background"),
-        )
-
-        return (
-            jsonify(
-                {
-                    "id": str(app.id),
-                    "name": app.name,
-                    "mode": app.mode.value,
-                    "description": app.description,
-                    "icon": app.icon,
-                    "icon_background": app.icon_background,
-                    "status": app.status.value,
-                    "enable_site": app.enable_site,
-                    "enable_api": app.enable_api,
-                    "created_at": app.created_at.isoformat(),
-                    "updated_at": app.updated_at.isoformat(),
-                }
-            ),
-            201,
-        )
-
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    req = CreateAppRequest.model_validate(request.get_json(silent=True))
+    app_service = get_app_service()
+    account = g.current_account
+
+    # 调用服务层创建应用
+    app = app_service.create_app(
+        tenant_id=req.tenant_id,
+        account_id=account.id,
+        name=req.name,
+        mode=req.mode,
+        description=req.description,
+        icon=req.icon,
+        icon_background=req.icon_background,
+    )
+
+    return json_response(app.to_view_dict(), 201)
 
 
 @app_bp.route("", methods=["GET"])
@@ -185,53 +256,44 @@ def get_apps():
                 "status": "normal"
             }
         ]
+
+        未变化 (304): If-None-Match 与列表当前 ETag 匹配，无响应体
     """
-    try:
-        account = g.current_account
-        app_service = get_app_service()
-
-        # 获取查询参数
-        tenant_id_str = request.args.get("tenant_id")
-        if not tenant_id_str:
-            return jsonify({"error": "tenant_id is required", "code": "VALIDATION_ERROR"}), 400
-
-        try:
-            tenant_id = parse_uuid(tenant_id_str, "tenant ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        include_archived = request.args.get("include_archived", "false").lower() == "true"
-
-        # 获取应用列表
-        apps = app_service.get_tenant_apps(tenant_id, account.id, include_archived)
-
-        # 构建响应
-        result = []
-        for app in apps:
-            result.append(
-                {
-                    "id": str(app.id),
-                    "name": app.name,
-                    "mode": app.mode.value,
-                    "icon": app.icon,
-                    "icon_background": app.icon_background,
-                    "status": app.status.value,
-                }
-            )
-
-        return jsonify(result), 200
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    account = g.current_account
+    app_service = get_app_service()
+
+    # 获取查询参数
+    tenant_id_str = request.args.get("tenant_id")
+    if not tenant_id_str:
+        raise ValidationError("tenant_id is required")
+
+    tenant_id = parse_uuid(tenant_id_str, "tenant ID")
+
+    include_archived = request.args.get("include_archived", "false").lower() == "true"
+
+    # 先用聚合查询得到列表版本，客户端缓存仍有效时直接返回 304
+    count, last_updated = app_service.get_tenant_apps_stamp(tenant_id, account.id, include_archived)
+    etag = f"{tenant_id}-{int(include_archived)}-{count}-{last_updated.isoformat() if last_updated else ''}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
+    # 获取应用列表（权限已在取版本戳时检查）
+    apps = app_service.get_tenant_apps(
+        tenant_id, account.id, include_archived, summary_only=True, check_access=False
+    )
+
+    # 构建响应
+    response = json_response([app.to_view_dict(summary=True) for app in apps])
+    response.set_etag(etag, weak=True)
+    return response
 
 
 @app_bp.route("/<app_id>", methods=["GET"])
 @jwt_required
-def get_app(app_id):
+@uuid_path("app_id")
+def get_app(app_id: UUID):
     """
     获取应用详情
 
@@ -253,54 +315,37 @@ def get_app(app_id):
             "updated_at": "2024-01-01T00:00:00"
         }
 
+        未变化 (304): If-None-Match 与响应 ETag 匹配，无响应体
+
         失败:
         - 400: UUID 格式错误
         - 403: 无权限
         - 404: 应用不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        account = g.current_account
-        app_service = get_app_service()
-
-        # 获取应用详情
-        app = app_service.get_app_detail(app_uuid, account.id)
-
-        return (
-            jsonify(
-                {
-                    "id": str(app.id),
-                    "name": app.name,
-                    "mode": app.mode.value,
-                    "description": app.description,
-                    "icon": app.icon,
-                    "icon_background": app.icon_background,
-                    "status": app.status.value,
-                    "enable_site": app.enable_site,
-                    "enable_api": app.enable_api,
-                    "created_at": app.created_at.isoformat(),
-                    "updated_at": app.updated_at.isoformat(),
-                }
-            ),
-            200,
-        )
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    account = g.current_account
+    app_service = get_app_service()
+
+    # 命中缓存时只校验成员权限，跳过应用查询和序列化
+    cached = _get_cached_app(app_id)
+    if cached:
+        tenant_id, body = cached
+        if not app_service.tenant_repo.is_member(UUID(tenant_id), account.id):
+            raise AuthorizationError("Not a member of this tenant")
+        return _conditional_json(body)
+
+    # 获取应用详情
+    app = app_service.get_app_detail(app_id, account.id)
+
+    body = orjson.dumps(app.to_view_dict())
+    _set_cached_app(app, body)
+
+    return _conditional_json(body)
 
 
 @app_bp.route("/<app_id>", methods=["PUT"])
 @jwt_required
-def update_app(app_id):
+@uuid_path("app_id")
+def update_app(app_id: UUID):
     """
     更新应用信息
 
@@ -327,51 +372,21 @@ def update_app(app_id):
         - 403: 无权限
         - 404: 应用不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        data = request.get_json()
-        account = g.current_account
-        app_service = get_app_service()
-
-        # 调用服务层更新
-        app = app_service.update_app(app_id=app_uuid, account_id=account.id, **data)
-
-        return (
-            jsonify(
-                {
-                    "id": str(app.id),
-                    "name": app.name,
-                    "mode": app.mode.value,
-                    "description": app.description,
-                    "icon": app.icon,
-                    "icon_background": app.icon_background,
-                    "status": app.status.value,
-                    "enable_site": app.enable_site,
-                    "enable_api": app.enable_api,
-                    "updated_at": app.updated_at.isoformat(),
-                }
-            ),
-            200,
-        )
-
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    req = UpdateAppRequest.model_validate(request.get_json(silent=True))
+    account = g.current_account
+    app_service = get_app_service()
+
+    # 调用服务层更新（只传请求中出现的字段）
+    app = app_service.update_app(app_id=app_id, account_id=account.id, **req.model_dump(exclude_unset=True))
+    _invalidate_cached_app(app_id, app)
+
+    return json_response(app.to_view_dict())
 
 
 @app_bp.route("/<app_id>", methods=["DELETE"])
 @jwt_required
-def delete_app(app_id):
+@uuid_path("app_id")
+def delete_app(app_id: UUID):
     """
     删除应用
 
@@ -381,36 +396,24 @@ def delete_app(app_id):
         成功 (204): 无内容
 
         失败:
-        - 400: UUID格式错误
+        - 400: UUID 格式错误
         - 403: 无权限
         - 404: 应用不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
+    account = g.current_account
+    app_service = get_app_service()
 
-        account = g.current_account
-        app_service = get_app_service()
+    # 调用服务层删除
+    app_service.delete_app(app_id=app_id, account_id=account.id)
+    _invalidate_cached_app(app_id)
 
-        # 调用服务层删除
-        app_service.delete_app(app_id=app_uuid, account_id=account.id)
-
-        return "", 204
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    return "", 204
 
 
 @app_bp.route("/<app_id>/archive", methods=["POST"])
 @jwt_required
-def archive_app(app_id):
+@uuid_path("app_id")
+def archive_app(app_id: UUID):
     """
     归档应用
 
@@ -425,47 +428,24 @@ def archive_app(app_id):
         }
 
         失败:
-        - 400: UUID格式错误
+        - 400: UUID 格式错误
         - 403: 无权限
         - 404: 应用不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        account = g.current_account
-        app_service = get_app_service()
-
-        # 调用服务层归档
-        app = app_service.archive_app(app_id=app_uuid, account_id=account.id)
-
-        return (
-            jsonify(
-                {
-                    "id": str(app.id),
-                    "name": app.name,
-                    "status": app.status.value,
-                }
-            ),
-            200,
-        )
-
-    except BusinessLogicError as e:
-        return jsonify({"error": str(e), "code": "BUSINESS_LOGIC_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    account = g.current_account
+    app_service = get_app_service()
+
+    # 调用服务层归档
+    app = app_service.archive_app(app_id=app_id, account_id=account.id)
+    _invalidate_cached_app(app_id, app)
+
+    return json_response({"id": app.id, "name": app.name, "status": app.status})
 
 
 @app_bp.route("/<app_id>/unarchive", methods=["POST"])
 @jwt_required
-def unarchive_app(app_id):
+@uuid_path("app_id")
+def unarchive_app(app_id: UUID):
     """
     取消归档应用
 
@@ -480,47 +460,24 @@ def unarchive_app(app_id):
         }
 
         失败:
-        - 400: UUID格式错误
+        - 400: UUID 格式错误
         - 403: 无权限
         - 404: 应用不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        account = g.current_account
-        app_service = get_app_service()
-
-        # 调用服务层取消归档
-        app = app_service.unarchive_app(app_id=app_uuid, account_id=account.id)
-
-        return (
-            jsonify(
-                {
-                    "id": str(app.id),
-                    "name": app.name,
-                    "status": app.status.value,
-                }
-            ),
-            200,
-        )
-
-    except BusinessLogicError as e:
-        return jsonify({"error": str(e), "code": "BUSINESS_LOGIC_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    account = g.current_account
+    app_service = get_app_service()
+
+    # 调用服务层取消归档
+    app = app_service.unarchive_app(app_id=app_id, account_id=account.id)
+    _invalidate_cached_app(app_id, app)
+
+    return json_response({"id": app.id, "name": app.name, "status": app.status})
 
 
 @app_bp.route("/<app_id>/site/enable", methods=["POST"])
 @jwt_required
-def enable_site(app_id):
+@uuid_path("app_id")
+def enable_site(app_id: UUID):
     """
     启用站点访问
 
@@ -533,32 +490,20 @@ def enable_site(app_id):
             "enable_site": true
         }
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
+    account = g.current_account
+    app_service = get_app_service()
 
-        account = g.current_account
-        app_service = get_app_service()
+    # 调用服务层
+    app = app_service.toggle_site(app_id=app_id, account_id=account.id, enable=True)
+    _invalidate_cached_app(app_id, app)
 
-        # 调用服务层
-        app = app_service.toggle_site(app_id=app_uuid, account_id=account.id, enable=True)
-
-        return jsonify({"id": str(app.id), "enable_site": app.enable_site}), 200
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    return json_response({"id": app.id, "enable_site": app.enable_site})
 
 
 @app_bp.route("/<app_id>/site/disable", methods=["POST"])
 @jwt_required
-def disable_site(app_id):
+@uuid_path("app_id")
+def disable_site(app_id: UUID):
     """
     禁用站点访问
 
@@ -571,32 +516,20 @@ def disable_site(app_id):
             "enable_site": false
         }
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
+    account = g.current_account
+    app_service = get_app_service()
 
-        account = g.current_account
-        app_service = get_app_service()
+    # 调用服务层
+    app = app_service.toggle_site(app_id=app_id, account_id=account.id, enable=False)
+    _invalidate_cached_app(app_id, app)
 
-        # 调用服务层
-        app = app_service.toggle_site(app_id=app_uuid, account_id=account.id, enable=False)
-
-        return jsonify({"id": str(app.id), "enable_site": app.enable_site}), 200
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    return json_response({"id": app.id, "enable_site": app.enable_site})
 
 
 @app_bp.route("/<app_id>/api/enable", methods=["POST"])
 @jwt_required
-def enable_api(app_id):
+@uuid_path("app_id")
+def enable_api(app_id: UUID):
     """
     启用 API 访问
 
@@ -609,32 +542,20 @@ def enable_api(app_id):
             "enable_api": true
         }
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
+    account = g.current_account
+    app_service = get_app_service()
 
-        account = g.current_account
-        app_service = get_app_service()
+    # 调用服务层
+    app = app_service.toggle_api(app_id=app_id, account_id=account.id, enable=True)
+    _invalidate_cached_app(app_id, app)
 
-        # 调用服务层
-        app = app_service.toggle_api(app_id=app_uuid, account_id=account.id, enable=True)
-
-        return jsonify({"id": str(app.id), "enable_api": app.enable_api}), 200
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    return json_response({"id": app.id, "enable_api": app.enable_api})
 
 
 @app_bp.route("/<app_id>/api/disable", methods=["POST"])
 @jwt_required
-def disable_api(app_id):
+@uuid_path("app_id")
+def disable_api(app_id: UUID):
     """
     禁用 API 访问
 
@@ -647,24 +568,11 @@ def disable_api(app_id):
             "enable_api": false
         }
     """
-    try:
-        # 解析 UUID
-        try:
-            app_uuid = parse_uuid(app_id, "app ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        account = g.current_account
-        app_service = get_app_service()
-
-        # 调用服务层
-        app = app_service.toggle_api(app_id=app_uuid, account_id=account.id, enable=False)
-
-        return jsonify({"id": str(app.id), "enable_api": app.enable_api}), 200
-
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
-    except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+    account = g.current_account
+    app_service = get_app_service()
+
+    # 调用服务层
+    app = app_service.toggle_api(app_id=app_id, account_id=account.id, enable=False)
+    _invalidate_cached_app(app_id, app)
+
+    return json_response({"id": app.id, "enable_api": app.enable_api})
@@ -0,0 +1,43 @@
+"""
+应用请求模型
+
+基于 pydantic 定义请求体结构，解析与校验在 pydantic-core 中完成
+"""
+
+from typing import Annotated, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from controllers.console.schemas import CaseInsensitive
+from models.app import AppMode
+
+
+class CreateAppRequest(BaseModel):
+    """创建应用请求体"""
+
+    tenant_id: UUID
+    name: str
+    mode: Annotated[AppMode, CaseInsensitive] = AppMode.CHAT
+    description: Optional[str] = None
+    icon: Optional[str] = None
+    icon_background: Optional[str] = None
+
+
+class UpdateAppRequest(BaseModel):
+    """更新应用请求体（只更新请求中出现的字段，不允许其他字段）"""
+
+    model_config = ConfigDict(extra="forbid")
+
+    name: Optional[str] = None
+    description: Optional[str] = None
+    icon: Optional[str] = None
+    icon_background: Optional[str] = None
+
+    @field_validator("name", "icon", "icon_background")
+    @classmethod
+    def _not_null(cls, value: Optional[str]) -> str:
+        """非空列不接受显式的 null"""
+        if value is None:
+            raise ValueError("must not be null")
+        return value
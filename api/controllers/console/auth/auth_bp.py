@@ -3,62 +3,193 @@
 
 处理用户注册、登录、登出等认证相关的 HTTP 请求
 """
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, Response, current_app, request, g
 from functools import wraps
 from typing import Optional
+from uuid import UUID
+import hashlib
+import time
 import jwt
+import orjson
+import redis
 
-from services import AuthService, ValidationError, AuthenticationError, ResourceConflictError
+from core.auth.account_cache import (
+    drop_cached_token,
+    get_cached_account,
+    get_cached_token,
+    invalidate_accounts,
+    set_cached_account,
+    set_cached_token,
+    snapshot_account,
+)
+from extensions.ext_redis import redis_client
+from libs.response import error_response, json_response, raw_json_response
+from services import AuthService, AuthenticationError
 from configs.app_config import Config
 
 
 # 创建认证蓝图
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/console/auth')
 
-# 初始化服务（延迟初始化，在请求时获取配置）
-def get_auth_service():
-    """获取认证服务实例"""
-    from flask import current_app
-    return AuthService(
-        secret_key=current_app.config.get('SECRET_KEY', 'change-me-in-production'),
-        token_expiry_hours=current_app.config.get('JWT_TOKEN_EXPIRY_HOURS', 24)
+
+@auth_bp.record_once
+def _init_auth_service(state) -> None:
+    """注册蓝图时按应用配置创建认证服务，整个应用生命周期内复用"""
+    state.app.extensions['auth_service'] = AuthService(
+        secret_key=state.app.config.get('SECRET_KEY', 'change-me-in-production'),
+        token_expiry_hours=state.app.config.get('JWT_TOKEN_EXPIRY_HOURS', 24),
+        password_hash_concurrency=state.app.config.get('PASSWORD_HASH_CONCURRENCY', 4)
     )
 
 
+@auth_bp.before_request
+def _limit_body_size() -> None:
+    """认证接口请求体很小，使用更严格的上限，在解析 JSON 前拒绝超大请求体"""
+    request.max_content_length = current_app.config.get('AUTH_MAX_CONTENT_LENGTH', 4096)
+
+
+def get_auth_service() -> AuthService:
+    """获取当前应用的认证服务实例"""
+    return current_app.extensions['auth_service']
+
+
+# 已吊销令牌（Redis）：sha256(token) 十六进制 -> 1，存活到令牌过期为止
+# 只在进程内令牌缓存未命中时检查，其他进程最多在 AUTH_JWT_CACHE_TTL 秒后感知吊销
+_REVOKED_TOKEN_KEY = 'auth:revoked:{}'
+
+
+def _is_token_revoked(token: str) -> bool:
+    """
+    检查令牌是否已吊销
+
+    Redis 未初始化或不可用时视为未吊销
+
+    参数:
+        token: JWT 令牌
+
+    返回:
+        是否已吊销
+    """
+    try:
+        return bool(redis_client.get(_REVOKED_TOKEN_KEY.format(hashlib.sha256(token.encode()).hexdigest())))
+    except (RuntimeError, redis.RedisError):
+        return False
+
+
+def _revoke_token(token: str, token_exp: Optional[int]) -> None:
+    """
+    吊销令牌：移出当前进程的令牌缓存，并在 Redis 中记录到令牌过期为止
+
+    参数:
+        token: JWT 令牌
+        token_exp: 令牌过期时间戳
+    """
+    drop_cached_token(token)
+
+    ttl = int(token_exp - time.time()) if token_exp else Config.JWT_ACCESS_TOKEN_EXPIRES
+    if ttl <= 0:
+        return
+    try:
+        redis_client.set(_REVOKED_TOKEN_KEY.format(hashlib.sha256(token.encode()).hexdigest()), 1, ex=ttl)
+    except (RuntimeError, redis.RedisError):
+        pass
+
+
+# 固定错误响应表：名称 -> (消息, 错误代码, HTTP 状态码)，响应体在导入时序列化一次
+_ERRORS = {
+    name: (orjson.dumps({'error': message, 'code': code}), status)
+    for name, (message, code, status) in {
+        'missing_auth_header': ('Missing or invalid authorization header', 'UNAUTHORIZED', 401),
+        'internal_error': ('Internal server error', 'INTERNAL_ERROR', 500),
+        'body_required': ('Request body is required', 'INVALID_REQUEST', 400),
+        'register_fields_required': ('Email, password, and name are required', 'MISSING_FIELDS', 400),
+        'login_fields_required': ('Email and password are required', 'MISSING_FIELDS', 400),
+        'change_password_fields_required': ('Old password and new password are required', 'MISSING_FIELDS', 400),
+        'reset_password_fields_required': ('Email and new password are required', 'MISSING_FIELDS', 400),
+    }.items()
+}
+
+# 健康检查与登出的固定响应体
+_PING_BODY = orjson.dumps({'status': 'ok'})
+_LOGOUT_BODY = orjson.dumps({'message': 'Logged out successfully'})
+
+
+def _error(name: str) -> Response:
+    """
+    返回固定错误响应
+
+    参数:
+        name: 错误名称（_ERRORS 中的键）
+
+    返回:
+        Flask Response
+    """
+    body, status = _ERRORS[name]
+    return raw_json_response(body, status)
+
+
 def jwt_required(f):
     """JWT 认证装饰器"""
     @wraps(f)
     def decorated(*args, **kwargs):
+        # CORS 预检请求不携带 Authorization，直接返回默认 OPTIONS 响应，不进入认证流程
+        if request.method == 'OPTIONS':
+            return current_app.make_default_options_response()
+
         # 从请求头获取 token
         auth_header = request.headers.get('Authorization', '')
         
+        # 'Bearer ' 前缀不是密钥，直接 startswith 即可；令牌本身只交给 JWT 校验，不做 == 比较
         if not auth_header.startswith('Bearer '):
-            return jsonify({
-                'error': 'Missing or invalid authorization header',
-                'code': 'UNAUTHORIZED'
-            }), 401
+            return _error('missing_auth_header')
         
         token = auth_header[7:]  # 移除 'Bearer ' 前缀
         
         try:
-            # 验证 token
-            account = get_auth_service().verify_token(token)
-            g.current_account = account  # 将账户信息存入 Flask g 对象
-            return f(*args, **kwargs)
+            account = get_cached_token(token)
+            if account is None:
+                # 验证 token 签名与过期时间（不访问数据库）
+                auth_service = get_auth_service()
+                payload = auth_service.decode_token(token)
+                if _is_token_revoked(token):
+                    raise AuthenticationError("Token has been revoked")
+
+                # 优先使用账户快照缓存，未命中时查询数据库
+                account = get_cached_account(payload['account_id'])
+                if account is None:
+                    account = snapshot_account(auth_service.get_active_account(UUID(payload['account_id'])))
+                    set_cached_account(account, payload.get('exp'))
+                set_cached_token(token, account, payload.get('exp'))
         except AuthenticationError as e:
-            return jsonify({
-                'error': str(e),
-                'code': 'UNAUTHORIZED'
-            }), 401
-        except Exception as e:
-            return jsonify({
-                'error': 'Internal server error',
-                'code': 'INTERNAL_ERROR'
-            }), 500
+            return error_response(str(e), 'UNAUTHORIZED', 401)
+        except Exception:
+            return _error('internal_error')
+        
+        # 将账户信息存入 Flask g 对象
+        # 视图函数抛出的异常不在此处捕获，交由全局错误处理器处理
+        g.current_account = account
+        return f(*args, **kwargs)
     
     return decorated
 
 
+
+@auth_bp.route('/ping', methods=['GET'])
+def ping():
+    """
+    健康检查
+
+    不需要认证，不访问数据库，供负载均衡探活使用
+
+    响应:
+        成功 (200):
+        {
+            "status": "ok"
+        }
+    """
+    return raw_json_response(_PING_BODY, 200)
+
+
 @auth_bp.route('/register', methods=['POST'])
 def register():
     """
@@ -86,51 +217,28 @@ def register():
             "code": "ERROR_CODE"
         }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'error': 'Request body is required',
-                'code': 'INVALID_REQUEST'
-            }), 400
-        
-        email = data.get('email')
-        password = data.get('password')
-        name = data.get('name')
-        
-        # 验证必需字段
-        if not all([email, password, name]):
-            return jsonify({
-                'error': 'Email, password, and name are required',
-                'code': 'MISSING_FIELDS'
-            }), 400
-        
-        # 调用服务层注册
-        account = get_auth_service().register(email, password, name)
-        
-        return jsonify({
-            'id': str(account.id),
-            'email': account.email,
-            'name': account.name,
-            'status': account.status.value
-        }), 201
-        
-    except ValidationError as e:
-        return jsonify({
-            'error': str(e),
-            'code': 'VALIDATION_ERROR'
-        }), 400
-    except ResourceConflictError as e:
-        return jsonify({
-            'error': str(e),
-            'code': 'RESOURCE_CONFLICT'
-        }), 409
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return _error('body_required')
+    
+    email = data.get('email')
+    password = data.get('password')
+    name = data.get('name')
+    
+    # 验证必需字段
+    if not email or not password or not name:
+        return _error('register_fields_required')
+    
+    # 调用服务层注册
+    account = get_auth_service().register(email, password, name)
+    
+    return json_response({
+        'id': account.id,
+        'email': account.email,
+        'name': account.name,
+        'status': account.status
+    }, 201)
 
 
 @auth_bp.route('/login', methods=['POST'])
@@ -162,48 +270,32 @@ def login():
             "code": "AUTHENTICATION_ERROR"
         }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'error': 'Request body is required',
-                'code': 'INVALID_REQUEST'
-            }), 400
-        
-        email = data.get('email')
-        password = data.get('password')
-        
-        if not all([email, password]):
-            return jsonify({
-                'error': 'Email and password are required',
-                'code': 'MISSING_FIELDS'
-            }), 400
-        
-        # 调用服务层登录
-        account, token = get_auth_service().login(email, password)
-        
-        return jsonify({
-            'account': {
-                'id': str(account.id),
-                'email': account.email,
-                'name': account.name,
-                'status': account.status.value,
-                'avatar': account.avatar
-            },
-            'token': token
-        }), 200
-        
-    except AuthenticationError as e:
-        return jsonify({
-            'error': str(e),
-            'code': 'AUTHENTICATION_ERROR'
-        }), 401
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return _error('body_required')
+    
+    email = data.get('email')
+    password = data.get('password')
+    
+    if not email or not password:
+        return _error('login_fields_required')
+    
+    # 调用服务层登录
+    account, token = get_auth_service().login(email, password)
+    # 登录会更新最后登录时间，清除旧的账户快照
+    invalidate_accounts([account.id])
+    
+    return json_response({
+        'account': {
+            'id': account.id,
+            'email': account.email,
+            'name': account.name,
+            'status': account.status,
+            'avatar': account.avatar
+        },
+        'token': token
+    }, 200)
 
 
 @auth_bp.route('/me', methods=['GET'])
@@ -225,36 +317,29 @@ def get_current_user():
             "created_at": "2024-01-01T00:00:00"
         }
     """
-    try:
-        account = g.current_account
-        
-        return jsonify({
-            'id': str(account.id),
-            'email': account.email,
-            'name': account.name,
-            'status': account.status.value,
-            'avatar': account.avatar,
-            'created_at': account.created_at.isoformat() if account.created_at else None,
-            'last_login_at': account.last_login_at.isoformat() if account.last_login_at else None
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    account = g.current_account
+    
+    return json_response({
+        'id': account.id,
+        'email': account.email,
+        'name': account.name,
+        'status': account.status,
+        'avatar': account.avatar,
+        'created_at': account.created_at,
+        'last_login_at': account.last_login_at
+    }, 200)
 
 
 @auth_bp.route('/logout', methods=['POST'])
-@jwt_required
 def logout():
     """
     用户登出
     
-    需要 JWT 认证
-    
-    注意: JWT 是无状态的，服务端不存储 token，所以这个接口主要用于客户端清除 token
-    实际的 token 失效由过期时间控制
+    只要求携带 Bearer token，不走 jwt_required（只验签，不查询数据库）
+
+    token 有效时将其记入 Redis 吊销列表（保留到 token 过期），移出当前进程的令牌缓存，
+    并清除该账户的认证缓存；任何失败都忽略（Redis 不可用时 token 在过期前仍然有效）。
+    其他进程的令牌缓存不会立即清除，最多在 AUTH_JWT_CACHE_TTL 秒后拒绝该 token
     
     响应:
         成功 (200):
@@ -262,9 +347,19 @@ def logout():
             "message": "Logged out successfully"
         }
     """
-    return jsonify({
-        'message': 'Logged out successfully'
-    }), 200
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return _error('missing_auth_header')
+
+    try:
+        token = auth_header[7:]
+        payload = get_auth_service().decode_token(token)
+        _revoke_token(token, payload.get('exp'))
+        invalidate_accounts([UUID(payload['account_id'])])
+    except Exception:
+        pass
+
+    return raw_json_response(_LOGOUT_BODY, 200)
 
 
 @auth_bp.route('/password/change', methods=['POST'])
@@ -293,48 +388,26 @@ def change_password():
             "code": "ERROR_CODE"
         }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'error': 'Request body is required',
-                'code': 'INVALID_REQUEST'
-            }), 400
-        
-        old_password = data.get('old_password')
-        new_password = data.get('new_password')
-        
-        if not all([old_password, new_password]):
-            return jsonify({
-                'error': 'Old password and new password are required',
-                'code': 'MISSING_FIELDS'
-            }), 400
-        
-        account = g.current_account
-        
-        # 调用服务层修改密码
-        get_auth_service().change_password(account.id, old_password, new_password)
-        
-        return jsonify({
-            'message': 'Password changed successfully'
-        }), 200
-        
-    except ValidationError as e:
-        return jsonify({
-            'error': str(e),
-            'code': 'VALIDATION_ERROR'
-        }), 400
-    except AuthenticationError as e:
-        return jsonify({
-            'error': str(e),
-            'code': 'AUTHENTICATION_ERROR'
-        }), 401
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return _error('body_required')
+    
+    old_password = data.get('old_password')
+    new_password = data.get('new_password')
+    
+    if not old_password or not new_password:
+        return _error('change_password_fields_required')
+    
+    account = g.current_account
+    
+    # 调用服务层修改密码
+    get_auth_service().change_password(account.id, old_password, new_password)
+    invalidate_accounts([account.id])
+    
+    return json_response({
+        'message': 'Password changed successfully'
+    }, 200)
 
 
 @auth_bp.route('/password/reset', methods=['POST'])
@@ -364,41 +437,24 @@ def reset_password():
             "code": "ERROR_CODE"
         }
     """
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                'error': 'Request body is required',
-                'code': 'INVALID_REQUEST'
-            }), 400
-        
-        email = data.get('email')
-        new_password = data.get('new_password')
-        # verification_code = data.get('verification_code')  # 实际应验证
-        
-        if not all([email, new_password]):
-            return jsonify({
-                'error': 'Email and new password are required',
-                'code': 'MISSING_FIELDS'
-            }), 400
-        
-        # TODO: 实际场景中应该验证 verification_code
-        
-        # 调用服务层重置密码
-        get_auth_service().reset_password(email, new_password)
-        
-        return jsonify({
-            'message': 'Password reset successfully'
-        }), 200
-        
-    except ValidationError as e:
-        return jsonify({
-            'error': str(e),
-            'code': 'VALIDATION_ERROR'
-        }), 400
-    except Exception as e:
-        return jsonify({
-            'error': 'Internal server error',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    data = request.get_json(silent=True)
+    
+    if not data:
+        return _error('body_required')
+    
+    email = data.get('email')
+    new_password = data.get('new_password')
+    # verification_code = data.get('verification_code')  # 实际应验证
+    
+    if not email or not new_password:
+        return _error('reset_password_fields_required')
+    
+    # TODO: 实际场景中应该验证 verification_code，比较时必须使用 AuthService._secrets_equal（恒定时间）
+    
+    # 调用服务层重置密码
+    account = get_auth_service().reset_password(email, new_password)
+    invalidate_accounts([account.id])
+    
+    return json_response({
+        'message': 'Password reset successfully'
+    }, 200)
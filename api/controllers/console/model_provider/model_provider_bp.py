@@ -4,113 +4,216 @@
 提供模型提供商配置管理的 HTTP 接口
 """
 
+import logging
 import uuid
+from functools import lru_cache, wraps
+from typing import Callable, Iterable
 
-from flask import Blueprint, g, jsonify, request
+import orjson
+from flask import Blueprint, Response, g, request
 
 from controllers.console.auth.auth_bp import jwt_required
-from models import ProviderType
+from controllers.console.wraps import uuid_path
+from libs.response import json_response, raw_json_response
+from models import ModelProvider, ProviderType
 from services import ModelProviderService
 from services.exceptions import (
     BusinessLogicError,
     ResourceConflictError,
     ResourceNotFoundError,
+    ServiceError,
     ValidationError,
 )
 
+logger = logging.getLogger(__name__)
+
 # 创建蓝图
 model_provider_bp = Blueprint("model_provider", __name__, url_prefix="/api/console/tenants/<tenant_id>/model-providers")
 
 # 创建服务实例
 model_provider_service = ModelProviderService()
 
+# 固定错误响应表：名称 -> (响应体, HTTP 状态码)，响应体在导入时序列化一次
+_ERRORS = {
+    name: (orjson.dumps({"error": message}), status)
+    for name, (message, status) in {
+        "body_required": ("Request body is required", 400),
+        "name_required": ("Provider name is required", 400),
+        "type_required": ("Provider type is required", 400),
+        "credentials_required": ("Credentials are required", 400),
+        "delete_failed": ("Failed to delete provider", 500),
+        "internal_error": ("Internal server error", 500),
+    }.items()
+}
+
+# 必填字段 -> 缺失时的错误名称
+_REQUIRED_FIELD_ERRORS = {
+    "name": "name_required",
+    "provider_type": "type_required",
+    "credentials": "credentials_required",
+}
+
+# 服务层异常 -> HTTP 状态码
+_SERVICE_ERROR_STATUS = (
+    (ValidationError, 400),
+    (ResourceNotFoundError, 404),
+    (ResourceConflictError, 409),
+    # 与全局 BusinessLogicError 处理器保持一致
+    (BusinessLogicError, 422),
+)
+
+# 提供商类型名称 -> 枚举，导入时构建一次，避免请求路径上的枚举查找与 KeyError 异常
+_PROVIDER_TYPES = {t.name: t for t in ProviderType}
+
+
+def _error(name: str) -> Response:
+    """
+    返回固定错误响应
+
+    Args:
+        name: 错误名称（_ERRORS 中的键）
+
+    Returns:
+        Response: Flask 响应
+    """
+    body, status = _ERRORS[name]
+    return raw_json_response(body, status)
+
+
+def _serialize_provider_summary(provider: ModelProvider) -> dict:
+    """
+    将提供商配置转换为列表项响应字典
+
+    UUID/datetime/枚举保持原始对象，由 orjson 直接编码
+
+    Args:
+        provider: 提供商配置实例
+
+    Returns:
+        dict: 提供商摘要字典
+    """
+    return {
+        "id": provider.id,
+        "tenant_id": provider.tenant_id,
+        "name": provider.name,
+        "provider_type": provider.provider_type,
+        "is_active": provider.is_active,
+        "config": provider.config,
+        "quota_config": provider.quota_config,
+        "created_at": provider.created_at,
+        "updated_at": provider.updated_at,
+    }
+
+
+@lru_cache(maxsize=None)
+def _status_for(exc_type: type) -> int:
+    """
+    查找服务层异常类型对应的 HTTP 状态码（按异常类型缓存）
+
+    Args:
+        exc_type: 异常类型
+
+    Returns:
+        int: HTTP 状态码
+    """
+    for error_type, status in _SERVICE_ERROR_STATUS:
+        if issubclass(exc_type, error_type):
+            return status
+    return 500
+
+
+def _service_errors(f: Callable) -> Callable:
+    """
+    将服务层异常映射为 HTTP 错误响应的装饰器
+
+    Args:
+        f: 视图函数
+
+    Returns:
+        Callable: 包装后的视图函数
+    """
+
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except ServiceError as e:
+            return json_response({"error": e.message}, _status_for(type(e)))
+        except Exception:
+            # 异常详情（SQL、驱动信息等）只写日志，不返回给客户端
+            logger.exception("Unhandled error in %s", f.__name__)
+            return _error("internal_error")
+
+    return decorated
+
+
+def _json_body(required: Iterable[str] = ()) -> Callable:
+    """
+    解析 JSON 请求体并校验必填字段的装饰器，解析结果通过 data 参数传入视图
+
+    Args:
+        required: 必填字段（需在 _REQUIRED_FIELD_ERRORS 中登记）
+
+    Returns:
+        Callable: 装饰器
+    """
+    required = tuple(required)
+
+    def decorator(f: Callable) -> Callable:
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            data = request.get_json(silent=True)
+            if not data:
+                return _error("body_required")
+            for field in required:
+                if not data.get(field):
+                    return _error(_REQUIRED_FIELD_ERRORS[field])
+            return f(*args, data=data, **kwargs)
+
+        return decorated
+
+    return decorator
+
 
 @model_provider_bp.route("", methods=["POST"])
 @jwt_required
-def add_provider(tenant_id: str):
+@uuid_path("tenant_id")
+@_service_errors
+@_json_body(required=("name", "provider_type", "credentials"))
+def add_provider(tenant_id: uuid.UUID, data: dict):
     """
     添加模型提供商配置
 
     POST /api/console/tenants/:tenant_id/model-providers
     """
-    account = g.account
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-    except ValueError:
-        return jsonify({"error": "Invalid tenant ID format"}), 400
-
-    # 获取请求数据
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Request body is required"}), 400
-
-    # 验证必填字段
-    name = data.get("name")
-    if not name:
-        return jsonify({"error": "Provider name is required"}), 400
-
-    provider_type_str = data.get("provider_type")
-    if not provider_type_str:
-        return jsonify({"error": "Provider type is required"}), 400
-
     # 转换提供商类型
-    try:
-        provider_type = ProviderType[provider_type_str.upper()]
-    except KeyError:
-        return jsonify({"error": f"Invalid provider type: {provider_type_str}"}), 400
-
-    credentials = data.get("credentials")
-    if not credentials:
-        return jsonify({"error": "Credentials are required"}), 400
-
-    config = data.get("config")
-    quota_config = data.get("quota_config")
-
-    try:
-        # 调用服务层添加提供商
-        provider = model_provider_service.add_provider(
-            tenant_id=tenant_uuid,
-            name=name,
-            provider_type=provider_type,
-            credentials=credentials,
-            config=config,
-            quota_config=quota_config,
-            created_by=account.id,
-        )
-
-        # 返回结果（不包含敏感凭证）
-        return (
-            jsonify(
-                {
-                    "id": str(provider.id),
-                    "tenant_id": str(provider.tenant_id),
-                    "name": provider.name,
-                    "provider_type": provider.provider_type.value,
-                    "is_active": provider.is_active,
-                    "config": provider.config,
-                    "quota_config": provider.quota_config,
-                    "created_at": provider.created_at.isoformat(),
-                    "created_by": str(provider.created_by) if provider.created_by else None,
-                }
-            ),
-            201,
-        )
-
-    except ValidationError as e:
-        return jsonify({"error": e.message}), 400
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except ResourceConflictError as e:
-        return jsonify({"error": e.message}), 409
-    except BusinessLogicError as e:
-        return jsonify({"error": e.message}), 400
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    provider_type_str = data["provider_type"]
+    if not isinstance(provider_type_str, str):
+        return _error("type_required")
+    provider_type = _PROVIDER_TYPES.get(provider_type_str.upper())
+    if provider_type is None:
+        return json_response({"error": f"Invalid provider type: {provider_type_str}"}, 400)
+
+    # 调用服务层添加提供商
+    provider = model_provider_service.add_provider(
+        tenant_id=tenant_id,
+        name=data["name"],
+        provider_type=provider_type,
+        credentials=data["credentials"],
+        config=data.get("config"),
+        quota_config=data.get("quota_config"),
+        created_by=g.current_account.id,
+    )
+
+    # 返回结果（不包含敏感凭证）
+    return json_response(provider.to_view_dict(full=True), 201)
 
 
 @model_provider_bp.route("", methods=["GET"])
 @jwt_required
-def list_providers(tenant_id: str):
+@uuid_path("tenant_id")
+@_service_errors
+def list_providers(tenant_id: uuid.UUID):
     """
     获取模型提供商配置列表
 
@@ -119,58 +222,29 @@ def list_providers(tenant_id: str):
         - include_inactive: bool (是否包含停用的配置)
         - provider_type: str (过滤提供商类型)
     """
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-    except ValueError:
-        return jsonify({"error": "Invalid tenant ID format"}), 400
-
     # 获取查询参数
     include_inactive = request.args.get("include_inactive", "false").lower() == "true"
     provider_type_str = request.args.get("provider_type")
 
     provider_type = None
     if provider_type_str:
-        try:
-            provider_type = ProviderType[provider_type_str.upper()]
-        except KeyError:
-            return jsonify({"error": f"Invalid provider type: {provider_type_str}"}), 400
-
-    try:
-        # 调用服务层获取列表
-        providers = model_provider_service.list_providers(
-            tenant_id=tenant_uuid, include_inactive=include_inactive, provider_type=provider_type
-        )
-
-        # 返回结果
-        return jsonify(
-            {
-                "data": [
-                    {
-                        "id": str(p.id),
-                        "tenant_id": str(p.tenant_id),
-                        "name": p.name,
-                        "provider_type": p.provider_type.value,
-                        "is_active": p.is_active,
-                        "config": p.config,
-                        "quota_config": p.quota_config,
-                        "created_at": p.created_at.isoformat(),
-                        "updated_at": p.updated_at.isoformat() if p.updated_at else None,
-                    }
-                    for p in providers
-                ],
-                "total": len(providers),
-            }
-        )
-
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+        provider_type = _PROVIDER_TYPES.get(provider_type_str.upper())
+        if provider_type is None:
+            return json_response({"error": f"Invalid provider type: {provider_type_str}"}, 400)
+
+    # 调用服务层获取列表
+    providers = model_provider_service.list_providers(
+        tenant_id=tenant_id, include_inactive=include_inactive, provider_type=provider_type, summary_only=True
+    )
+
+    return json_response({"data": [_serialize_provider_summary(p) for p in providers], "total": len(providers)})
 
 
 @model_provider_bp.route("/<provider_id>", methods=["GET"])
 @jwt_required
-def get_provider(tenant_id: str, provider_id: str):
+@uuid_path("tenant_id", "provider_id")
+@_service_errors
+def get_provider(tenant_id: uuid.UUID, provider_id: uuid.UUID):
     """
     获取模型提供商配置详情
 
@@ -178,214 +252,94 @@ def get_provider(tenant_id: str, provider_id: str):
     Query params:
         - include_credentials: bool (是否包含凭证信息)
     """
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-        provider_uuid = uuid.UUID(provider_id)
-    except ValueError:
-        return jsonify({"error": "Invalid ID format"}), 400
-
     include_credentials = request.args.get("include_credentials", "false").lower() == "true"
 
-    try:
-        # 调用服务层获取配置
-        provider = model_provider_service.get_provider(tenant_uuid, provider_uuid)
-
-        # 构建响应数据
-        response_data = provider.to_dict(include_credentials=include_credentials)
+    provider = model_provider_service.get_provider(tenant_id, provider_id)
 
-        return jsonify(response_data)
+    # 构建响应数据
+    response_data = provider.to_view_dict(full=True)
+    if include_credentials:
+        # 注意：这里返回的是加密后的凭证，需要在使用前解密
+        response_data["encrypted_credentials"] = provider.encrypted_credentials
 
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    return json_response(response_data)
 
 
 @model_provider_bp.route("/<provider_id>", methods=["PUT"])
 @jwt_required
-def update_provider(tenant_id: str, provider_id: str):
+@uuid_path("tenant_id", "provider_id")
+@_service_errors
+@_json_body()
+def update_provider(tenant_id: uuid.UUID, provider_id: uuid.UUID, data: dict):
     """
     更新模型提供商配置
 
     PUT /api/console/tenants/:tenant_id/model-providers/:provider_id
     """
-    account = g.account
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-        provider_uuid = uuid.UUID(provider_id)
-    except ValueError:
-        return jsonify({"error": "Invalid ID format"}), 400
-
-    # 获取请求数据
-    data = request.get_json()
-    if not data:
-        return jsonify({"error": "Request body is required"}), 400
-
-    # 提取可更新字段
-    name = data.get("name")
-    credentials = data.get("credentials")
-    config = data.get("config")
-    quota_config = data.get("quota_config")
-
-    try:
-        # 调用服务层更新配置
-        provider = model_provider_service.update_provider(
-            tenant_id=tenant_uuid,
-            provider_id=provider_uuid,
-            name=name,
-            credentials=credentials,
-            config=config,
-            quota_config=quota_config,
-            updated_by=account.id,
-        )
-
-        # 返回结果
-        return jsonify(
-            {
-                "id": str(provider.id),
-                "tenant_id": str(provider.tenant_id),
-                "name": provider.name,
-                "provider_type": provider.provider_type.value,
-                "is_active": provider.is_active,
-                "config": provider.config,
-                "quota_config": provider.quota_config,
-                "updated_at": provider.updated_at.isoformat() if provider.updated_at else None,
-                "updated_by": str(provider.updated_by) if provider.updated_by else None,
-            }
-        )
-
-    except ValidationError as e:
-        return jsonify({"error": e.message}), 400
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except ResourceConflictError as e:
-        return jsonify({"error": e.message}), 409
-    except BusinessLogicError as e:
-        return jsonify({"error": e.message}), 400
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    provider = model_provider_service.update_provider(
+        tenant_id=tenant_id,
+        provider_id=provider_id,
+        name=data.get("name"),
+        credentials=data.get("credentials"),
+        config=data.get("config"),
+        quota_config=data.get("quota_config"),
+        updated_by=g.current_account.id,
+    )
+
+    return json_response(provider.to_view_dict(full=True))
 
 
 @model_provider_bp.route("/<provider_id>", methods=["DELETE"])
 @jwt_required
-def delete_provider(tenant_id: str, provider_id: str):
+@uuid_path("tenant_id", "provider_id")
+@_service_errors
+def delete_provider(tenant_id: uuid.UUID, provider_id: uuid.UUID):
     """
     删除模型提供商配置
 
     DELETE /api/console/tenants/:tenant_id/model-providers/:provider_id
     """
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-        provider_uuid = uuid.UUID(provider_id)
-    except ValueError:
-        return jsonify({"error": "Invalid ID format"}), 400
-
-    try:
-        # 调用服务层删除配置
-        result = model_provider_service.delete_provider(tenant_uuid, provider_uuid)
-
-        if result:
-            return jsonify({"message": "Provider deleted successfully"}), 200
-        else:
-            return jsonify({"error": "Failed to delete provider"}), 500
-
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    if model_provider_service.delete_provider(tenant_id, provider_id):
+        return json_response({"message": "Provider deleted successfully"}, 200)
+    return _error("delete_failed")
 
 
 @model_provider_bp.route("/<provider_id>/test", methods=["POST"])
 @jwt_required
-def test_provider_connection(tenant_id: str, provider_id: str):
+@uuid_path("tenant_id", "provider_id")
+@_service_errors
+def test_provider_connection(tenant_id: uuid.UUID, provider_id: uuid.UUID):
     """
     测试模型提供商连接
 
     POST /api/console/tenants/:tenant_id/model-providers/:provider_id/test
     """
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-        provider_uuid = uuid.UUID(provider_id)
-    except ValueError:
-        return jsonify({"error": "Invalid ID format"}), 400
-
-    try:
-        # 调用服务层测试连接
-        result = model_provider_service.test_connection(tenant_uuid, provider_uuid)
-
-        return jsonify(result), 200
-
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    return json_response(model_provider_service.test_connection(tenant_id, provider_id), 200)
 
 
 @model_provider_bp.route("/<provider_id>/activate", methods=["POST"])
 @jwt_required
-def activate_provider(tenant_id: str, provider_id: str):
+@uuid_path("tenant_id", "provider_id")
+@_service_errors
+def activate_provider(tenant_id: uuid.UUID, provider_id: uuid.UUID):
     """
     激活模型提供商配置
 
     POST /api/console/tenants/:tenant_id/model-providers/:provider_id/activate
     """
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-        provider_uuid = uuid.UUID(provider_id)
-    except ValueError:
-        return jsonify({"error": "Invalid ID format"}), 400
-
-    try:
-        # 调用服务层激活配置
-        provider = model_provider_service.activate_provider(tenant_uuid, provider_uuid)
-
-        return jsonify(
-            {
-                "id": str(provider.id),
-                "name": provider.name,
-                "is_active": provider.is_active,
-                "updated_at": provider.updated_at.isoformat() if provider.updated_at else None,
-            }
-        )
-
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except BusinessLogicError as e:
-        return jsonify({"error": e.message}), 400
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    provider = model_provider_service.activate_provider(tenant_id, provider_id)
+    return json_response(provider.to_view_dict())
 
 
 @model_provider_bp.route("/<provider_id>/deactivate", methods=["POST"])
 @jwt_required
-def deactivate_provider(tenant_id: str, provider_id: str):
+@uuid_path("tenant_id", "provider_id")
+@_service_errors
+def deactivate_provider(tenant_id: uuid.UUID, provider_id: uuid.UUID):
     """
     停用模型提供商配置
 
     POST /api/console/tenants/:tenant_id/model-providers/:provider_id/deactivate
     """
-    try:
-        tenant_uuid = uuid.UUID(tenant_id)
-        provider_uuid = uuid.UUID(provider_id)
-    except ValueError:
-        return jsonify({"error": "Invalid ID format"}), 400
-
-    try:
-        # 调用服务层停用配置
-        provider = model_provider_service.deactivate_provider(tenant_uuid, provider_uuid)
-
-        return jsonify(
-            {
-                "id": str(provider.id),
-                "name": provider.name,
-                "is_active": provider.is_active,
-                "updated_at": provider.updated_at.isoformat() if provider.updated_at else None,
-            }
-        )
-
-    except ResourceNotFoundError as e:
-        return jsonify({"error": e.message}), 404
-    except BusinessLogicError as e:
-        return jsonify({"error": e.message}), 400
-    except Exception as e:
-        return jsonify({"error": f"Internal server error: {str(e)}"}), 500
+    provider = model_provider_service.deactivate_provider(tenant_id, provider_id)
+    return json_response(provider.to_view_dict())
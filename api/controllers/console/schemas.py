@@ -0,0 +1,20 @@
+"""
+控制台请求模型公共类型
+
+供各模块的 pydantic 请求体复用
+"""
+
+from typing import Any
+
+from pydantic import BeforeValidator
+
+
+def _lowercase(value: Any) -> Any:
+    """字符串转为小写，其他类型原样交给后续校验"""
+    if isinstance(value, str):
+        return value.lower()
+    return value
+
+
+# 枚举字段大小写不敏感（兼容 "ADMIN" 与 "admin"），用法: Annotated[TenantRole, CaseInsensitive]
+CaseInsensitive = BeforeValidator(_lowercase)
@@ -0,0 +1,33 @@
+"""
+租户请求模型
+
+基于 pydantic 定义请求体结构，解析与校验在 pydantic-core 中完成
+"""
+
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from controllers.console.schemas import CaseInsensitive
+from models.tenant import TenantPlan, TenantRole
+
+
+class CreateTenantRequest(BaseModel):
+    """创建租户请求体"""
+
+    name: str
+    plan: Annotated[TenantPlan, CaseInsensitive] = TenantPlan.FREE
+
+
+class AddMemberRequest(BaseModel):
+    """添加成员请求体"""
+
+    account_id: UUID
+    role: Annotated[TenantRole, CaseInsensitive] = TenantRole.MEMBER
+
+
+class UpdateMemberRoleRequest(BaseModel):
+    """更新成员角色请求体"""
+
+    role: Annotated[TenantRole, CaseInsensitive]
@@ -4,52 +4,109 @@
 处理租户创建、成员管理等 HTTP 请求
 """
 
-from functools import wraps
+import logging
 from typing import Optional
 from uuid import UUID
 
-from flask import Blueprint, g, jsonify, request
+import orjson
+from flask import Blueprint, Response, g, request
 
+from configs.app_config import Config
 from controllers.console.auth.auth_bp import jwt_required
-from models.tenant import TenantPlan, TenantRole
+from controllers.console.tenant.schemas import AddMemberRequest, CreateTenantRequest, UpdateMemberRoleRequest
+from controllers.console.wraps import uuid_path
+from libs.response import json_response, raw_json_response
+from libs.sieve_cache import SieveCache
+from models.tenant import TenantRole
+from repositories import TenantRepository
 from services import (
     AuthorizationError,
+    BusinessLogicError,
     ResourceConflictError,
     ResourceNotFoundError,
     TenantService,
     ValidationError,
 )
 
+logger = logging.getLogger(__name__)
+
 # 创建租户蓝图
 tenant_bp = Blueprint("tenant", __name__, url_prefix="/api/console/tenants")
 
 
-# 初始化服务（延迟初始化）
-def get_tenant_service():
-    """获取租户服务实例"""
-    return TenantService()
+# 租户仓储无状态（通过 db.session 访问数据库），模块级复用
+_TENANT_REPO = TenantRepository()
 
+# 固定错误响应表：名称 -> (消息, 错误代码, HTTP 状态码)，响应体在导入时序列化一次
+_ERRORS = {
+    name: (orjson.dumps({"error": message, "code": code}), status)
+    for name, (message, code, status) in {
+        "tenant_not_found": ("Tenant not found", "RESOURCE_NOT_FOUND", 404),
+        "not_member": ("You are not a member of this tenant", "AUTHORIZATION_ERROR", 403),
+        "internal_error": ("Internal server error", "INTERNAL_ERROR", 500),
+    }.items()
+}
 
-def parse_uuid(uuid_string: str, name: str = "ID") -> Optional[UUID]:
+def _error(name: str) -> Response:
     """
-    解析 UUID 字符串
+    返回固定错误响应
 
     参数:
-        uuid_string: UUID 字符串
-        name: 参数名称（用于错误消息）
+        name: 错误名称（_ERRORS 中的键）
 
     返回:
-        UUID 对象或 None（如果解析失败）
+        Flask Response
+    """
+    body, status = _ERRORS[name]
+    return raw_json_response(body, status)
+
 
-    抛出:
-        ValueError: 如果 UUID 格式不正确
+def _map_error(e: Exception) -> Response:
     """
-    import uuid as uuid_module
+    将服务层异常映射为错误响应
 
-    try:
-        return uuid_module.UUID(uuid_string)
-    except (ValueError, AttributeError):
-        raise ValueError(f"Invalid {name}: {uuid_string}")
+    参数:
+        e: 视图中捕获的异常
+
+    返回:
+        Flask Response
+    """
+    match e:
+        case ValidationError():
+            return json_response({"error": str(e), "code": "VALIDATION_ERROR"}, 400)
+        case AuthorizationError():
+            return json_response({"error": str(e), "code": "AUTHORIZATION_ERROR"}, 403)
+        case ResourceNotFoundError():
+            return json_response({"error": str(e), "code": "RESOURCE_NOT_FOUND"}, 404)
+        case ResourceConflictError():
+            return json_response({"error": str(e), "code": "RESOURCE_CONFLICT"}, 409)
+        case BusinessLogicError():
+            # 与全局 BusinessLogicError 处理器保持一致
+            return json_response({"error": str(e), "code": "BUSINESS_LOGIC_ERROR"}, 422)
+        case _:
+            # 异常详情（SQL、驱动信息等）只写日志，不返回给客户端
+            logger.exception("Unhandled error in tenant controller")
+            return _error("internal_error")
+
+
+# 服务实例（延迟初始化，首次使用时创建后复用）
+_tenant_service: Optional[TenantService] = None
+
+
+def get_tenant_service() -> TenantService:
+    """
+    获取租户服务实例
+
+    TenantService 无请求级状态，进程内复用同一个实例，并与视图共享租户仓储；
+    成员关系检查结果在进程内短时缓存
+    """
+    global _tenant_service
+    if _tenant_service is None:
+        _tenant_service = TenantService(
+            tenant_repo=_TENANT_REPO,
+            membership_cache=SieveCache(maxsize=Config.TENANT_MEMBER_CACHE_MAX, ttl=Config.TENANT_MEMBER_CACHE_TTL),
+        )
+    return _tenant_service
 
 
 @tenant_bp.route("", methods=["POST"])
@@ -73,57 +130,30 @@ def create_tenant():
             "name": "My Tenant",
             "plan": "free",
             "status": "active",
-            "created_at": "2024-01-01T00:00:00"
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00"
         }
 
         失败:
         - 400: 参数错误/租户名已存在
         - 401: 未认证
     """
+    # 解析并校验请求体（校验失败由全局 pydantic 错误处理器返回 400）
+    payload = CreateTenantRequest.model_validate(request.get_json(silent=True))
+
     try:
-        data = request.get_json()
         tenant_service = get_tenant_service()
 
         # 获取当前用户（由 @jwt_required 填充）
         account = g.current_account
 
-        # 处理 plan 参数 - 将字符串转换为枚举
-        plan_str = data.get("plan", "free")
-        try:
-            plan = TenantPlan[plan_str.upper()]
-        except KeyError:
-            return (
-                jsonify(
-                    {
-                        "error": f"Invalid plan: {plan_str}. Must be one of: free, pro, enterprise",
-                        "code": "VALIDATION_ERROR",
-                    }
-                ),
-                400,
-            )
-
         # 调用服务层创建租户
-        tenant = tenant_service.create_tenant(name=data.get("name"), plan=plan, owner_account_id=account.id)
+        tenant = tenant_service.create_tenant(name=payload.name, plan=payload.plan, owner_account_id=account.id)
 
-        return (
-            jsonify(
-                {
-                    "id": str(tenant.id),
-                    "name": tenant.name,
-                    "plan": tenant.plan.value,
-                    "status": tenant.status.value,
-                    "created_at": tenant.created_at.isoformat(),
-                }
-            ),
-            201,
-        )
+        return json_response(tenant.to_view_dict(), 201)
 
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except ResourceConflictError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_CONFLICT"}), 409
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("", methods=["GET"])
@@ -155,29 +185,31 @@ def get_tenants():
         # 获取用户的所有租户
         tenants = tenant_service.get_account_tenants(account.id)
 
-        # 构建响应（需要为每个租户查询角色）
+        # 构建响应（一次查询取回所有租户中的角色）
+        roles = tenant_service.tenant_repo.get_member_roles([tenant.id for tenant in tenants], account.id)
         result = []
         for tenant in tenants:
-            role = tenant_service.tenant_repo.get_member_role(tenant.id, account.id)
+            role = roles.get(tenant.id)
             result.append(
                 {
-                    "id": str(tenant.id),
+                    "id": tenant.id,
                     "name": tenant.name,
-                    "role": role.value if role else "member",
-                    "plan": tenant.plan.value,
-                    "status": tenant.status.value,
+                    "role": role or TenantRole.MEMBER,
+                    "plan": tenant.plan,
+                    "status": tenant.status,
                 }
             )
 
-        return jsonify(result), 200
+        return json_response(result, 200)
 
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("/<tenant_id>", methods=["GET"])
 @jwt_required
-def get_tenant(tenant_id):
+@uuid_path("tenant_id")
+def get_tenant(tenant_id: UUID):
     """
     获取租户详情
 
@@ -199,48 +231,28 @@ def get_tenant(tenant_id):
         - 404: 租户不存在
     """
     try:
-        # 解析 UUID
-        try:
-            tenant_uuid = parse_uuid(tenant_id, "tenant ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
         account = g.current_account
-        tenant_service = get_tenant_service()
 
-        # 先检查租户是否存在
-        from repositories import TenantRepository
-
-        tenant = TenantRepository().get_by_id(tenant_uuid)
+        # 一次查询同时取回租户和当前用户的成员角色
+        tenant, role = _TENANT_REPO.get_with_membership(tenant_id, account.id)
         if not tenant:
-            return jsonify({"error": "Tenant not found", "code": "RESOURCE_NOT_FOUND"}), 404
+            return _error("tenant_not_found")
 
         # 检查用户是否是成员
-        if not tenant_service.is_member(tenant_uuid, account.id):
-            return jsonify({"error": "You are not a member of this tenant", "code": "AUTHORIZATION_ERROR"}), 403
+        if role is None:
+            return _error("not_member")
 
         # 返回租户信息
-        return (
-            jsonify(
-                {
-                    "id": str(tenant.id),
-                    "name": tenant.name,
-                    "plan": tenant.plan.value,
-                    "status": tenant.status.value,
-                    "created_at": tenant.created_at.isoformat(),
-                    "updated_at": tenant.updated_at.isoformat(),
-                }
-            ),
-            200,
-        )
+        return json_response(tenant.to_view_dict(), 200)
 
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("/<tenant_id>", methods=["PUT"])
 @jwt_required
-def update_tenant(tenant_id):
+@uuid_path("tenant_id")
+def update_tenant(tenant_id: UUID):
     """
     更新租户信息
 
@@ -257,7 +269,9 @@ def update_tenant(tenant_id):
             "id": "uuid",
             "name": "New Name",
             "plan": "free",
-            "status": "active"
+            "status": "active",
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00"
         }
 
         失败:
@@ -266,46 +280,25 @@ def update_tenant(tenant_id):
         - 404: 租户不存在
     """
     try:
-        # 解析 UUID
-        try:
-            tenant_uuid = parse_uuid(tenant_id, "tenant ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
         data = request.get_json()
         account = g.current_account
         tenant_service = get_tenant_service()
 
         # 调用服务层更新（会检查权限）
         tenant = tenant_service.update_tenant(
-            tenant_id=tenant_uuid, name=data.get("name"), operator_account_id=account.id
+            tenant_id=tenant_id, name=data.get("name"), operator_account_id=account.id
         )
 
-        return (
-            jsonify(
-                {
-                    "id": str(tenant.id),
-                    "name": tenant.name,
-                    "plan": tenant.plan.value,
-                    "status": tenant.status.value,
-                }
-            ),
-            200,
-        )
+        return json_response(tenant.to_view_dict(), 200)
 
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("/<tenant_id>/members", methods=["GET"])
 @jwt_required
-def get_tenant_members(tenant_id):
+@uuid_path("tenant_id")
+def get_tenant_members(tenant_id: UUID):
     """
     获取租户成员列表
 
@@ -331,47 +324,41 @@ def get_tenant_members(tenant_id):
         - 404: 租户不存在
     """
     try:
-        # 解析 UUID
-        try:
-            tenant_uuid = parse_uuid(tenant_id, "tenant ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
         account = g.current_account
         tenant_service = get_tenant_service()
 
         # 检查权限（必须是成员）
-        if not tenant_service.is_member(tenant_uuid, account.id):
-            return jsonify({"error": "You are not a member of this tenant", "code": "AUTHORIZATION_ERROR"}), 403
+        if not tenant_service.is_member(tenant_id, account.id):
+            return _error("not_member")
 
         # 获取成员列表
-        members = tenant_service.get_tenant_members(tenant_uuid)
+        members = tenant_service.get_tenant_members(tenant_id)
 
-        # 构建响应（需要包含角色信息）
+        # 构建响应（一次查询取回所有成员的角色信息）
+        joins = tenant_service.tenant_repo.get_member_joins(tenant_id, [member.id for member in members])
         result = []
         for member in members:
-            join = tenant_service.tenant_repo.get_member_join(tenant_uuid, member.id)
+            join = joins.get(member.id)
             result.append(
                 {
-                    "id": str(member.id),
+                    "id": member.id,
                     "email": member.email,
                     "name": member.name,
-                    "role": join.role.value if join else "member",
-                    "joined_at": join.created_at.isoformat() if join else None,
+                    "role": join.role if join else TenantRole.MEMBER,
+                    "joined_at": join.created_at if join else None,
                 }
             )
 
-        return jsonify(result), 200
+        return json_response(result, 200)
 
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("/<tenant_id>/members", methods=["POST"])
 @jwt_required
-def add_member(tenant_id):
+@uuid_path("tenant_id")
+def add_member(tenant_id: UUID):
     """
     添加租户成员
 
@@ -394,63 +381,28 @@ def add_member(tenant_id):
         - 403: 无权限
         - 404: 租户或账号不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            tenant_uuid = parse_uuid(tenant_id, "tenant ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        data = request.get_json()
-        account_id_to_add = data.get("account_id")
-
-        # 解析 account_id
-        try:
-            account_uuid_to_add = parse_uuid(account_id_to_add, "account ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        role_str = data.get("role", "member")
-
-        # 将字符串转换为枚举
-        try:
-            role = TenantRole[role_str.upper()]
-        except KeyError:
-            return (
-                jsonify(
-                    {
-                        "error": f"Invalid role: {role_str}. Must be one of: member, admin",
-                        "code": "VALIDATION_ERROR",
-                    }
-                ),
-                400,
-            )
+    # 解析并校验请求体（校验失败由全局 pydantic 错误处理器返回 400）
+    payload = AddMemberRequest.model_validate(request.get_json(silent=True))
 
+    try:
         account = g.current_account
         tenant_service = get_tenant_service()
 
         # 调用服务层添加成员（会检查权限和业务规则）
         tenant_service.add_member(
-            tenant_id=tenant_uuid, account_id=account_uuid_to_add, role=role, operator_account_id=account.id
+            tenant_id=tenant_id, account_id=payload.account_id, role=payload.role, operator_account_id=account.id
         )
 
-        return jsonify({"message": "Member added successfully"}), 201
+        return json_response({"message": "Member added successfully"}, 201)
 
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except ResourceConflictError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_CONFLICT"}), 409
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("/<tenant_id>/members/<account_id>", methods=["DELETE"])
 @jwt_required
-def remove_member(tenant_id, account_id):
+@uuid_path("tenant_id", "account_id")
+def remove_member(tenant_id: UUID, account_id: UUID):
     """
     移除租户成员
 
@@ -469,35 +421,23 @@ def remove_member(tenant_id, account_id):
         - 404: 租户或成员不存在
     """
     try:
-        # 解析 UUID
-        try:
-            tenant_uuid = parse_uuid(tenant_id, "tenant ID")
-            account_uuid = parse_uuid(account_id, "account ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
         account = g.current_account
 
         # 调用服务层移除成员（会检查权限和业务规则）
         get_tenant_service().remove_member(
-            tenant_id=tenant_uuid, account_id=account_uuid, operator_account_id=account.id
+            tenant_id=tenant_id, account_id=account_id, operator_account_id=account.id
         )
 
-        return jsonify({"message": "Member removed successfully"}), 200
+        return json_response({"message": "Member removed successfully"}, 200)
 
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
 
 
 @tenant_bp.route("/<tenant_id>/members/<account_id>/role", methods=["PUT"])
 @jwt_required
-def update_member_role(tenant_id, account_id):
+@uuid_path("tenant_id", "account_id")
+def update_member_role(tenant_id: UUID, account_id: UUID):
     """
     更新成员角色
 
@@ -520,46 +460,19 @@ def update_member_role(tenant_id, account_id):
         - 403: 无权限（不是owner）
         - 404: 租户或成员不存在
     """
-    try:
-        # 解析 UUID
-        try:
-            tenant_uuid = parse_uuid(tenant_id, "tenant ID")
-            account_uuid = parse_uuid(account_id, "account ID")
-        except ValueError as e:
-            return jsonify({"error": str(e), "code": "INVALID_UUID"}), 400
-
-        data = request.get_json()
-        role_str = data.get("role")
-
-        # 将字符串转换为枚举
-        try:
-            new_role = TenantRole[role_str.upper()]
-        except KeyError:
-            return (
-                jsonify(
-                    {
-                        "error": f"Invalid role: {role_str}. Must be one of: member, admin",
-                        "code": "VALIDATION_ERROR",
-                    }
-                ),
-                400,
-            )
+    # 解析并校验请求体（校验失败由全局 pydantic 错误处理器返回 400）
+    payload = UpdateMemberRoleRequest.model_validate(request.get_json(silent=True))
 
+    try:
         account = g.current_account
         tenant_service = get_tenant_service()
 
         # 调用服务层更新角色（会检查权限和业务规则）
         tenant_service.update_member_role(
-            tenant_id=tenant_uuid, account_id=account_uuid, new_role=new_role, operator_account_id=account.id
+            tenant_id=tenant_id, account_id=account_id, new_role=payload.role, operator_account_id=account.id
         )
 
-        return jsonify({"message": "Role updated successfully"}), 200
+        return json_response({"message": "Role updated successfully"}, 200)
 
-    except ValidationError as e:
-        return jsonify({"error": str(e), "code": "VALIDATION_ERROR"}), 400
-    except AuthorizationError as e:
-        return jsonify({"error": str(e), "code": "AUTHORIZATION_ERROR"}), 403
-    except ResourceNotFoundError as e:
-        return jsonify({"error": str(e), "code": "RESOURCE_NOT_FOUND"}), 404
     except Exception as e:
-        return jsonify({"error": "Internal server error", "code": "INTERNAL_ERROR", "detail": str(e)}), 500
+        return _map_error(e)
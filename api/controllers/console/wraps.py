@@ -0,0 +1,65 @@
+"""
+控制台控制器公共装饰器
+
+路径中的 UUID 参数统一由 uuid_path 解析：格式错误时返回 400 INVALID_UUID，
+不使用 Flask 的 <uuid:...> 转换器（转换失败时路由不匹配，返回 404）
+"""
+
+import re
+import uuid as uuid_module
+from functools import wraps
+from uuid import UUID
+
+from libs.response import json_response
+from services import InvalidUUIDError
+
+# 预编译的 UUID 格式校验（8-4-4-4-12 十六进制），先于 UUID 构造函数快速拒绝非法输入
+_UUID_RE = re.compile(r"\A[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\Z")
+
+
+def parse_uuid(uuid_string: str, name: str = "ID") -> UUID:
+    """
+    解析 UUID 字符串
+
+    参数:
+        uuid_string: UUID 字符串
+        name: 参数名称（用于错误消息）
+
+    返回:
+        UUID 对象
+
+    抛出:
+        InvalidUUIDError: 如果 UUID 格式不正确
+    """
+    if not isinstance(uuid_string, str) or _UUID_RE.match(uuid_string) is None:
+        raise InvalidUUIDError(f"Invalid {name}: {uuid_string}")
+
+    return uuid_module.UUID(uuid_string)
+
+
+def uuid_path(*names: str):
+    """
+    将路径参数解析为 UUID 的装饰器，格式错误时直接返回 400
+
+    参数:
+        names: 需要解析的路径参数名（如 "tenant_id"）
+
+    返回:
+        装饰器
+    """
+    # 参数名 -> 错误消息中的名称（tenant_id -> tenant ID）
+    labels = tuple((name, name.replace("_id", " ID")) for name in names)
+
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            for name, label in labels:
+                try:
+                    kwargs[name] = parse_uuid(kwargs[name], label)
+                except InvalidUUIDError as e:
+                    return json_response({"error": e.message, "code": e.code}, 400)
+            return f(*args, **kwargs)
+
+        return decorated
+
+    return decorator
@@ -0,0 +1,204 @@
+"""
+认证账户缓存
+
+jwt_required 使用的两级缓存：
+进程内已验证令牌缓存（sha256(token) 摘要 -> 账户快照）在前，
+Redis 账户快照（account:v1:{id}）在后，多个 worker 共享。
+账户状态、密码、登录信息变化时必须调用 invalidate_accounts 删除两级缓存
+"""
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Optional
+from uuid import UUID
+
+import orjson
+
+from configs.app_config import Config
+from extensions.ext_redis import redis_client
+from libs.sieve_cache import SieveCache
+from models.account import Account, AccountStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class AccountSnapshot:
+    """认证账户快照（不可变，不绑定数据库会话，可在并发请求间共享）"""
+
+    id: UUID
+    email: str
+    name: str
+    avatar: Optional[str]
+    status: AccountStatus
+    created_at: Optional[datetime]
+    last_login_at: Optional[datetime]
+
+
+# 进程内已验证令牌缓存，条目不会比令牌存活更久；只缓存验证成功的结果。
+# 按账户 ID 分组，失效时只访问该账户的令牌；
+# 失效只作用于当前进程，其他进程最多在 AUTH_JWT_CACHE_TTL 秒后感知
+_token_cache = SieveCache(
+    maxsize=Config.AUTH_JWT_CACHE_MAX,
+    ttl=Config.AUTH_JWT_CACHE_TTL,
+    group=lambda account: account.id,
+)
+
+# Redis 账户快照
+_ACCOUNT_CACHE_KEY = 'account:v1:{}'
+_ACCOUNT_CACHE_TTL = 60
+
+
+def _token_digest(token: str) -> bytes:
+    """计算令牌缓存键"""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_cached_token(token: str) -> Optional[AccountSnapshot]:
+    """
+    读取进程内已验证令牌缓存
+
+    参数:
+        token: JWT 令牌
+
+    返回:
+        账户快照或 None
+    """
+    return _token_cache.get(_token_digest(token))
+
+
+def set_cached_token(token: str, account: AccountSnapshot, token_exp: Optional[int]) -> None:
+    """
+    写入进程内已验证令牌缓存，缓存不会比令牌存活更久
+
+    参数:
+        token: JWT 令牌
+        account: 账户快照
+        token_exp: 令牌过期时间戳
+    """
+    _token_cache.set(_token_digest(token), account, token_exp or None)
+
+
+def drop_cached_token(token: str) -> None:
+    """
+    移出当前进程的令牌缓存
+
+    参数:
+        token: JWT 令牌
+    """
+    _token_cache.delete(_token_digest(token))
+
+
+def get_cached_account(account_id: str) -> Optional[AccountSnapshot]:
+    """
+    读取账户快照缓存
+
+    Redis 未初始化或不可用时视为未命中
+
+    参数:
+        account_id: 账户 ID
+
+    返回:
+        账户快照或 None
+    """
+    try:
+        cached = redis_client.get(_ACCOUNT_CACHE_KEY.format(account_id))
+    except Exception as e:
+        logger.warning("Account cache read failed: %s", e)
+        return None
+
+    if not cached:
+        return None
+
+    data = orjson.loads(cached)
+    return AccountSnapshot(
+        id=UUID(data['id']),
+        email=data['email'],
+        name=data['name'],
+        avatar=data['avatar'],
+        status=AccountStatus(data['status']),
+        created_at=datetime.fromisoformat(data['created_at']) if data['created_at'] else None,
+        last_login_at=datetime.fromisoformat(data['last_login_at']) if data['last_login_at'] else None,
+    )
+
+
+def snapshot_account(account: Account) -> AccountSnapshot:
+    """
+    复制账户为不可变快照
+
+    会话提交后原实例属性会过期，且 ORM 实例可变，跨请求复用必须使用快照
+
+    参数:
+        account: 账户实例
+
+    返回:
+        账户快照
+    """
+    return AccountSnapshot(
+        id=account.id,
+        email=account.email,
+        name=account.name,
+        avatar=account.avatar,
+        status=account.status,
+        created_at=account.created_at,
+        last_login_at=account.last_login_at,
+    )
+
+
+def set_cached_account(account: AccountSnapshot, token_exp: Optional[int]) -> None:
+    """
+    写入账户快照缓存（不包含密码哈希）
+
+    参数:
+        account: 账户快照
+        token_exp: 令牌过期时间戳，缓存不会比令牌存活更久
+    """
+    ttl = _ACCOUNT_CACHE_TTL
+    if token_exp:
+        ttl = min(ttl, int(token_exp - time.time()))
+    if ttl <= 0:
+        return
+
+    snapshot = orjson.dumps({
+        'id': account.id,
+        'email': account.email,
+        'name': account.name,
+        'avatar': account.avatar,
+        'status': account.status,
+        'created_at': account.created_at,
+        'last_login_at': account.last_login_at,
+    })
+    try:
+        redis_client.set(_ACCOUNT_CACHE_KEY.format(account.id), snapshot, ex=ttl)
+    except Exception as e:
+        logger.warning("Account cache write failed: %s", e)
+
+
+def invalidate_accounts(account_ids: Iterable[UUID]) -> None:
+    """
+    删除账户快照缓存（含当前进程内这些账户的已验证令牌）
+
+    Redis 删除失败时只记录日志，快照最多保留 _ACCOUNT_CACHE_TTL 秒
+
+    参数:
+        account_ids: 账户 ID 列表
+    """
+    account_ids = set(account_ids)
+    if not account_ids:
+        return
+
+    for account_id in account_ids:
+        _token_cache.delete_group(account_id)
+
+    try:
+        redis_client.delete(*(_ACCOUNT_CACHE_KEY.format(account_id) for account_id in account_ids))
+    except Exception as e:
+        logger.warning("Account cache invalidation failed: %s", e)
+
+
+def clear_local_cache() -> None:
+    """清空进程内令牌缓存"""
+    _token_cache.clear()
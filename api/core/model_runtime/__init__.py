@@ -17,6 +17,7 @@ from core.model_runtime.providers import (
     BaseEmbeddingProvider,
     BaseLLMProvider,
     BaseModelProvider,
+    EmbeddingBatcher,
     ModelProviderFactory,
     OpenAIProvider,
     TEIProvider,
@@ -37,6 +38,7 @@ __all__ = [
     "BaseModelProvider",
     "BaseLLMProvider",
     "BaseEmbeddingProvider",
+    "EmbeddingBatcher",
     "OpenAIProvider",
     "TEIProvider",
     "ModelProviderFactory",
@@ -2,9 +2,14 @@
 模型运行时实体类
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class ModelType(str, Enum):
@@ -21,7 +26,7 @@ class ProviderType(str, Enum):
     TEI = "tei"  # Text Embeddings Inference
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelUsage:
     """模型使用量统计"""
 
@@ -37,16 +42,39 @@ class ModelUsage:
             total_tokens=self.total_tokens + other.total_tokens,
         )
 
+    def __iadd__(self, other: "ModelUsage") -> "ModelUsage":
+        """原地累加使用量统计（流式累计时避免每次创建新对象）"""
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.total_tokens += other.total_tokens
+        return self
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMMessage:
-    """LLM 消息"""
+    """LLM 消息（不可变，请求体字典在创建时构建一次）"""
 
     role: str  # system, user, assistant
     content: str
+    _dict: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """构建请求体中的消息字典"""
+        object.__setattr__(self, "_dict", {"role": self.role, "content": self.content})
+
+    def to_openai_dict(self) -> dict[str, str]:
+        """
+        转换为 OpenAI 格式的消息字典
+
+        返回缓存的同一个字典，多轮对话重复发送时无需每次重建；调用方不能修改返回值
 
+        Returns:
+            dict[str, str]: {"role": ..., "content": ...}
+        """
+        return self._dict
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMResult:
     """LLM 调用结果"""
 
@@ -57,7 +85,7 @@ class LLMResult:
     system_fingerprint: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResultChunk:
     """LLM 流式输出块"""
 
@@ -67,7 +95,7 @@ class LLMResultChunk:
     index: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingResult:
     """文本向量化结果"""
 
@@ -75,22 +103,80 @@ class EmbeddingResult:
     embeddings: list[list[float]]  # 向量列表
     usage: ModelUsage
 
+    def to_numpy(self, dtype: str = "float32") -> "np.ndarray":
+        """
+        转换为连续存储的二维数组 (n, dim)
+
+        用于相似度计算（A @ B.T）或写入向量库等二进制接口（tobytes()）
+
+        Args:
+            dtype: 数组元素类型（float32/float16）
+
+        Returns:
+            np.ndarray: 向量矩阵
+        """
+        import numpy as np  # numpy 导入较慢，仅在需要数组时加载
+
+        return np.asarray(self.embeddings, dtype=dtype)
 
-@dataclass
+    def quantize_int8(self) -> tuple["np.ndarray", "np.ndarray"]:
+        """
+        按行对称量化为 int8，存储体积约为 float32 的 1/4
+
+        还原方式: vectors.astype(np.float32) * scales[:, None]
+
+        Returns:
+            tuple: (int8 向量矩阵 (n, dim), 每行缩放系数 float32 (n,))
+        """
+        import numpy as np  # numpy 导入较慢，仅在需要数组时加载
+
+        vectors = self.to_numpy("float32")
+        if vectors.size == 0:
+            return vectors.astype(np.int8), np.zeros(len(vectors), dtype=np.float32)
+
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+
+@dataclass(slots=True)
 class ProviderCredentials:
     """提供商凭证"""
 
     provider_type: ProviderType
-    credentials: dict[str, Any]  # 凭证信息 (api_key, base_url, etc.)
+    credentials: Mapping[str, Any]  # 凭证信息 (api_key, base_url, etc.)，构造后只读
+
+    def __post_init__(self) -> None:
+        """凭证只读不写，包装为只读视图供多次调用共享"""
+        if not isinstance(self.credentials, MappingProxyType):
+            self.credentials = MappingProxyType(self.credentials)
+
+    def __getitem__(self, key: str) -> Any:
+        """获取凭证值（不存在时抛出 KeyError）"""
+        return self.credentials[key]
 
     def get(self, key: str, default: Any = None) -> Any:
         """获取凭证值"""
         return self.credentials.get(key, default)
 
 
-@dataclass
+# ModelConfig 中参与请求体构建的字段（值为 None 的字段不发送）
+_MODEL_CONFIG_FIELDS = (
+    "model",
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "frequency_penalty",
+    "presence_penalty",
+    "stop",
+    "stream",
+)
+
+
+@dataclass(slots=True, frozen=True)
 class ModelConfig:
-    """模型配置"""
+    """模型配置（不可变，可在多次调用间安全复用）"""
 
     model: str
     temperature: float = 0.7
@@ -100,19 +186,15 @@ class ModelConfig:
     presence_penalty: float = 0.0
     stop: Optional[list[str]] = None
     stream: bool = False
+    _dict: Optional[dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
-        """转换为字典"""
-        data = {
-            "model": self.model,
-            "temperature": self.temperature,
-            "top_p": self.top_p,
-            "frequency_penalty": self.frequency_penalty,
-            "presence_penalty": self.presence_penalty,
-            "stream": self.stream,
-        }
-        if self.max_tokens is not None:
-            data["max_tokens"] = self.max_tokens
-        if self.stop is not None:
-            data["stop"] = self.stop
-        return data
+        """转换为字典（首次调用时构建并缓存，每次返回副本，调用方可自由修改）"""
+        if self._dict is None:
+            data = {}
+            for name in _MODEL_CONFIG_FIELDS:
+                value = getattr(self, name)
+                if value is not None:
+                    data[name] = value
+            object.__setattr__(self, "_dict", data)
+        return self._dict.copy()
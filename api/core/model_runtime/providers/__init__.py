@@ -7,6 +7,7 @@ from core.model_runtime.providers.base_provider import (
     BaseLLMProvider,
     BaseModelProvider,
 )
+from core.model_runtime.providers.embedding_batcher import EmbeddingBatcher
 from core.model_runtime.providers.openai_provider import OpenAIProvider
 from core.model_runtime.providers.provider_factory import ModelProviderFactory
 from core.model_runtime.providers.tei_provider import TEIProvider
@@ -15,6 +16,7 @@ __all__ = [
     "BaseModelProvider",
     "BaseLLMProvider",
     "BaseEmbeddingProvider",
+    "EmbeddingBatcher",
     "OpenAIProvider",
     "TEIProvider",
     "ModelProviderFactory",
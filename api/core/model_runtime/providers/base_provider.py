@@ -2,9 +2,12 @@
 模型提供商基类
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Generator, Optional
 
+import httpx
+
 from core.model_runtime.entities.model_entities import (
     EmbeddingResult,
     LLMMessage,
@@ -18,6 +21,45 @@ from core.model_runtime.entities.model_entities import (
 class BaseModelProvider(ABC):
     """模型提供商基类"""
 
+    # 请求超时（秒），子类可覆盖
+    timeout: float = 60.0
+
+    _client: Optional[httpx.Client] = None
+    _client_lock = threading.Lock()
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """
+        获取复用的 HTTP 客户端
+
+        提供商实例由 ModelProviderFactory 缓存，客户端随实例复用，
+        跨请求保持 keep-alive 连接，避免每次调用重新建立 TCP/TLS 连接
+
+        Returns:
+            httpx.Client: HTTP 客户端
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        timeout=self.timeout,
+                        limits=httpx.Limits(
+                            max_connections=100, max_keepalive_connections=32, keepalive_expiry=30.0
+                        ),
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """
+        关闭复用的 HTTP 客户端，释放连接池
+
+        关闭后再次访问 http_client 会重新创建客户端
+        """
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
     @abstractmethod
     def validate_credentials(self, credentials: ProviderCredentials) -> bool:
         """
@@ -77,6 +119,7 @@ class BaseLLMProvider(BaseModelProvider):
         credentials: ProviderCredentials,
         model_config: ModelConfig,
         messages: list[LLMMessage],
+        reuse_chunk: bool = False,
     ) -> Generator[LLMResultChunk, None, None]:
         """
         调用 LLM 模型（流式）
@@ -85,6 +128,8 @@ class BaseLLMProvider(BaseModelProvider):
             credentials: 提供商凭证
             model_config: 模型配置
             messages: 消息列表
+            reuse_chunk: 是否复用同一个输出块对象（每次 yield 前原地更新字段，
+                避免逐 token 创建对象）。开启后调用方不能保留块的引用，需要时自行拷贝字段
 
         Yields:
             LLMResultChunk: LLM 流式输出块
@@ -0,0 +1,103 @@
+"""
+向量化请求合批
+
+将并发的单条查询向量化请求合并为一次 embed_documents 调用
+"""
+
+import threading
+from typing import Optional
+
+import orjson
+
+from core.model_runtime.entities.model_entities import ProviderCredentials
+from core.model_runtime.providers.base_provider import BaseEmbeddingProvider
+
+
+class _Batch:
+    """等待合并发送的一批文本"""
+
+    __slots__ = ("texts", "full", "done", "embeddings", "error")
+
+    def __init__(self):
+        self.texts: list[str] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.embeddings: Optional[list[list[float]]] = None
+        self.error: Optional[BaseException] = None
+
+
+class EmbeddingBatcher:
+    """
+    查询向量化合批器
+
+    同一提供商、模型和凭证下的并发 embed_query 请求在短时间窗口内合并：
+    第一个到达的调用方负责发送，最多等待 max_wait_ms 或凑满 max_batch 条文本后
+    调用一次 embed_documents，其余调用方阻塞等待并取回各自的向量。
+    不需要后台线程，在 gevent / 多线程 worker 下均可使用
+    """
+
+    def __init__(self, provider: BaseEmbeddingProvider, max_batch: int = 64, max_wait_ms: float = 10.0):
+        """
+        初始化
+
+        Args:
+            provider: 向量化提供商
+            max_batch: 单批最大文本数
+            max_wait_ms: 发送前最长等待时间（毫秒）
+        """
+        self.provider = provider
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: dict[tuple, _Batch] = {}
+        self._lock = threading.Lock()
+
+    def embed_query(self, credentials: ProviderCredentials, model: str, text: str) -> list[float]:
+        """
+        对查询文本进行向量化（可能与其他并发请求合并发送）
+
+        Args:
+            credentials: 提供商凭证
+            model: 模型名称
+            text: 查询文本
+
+        Returns:
+            list[float]: 向量
+
+        Raises:
+            Exception: 合并请求失败时，同批所有调用方收到同一异常
+        """
+        key = (
+            credentials.provider_type,
+            model,
+            orjson.dumps(dict(credentials.credentials), option=orjson.OPT_SORT_KEYS),
+        )
+
+        with self._lock:
+            batch = self._pending.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._pending[key] = _Batch()
+            index = len(batch.texts)
+            batch.texts.append(text)
+            if len(batch.texts) >= self.max_batch:
+                # 批次已满，不再接收新文本，通知发送方立即发送
+                del self._pending[key]
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.max_wait)
+            with self._lock:
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+            try:
+                batch.embeddings = self.provider.embed_documents(credentials, model, batch.texts).embeddings
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        return batch.embeddings[index]
@@ -0,0 +1,103 @@
+"""
+LLM 响应缓存
+
+缓存确定性调用（temperature == 0）的非流式结果，相同请求直接返回已有结果
+"""
+
+import hashlib
+import logging
+from typing import Any, Optional
+
+import orjson
+
+from core.model_runtime.entities.model_entities import LLMResult, ModelUsage
+from extensions.ext_redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+# 缓存键前缀与默认过期时间（秒）
+CACHE_KEY_PREFIX = "llm:"
+DEFAULT_TTL = 3600
+
+# 进程内命中统计
+_stats = {"hits": 0, "misses": 0}
+
+
+def cache_key(base_url: str, api_key: str, request_data: dict[str, Any]) -> Optional[str]:
+    """
+    计算请求的缓存键
+
+    只有 temperature 显式为 0 的请求才可缓存，其他请求的输出带随机性；
+    键中包含 API Key 的摘要，不同凭证（租户）之间不共享缓存结果
+
+    Args:
+        base_url: 接口地址（不同服务端的结果不共享）
+        api_key: API Key（只以摘要形式参与计算）
+        request_data: 完整请求体（模型、消息及采样参数）
+
+    Returns:
+        Optional[str]: 缓存键；不可缓存时返回 None
+    """
+    if request_data.get("temperature") != 0:
+        return None
+    credential = hashlib.sha256(f"{base_url}|{api_key}".encode()).hexdigest()
+    payload = orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS)
+    return f"{CACHE_KEY_PREFIX}{credential}:" + hashlib.sha256(payload).hexdigest()
+
+
+def get_cached_result(key: str) -> Optional[LLMResult]:
+    """
+    读取缓存结果
+
+    Redis 不可用时视为未命中，不影响正常调用
+
+    Args:
+        key: 缓存键
+
+    Returns:
+        Optional[LLMResult]: 缓存的结果；未命中时返回 None
+    """
+    try:
+        cached = redis_client.get(key)
+    except Exception as e:
+        logger.warning("LLM cache read failed: %s", e)
+        cached = None
+
+    if cached is None:
+        _stats["misses"] += 1
+        return None
+
+    _stats["hits"] += 1
+    data = orjson.loads(cached)
+    return LLMResult(
+        model=data["model"],
+        content=data["content"],
+        usage=ModelUsage(**data["usage"]),
+        finish_reason=data.get("finish_reason"),
+        system_fingerprint=data.get("system_fingerprint"),
+    )
+
+
+def set_cached_result(key: str, result: LLMResult, ttl: int = DEFAULT_TTL) -> None:
+    """
+    写入缓存结果（失败时忽略）
+
+    Args:
+        key: 缓存键
+        result: LLM 调用结果
+        ttl: 过期时间（秒）
+    """
+    try:
+        redis_client.set(key, orjson.dumps(result), ex=ttl)
+    except Exception as e:
+        logger.warning("LLM cache write failed: %s", e)
+
+
+def get_cache_stats() -> dict[str, int]:
+    """
+    获取本进程的缓存命中统计
+
+    Returns:
+        dict[str, int]: {"hits": 命中次数, "misses": 未命中次数}
+    """
+    return dict(_stats)
@@ -2,11 +2,16 @@
 OpenAI 模型提供商
 """
 
-import json
-from typing import Generator
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Generator, Iterator, Mapping, Optional
 
 import httpx
+import orjson
 
+from configs.app_config import Config
 from core.model_runtime.entities.model_entities import (
     LLMMessage,
     LLMResult,
@@ -15,14 +20,97 @@ from core.model_runtime.entities.model_entities import (
     ModelUsage,
     ProviderCredentials,
 )
+from core.model_runtime.providers import llm_cache, provider_cache
 from core.model_runtime.providers.base_provider import BaseLLMProvider
+from core.model_runtime.rate_limiter import llm_rate_limiter
+from core.model_runtime.sse_decoder import iter_sse_data
+from libs.errors import RateLimitedError
+
+
+@lru_cache(maxsize=1024)
+def _prepare(api_key: str, base_url: str) -> tuple[str, str, Mapping[str, str]]:
+    """
+    构建接口地址和请求头（按凭证缓存，同一凭证的后续调用直接复用）
+
+    Args:
+        api_key: API Key
+        base_url: 接口地址
+
+    Returns:
+        tuple[str, str, Mapping[str, str]]: (chat/completions 地址, models 地址, 只读请求头)
+    """
+    root = base_url.rstrip("/")
+    headers = MappingProxyType({"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"})
+    return f"{root}/chat/completions", f"{root}/models", headers
 
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI 格式的 LLM 提供商"""
 
-    def __init__(self):
-        self.timeout = 60.0
+    # 本进程同时进行的模型调用名额（所有实例共享），首次调用时按 LLM_MAX_CONCURRENT_REQUESTS 创建
+    _request_slots: Optional[threading.BoundedSemaphore] = None
+    _request_slots_lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def _request_slot(cls) -> Iterator[None]:
+        """
+        占用一个模型调用名额，退出时释放
+
+        等待超过 LLM_REQUEST_SLOT_TIMEOUT 秒仍无空闲名额时抛出 RateLimitedError
+
+        Raises:
+            RateLimitedError: 等待名额超时
+        """
+        if cls._request_slots is None:
+            with cls._request_slots_lock:
+                if cls._request_slots is None:
+                    cls._request_slots = threading.BoundedSemaphore(Config.LLM_MAX_CONCURRENT_REQUESTS)
+        slots = cls._request_slots
+
+        if not slots.acquire(timeout=Config.LLM_REQUEST_SLOT_TIMEOUT):
+            raise RateLimitedError("Too many concurrent model requests, please retry later")
+        try:
+            yield
+        finally:
+            slots.release()
+
+    @staticmethod
+    def _acquire_rate_limit(
+        credentials: ProviderCredentials,
+        base_url: str,
+        api_key: str,
+        model_config: ModelConfig,
+        messages: list[LLMMessage],
+    ) -> tuple[Optional[str], int, int]:
+        """
+        按预估 token 数申请限流额度
+
+        只有凭证中配置了 tpm_limit（每分钟 token 数）时才限流；
+        预估值为消息字符数 / 4 加上 max_tokens
+
+        Args:
+            credentials: 提供商凭证
+            base_url: 接口地址
+            api_key: API Key
+            model_config: 模型配置
+            messages: 消息列表
+
+        Returns:
+            tuple[Optional[str], int, int]: (桶的键, 每分钟 token 数, 实际扣除的 token 数，
+                预估值超过容量时按容量计)；未配置限流时键为 None
+
+        Raises:
+            RateLimitedError: 额度不足
+        """
+        tpm_limit = int(credentials.credentials.get("tpm_limit") or 0)
+        if not tpm_limit:
+            return None, 0, 0
+
+        bucket = provider_cache.credentials_key("ratelimit", base_url, api_key, model_config.model)
+        estimated = sum(len(msg.content) for msg in messages) // 4 + (model_config.max_tokens or 0)
+        charged = llm_rate_limiter.acquire(bucket, tpm_limit, estimated)
+        return bucket, tpm_limit, charged
 
     def validate_credentials(self, credentials: ProviderCredentials) -> bool:
         """
@@ -38,27 +126,30 @@ class OpenAIProvider(BaseLLMProvider):
             ValueError: 凭证缺少必需字段
             httpx.HTTPError: 请求失败
         """
-        api_key = credentials.get("api_key")
-        base_url = credentials.get("base_url", "https://api.openai.com/v1")
+        api_key = credentials.credentials.get("api_key")
+        base_url = credentials.credentials.get("base_url", "https://api.openai.com/v1")
 
         if not api_key:
             raise ValueError("api_key is required")
 
+        # 短时间内验证通过过的凭证直接返回
+        key = provider_cache.credentials_key("validcreds", base_url, api_key)
+        if provider_cache.get_cached(key):
+            return True
+
+        _, models_url, headers = _prepare(api_key, base_url)
+
         # 尝试调用 models 接口验证
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{base_url.rstrip('/')}/models",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-                return True
+            client = self.http_client
+            response = client.get(models_url, headers=headers)
+            response.raise_for_status()
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to validate credentials: {str(e)}")
 
+        provider_cache.set_cached(key, True)
+        return True
+
     def get_available_models(self, credentials: ProviderCredentials) -> list[str]:
         """
         获取可用的模型列表
@@ -69,27 +160,31 @@ class OpenAIProvider(BaseLLMProvider):
         Returns:
             list[str]: 模型名称列表
         """
-        api_key = credentials.get("api_key")
-        base_url = credentials.get("base_url", "https://api.openai.com/v1")
+        api_key = credentials.credentials.get("api_key")
+        base_url = credentials.credentials.get("base_url", "https://api.openai.com/v1")
 
         if not api_key:
             raise ValueError("api_key is required")
 
+        key = provider_cache.credentials_key("models", base_url, api_key)
+        models = provider_cache.get_cached(key)
+        if models is not None:
+            return models
+
+        _, models_url, headers = _prepare(api_key, base_url)
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(
-                    f"{base_url.rstrip('/')}/models",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return [model["id"] for model in data.get("data", [])]
+            client = self.http_client
+            response = client.get(models_url, headers=headers)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            models = [model["id"] for model in data.get("data", [])]
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to get available models: {str(e)}")
 
+        provider_cache.set_cached(key, models)
+        return models
+
     def invoke(
         self,
         credentials: ProviderCredentials,
@@ -110,9 +205,10 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             ValueError: 参数错误
             httpx.HTTPError: 请求失败
+            RateLimitedError: 超出凭证配置的 tpm_limit 限流额度，或等待调用名额超时
         """
-        api_key = credentials.get("api_key")
-        base_url = credentials.get("base_url", "https://api.openai.com/v1")
+        api_key = credentials.credentials.get("api_key")
+        base_url = credentials.credentials.get("base_url", "https://api.openai.com/v1")
 
         if not api_key:
             raise ValueError("api_key is required")
@@ -120,47 +216,69 @@ class OpenAIProvider(BaseLLMProvider):
         if not messages:
             raise ValueError("messages cannot be empty")
 
+        chat_url, _, headers = _prepare(api_key, base_url)
+
         # 构建请求体
         request_data = model_config.to_dict()
-        request_data["messages"] = [{"role": msg.role, "content": msg.content} for msg in messages]
+        request_data["messages"] = [msg.to_openai_dict() for msg in messages]
         request_data["stream"] = False
 
+        # 确定性请求（temperature == 0）优先读取响应缓存
+        key = llm_cache.cache_key(base_url, api_key, request_data)
+        if key is not None:
+            cached = llm_cache.get_cached_result(key)
+            if cached is not None:
+                return cached
+
+        bucket, tpm_limit, charged = self._acquire_rate_limit(credentials, base_url, api_key, model_config, messages)
+        # 实际消耗的令牌数：请求未被接口接受（连接失败、4xx/5xx 等）时为 0，全部退还
+        used = 0
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
+            client = self.http_client
+            with self._request_slot():
                 response = client.post(
-                    f"{base_url.rstrip('/')}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=request_data,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                # 解析响应
-                choice = data["choices"][0]
-                usage_data = data.get("usage", {})
-
-                return LLMResult(
-                    model=data["model"],
-                    content=choice["message"]["content"],
-                    usage=ModelUsage(
-                        prompt_tokens=usage_data.get("prompt_tokens", 0),
-                        completion_tokens=usage_data.get("completion_tokens", 0),
-                        total_tokens=usage_data.get("total_tokens", 0),
-                    ),
-                    finish_reason=choice.get("finish_reason"),
-                    system_fingerprint=data.get("system_fingerprint"),
+                    chat_url,
+                    headers=headers,
+                    content=orjson.dumps(request_data),
                 )
+            response.raise_for_status()
+            used = charged
+            data = orjson.loads(response.content)
+
+            # 解析响应
+            choice = data["choices"][0]
+            usage_data = data.get("usage", {})
+
+            result = LLMResult(
+                model=data["model"],
+                content=choice["message"]["content"],
+                usage=ModelUsage(
+                    prompt_tokens=usage_data.get("prompt_tokens", 0),
+                    completion_tokens=usage_data.get("completion_tokens", 0),
+                    total_tokens=usage_data.get("total_tokens", 0),
+                ),
+                finish_reason=choice.get("finish_reason"),
+                system_fingerprint=data.get("system_fingerprint"),
+            )
+            # 按接口返回的实际用量修正限流额度
+            used = result.usage.total_tokens or charged
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to invoke model: {str(e)}")
+        finally:
+            if bucket is not None:
+                llm_rate_limiter.adjust(bucket, tpm_limit, used - charged)
+
+        if key is not None:
+            llm_cache.set_cached_result(key, result)
+        return result
 
     def stream_invoke(
         self,
         credentials: ProviderCredentials,
         model_config: ModelConfig,
         messages: list[LLMMessage],
+        reuse_chunk: bool = False,
     ) -> Generator[LLMResultChunk, None, None]:
         """
         调用 LLM 模型（流式）
@@ -169,6 +287,7 @@ class OpenAIProvider(BaseLLMProvider):
             credentials: 提供商凭证
             model_config: 模型配置
             messages: 消息列表
+            reuse_chunk: 是否复用同一个输出块对象（调用方不能保留块的引用）
 
         Yields:
             LLMResultChunk: LLM 流式输出块
@@ -176,9 +295,10 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             ValueError: 参数错误
             httpx.HTTPError: 请求失败
+            RateLimitedError: 超出凭证配置的 tpm_limit 限流额度，或等待调用名额超时
         """
-        api_key = credentials.get("api_key")
-        base_url = credentials.get("base_url", "https://api.openai.com/v1")
+        api_key = credentials.credentials.get("api_key")
+        base_url = credentials.credentials.get("base_url", "https://api.openai.com/v1")
 
         if not api_key:
             raise ValueError("api_key is required")
@@ -186,54 +306,68 @@ class OpenAIProvider(BaseLLMProvider):
         if not messages:
             raise ValueError("messages cannot be empty")
 
+        chat_url, _, headers = _prepare(api_key, base_url)
+
         # 构建请求体
         request_data = model_config.to_dict()
-        request_data["messages"] = [{"role": msg.role, "content": msg.content} for msg in messages]
+        request_data["messages"] = [msg.to_openai_dict() for msg in messages]
         request_data["stream"] = True
 
+        # reuse_chunk 模式下复用的输出块
+        chunk: Optional[LLMResultChunk] = None
+
+        bucket, tpm_limit, charged = self._acquire_rate_limit(credentials, base_url, api_key, model_config, messages)
+        # 流式响应不返回用量：接口接受请求后按预估值计，否则全部退还
+        used = 0
+
+        # 调用名额在整个流式输出期间占用（包括等待调用方消费每个块的时间）；
+        # 调用方中途放弃时必须 close() 生成器（或让其被回收）才会释放名额
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                with client.stream(
-                    "POST",
-                    f"{base_url.rstrip('/')}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json=request_data,
-                ) as response:
-                    response.raise_for_status()
-
-                    # 解析 SSE 流
-                    for line in response.iter_lines():
-                        if not line:
-                            continue
+            client = self.http_client
+            with self._request_slot(), client.stream(
+                "POST",
+                chat_url,
+                headers=headers,
+                content=orjson.dumps(request_data),
+            ) as response:
+                response.raise_for_status()
+                used = charged
+
+                # 在字节流上增量解析 SSE 事件
+                for event in iter_sse_data(response.iter_bytes()):
+                    # 流结束标记
+                    if event == b"[DONE]":
+                        break
 
-                        # 移除 "data: " 前缀
-                        if line.startswith("data: "):
-                            line = line[6:]
-
-                        # 流结束标记
-                        if line == "[DONE]":
-                            break
-
-                        try:
-                            data = json.loads(line)
-                            choice = data["choices"][0]
-
-                            # 提取增量内容
-                            delta = choice.get("delta", {})
-                            content = delta.get("content", "")
-
-                            if content:
-                                yield LLMResultChunk(
-                                    model=data["model"],
-                                    delta=content,
-                                    finish_reason=choice.get("finish_reason"),
-                                    index=choice.get("index", 0),
-                                )
-                        except json.JSONDecodeError:
-                            # 忽略无法解析的行
+                    try:
+                        data = orjson.loads(event)
+                        choice = data["choices"][0]
+
+                        # 提取增量内容
+                        delta = choice.get("delta", {})
+                        content = delta.get("content", "")
+
+                        if not content:
                             continue
+
+                        if reuse_chunk and chunk is not None:
+                            chunk.model = data["model"]
+                            chunk.delta = content
+                            chunk.finish_reason = choice.get("finish_reason")
+                            chunk.index = choice.get("index", 0)
+                        else:
+                            chunk = LLMResultChunk(
+                                model=data["model"],
+                                delta=content,
+                                finish_reason=choice.get("finish_reason"),
+                                index=choice.get("index", 0),
+                            )
+                        yield chunk
+                    except orjson.JSONDecodeError:
+                        # 忽略无法解析的事件
+                        continue
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to stream invoke model: {str(e)}")
+        finally:
+            if bucket is not None:
+                llm_rate_limiter.adjust(bucket, tpm_limit, used - charged)
@@ -0,0 +1,85 @@
+"""
+提供商查询结果缓存
+
+缓存凭证验证、模型列表等短时间内结果不变的外部查询：
+进程内 SieveCache 在前，Redis 在后，多个 worker 共享结果
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any, Optional
+
+import orjson
+
+from extensions.ext_redis import redis_client
+from libs.sieve_cache import SieveCache
+
+logger = logging.getLogger(__name__)
+
+# 默认过期时间（秒）
+DEFAULT_TTL = 300
+
+_local_cache = SieveCache(maxsize=1024, ttl=DEFAULT_TTL)
+
+
+def credentials_key(prefix: str, *parts: str) -> str:
+    """
+    计算缓存键（凭证等敏感字段只以摘要形式出现在键中）
+
+    Args:
+        prefix: 键前缀，如 "validcreds"
+        *parts: 参与计算的字段，如 base_url、api_key
+
+    Returns:
+        str: 缓存键
+    """
+    return f"{prefix}:" + hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def get_cached(key: str) -> Optional[Any]:
+    """
+    读取缓存（Redis 不可用时视为未命中）
+
+    Args:
+        key: 缓存键
+
+    Returns:
+        Optional[Any]: 缓存值；未命中时返回 None
+    """
+    value = _local_cache.get(key)
+    if value is not None:
+        return value
+
+    try:
+        cached = redis_client.get(key)
+    except Exception as e:
+        logger.warning("Provider cache read failed: %s", e)
+        return None
+    if cached is None:
+        return None
+
+    value = orjson.loads(cached)
+    _local_cache.set(key, value)
+    return value
+
+
+def set_cached(key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+    """
+    写入缓存（Redis 写入失败时只保留进程内缓存）
+
+    Args:
+        key: 缓存键
+        value: 可被 orjson 序列化的值
+        ttl: 过期时间（秒）
+    """
+    _local_cache.set(key, value, expires_at=time.time() + ttl)
+    try:
+        redis_client.set(key, orjson.dumps(value), ex=ttl)
+    except Exception as e:
+        logger.warning("Provider cache write failed: %s", e)
+
+
+def clear_local_cache() -> None:
+    """清空进程内缓存"""
+    _local_cache.clear()
@@ -2,6 +2,7 @@
 模型提供商工厂
 """
 
+import threading
 from typing import Union
 
 from core.model_runtime.entities.model_entities import ProviderType
@@ -18,6 +19,8 @@ class ModelProviderFactory:
 
     _llm_providers: dict[ProviderType, BaseLLMProvider] = {}
     _embedding_providers: dict[ProviderType, BaseEmbeddingProvider] = {}
+    # 首次创建实例时加锁，避免并发请求各自创建实例（及其连接池）
+    _lock = threading.Lock()
 
     @classmethod
     def get_llm_provider(cls, provider_type: ProviderType) -> BaseLLMProvider:
@@ -34,10 +37,12 @@ class ModelProviderFactory:
             ValueError: 不支持的提供商类型
         """
         if provider_type not in cls._llm_providers:
-            if provider_type == ProviderType.OPENAI:
-                cls._llm_providers[provider_type] = OpenAIProvider()
-            else:
-                raise ValueError(f"Unsupported LLM provider type: {provider_type}")
+            with cls._lock:
+                if provider_type not in cls._llm_providers:
+                    if provider_type == ProviderType.OPENAI:
+                        cls._llm_providers[provider_type] = OpenAIProvider()
+                    else:
+                        raise ValueError(f"Unsupported LLM provider type: {provider_type}")
 
         return cls._llm_providers[provider_type]
 
@@ -56,10 +61,12 @@ class ModelProviderFactory:
             ValueError: 不支持的提供商类型
         """
         if provider_type not in cls._embedding_providers:
-            if provider_type == ProviderType.TEI:
-                cls._embedding_providers[provider_type] = TEIProvider()
-            else:
-                raise ValueError(f"Unsupported embedding provider type: {provider_type}")
+            with cls._lock:
+                if provider_type not in cls._embedding_providers:
+                    if provider_type == ProviderType.TEI:
+                        cls._embedding_providers[provider_type] = TEIProvider()
+                    else:
+                        raise ValueError(f"Unsupported embedding provider type: {provider_type}")
 
         return cls._embedding_providers[provider_type]
 
@@ -2,21 +2,49 @@
 TEI (Text Embeddings Inference) 向量化提供商
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 import httpx
+import orjson
 
 from core.model_runtime.entities.model_entities import (
     EmbeddingResult,
     ModelUsage,
     ProviderCredentials,
 )
+from core.model_runtime.providers import provider_cache
 from core.model_runtime.providers.base_provider import BaseEmbeddingProvider
 
 
 class TEIProvider(BaseEmbeddingProvider):
     """TEI 向量化服务提供商"""
 
-    def __init__(self):
-        self.timeout = 30.0
+    timeout = 30.0
+
+    # 单次 /embed 请求的默认文本数（可通过凭证中的 batch_size 覆盖）与并发请求数
+    batch_size = 32
+    max_parallel_requests = 8
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        获取并发发送分批请求的线程池（延迟创建，随提供商实例复用）
+
+        Returns:
+            ThreadPoolExecutor: 线程池
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_parallel_requests, thread_name_prefix="tei-embed"
+                    )
+        return self._executor
 
     def validate_credentials(self, credentials: ProviderCredentials) -> bool:
         """
@@ -32,20 +60,27 @@ class TEIProvider(BaseEmbeddingProvider):
             ValueError: 凭证缺少必需字段
             httpx.HTTPError: 请求失败
         """
-        base_url = credentials.get("base_url")
+        base_url = credentials.credentials.get("base_url")
 
         if not base_url:
             raise ValueError("base_url is required")
 
+        # 短时间内检查通过过的服务直接返回
+        key = provider_cache.credentials_key("validcreds", base_url, "health")
+        if provider_cache.get_cached(key):
+            return True
+
         # 尝试调用健康检查接口
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{base_url.rstrip('/')}/health")
-                response.raise_for_status()
-                return True
+            client = self.http_client
+            response = client.get(f"{base_url.rstrip('/')}/health")
+            response.raise_for_status()
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to validate credentials: {str(e)}")
 
+        provider_cache.set_cached(key, True)
+        return True
+
     def get_available_models(self, credentials: ProviderCredentials) -> list[str]:
         """
         获取可用的模型列表
@@ -81,7 +116,7 @@ class TEIProvider(BaseEmbeddingProvider):
             ValueError: 参数错误
             httpx.HTTPError: 请求失败
         """
-        base_url = credentials.get("base_url")
+        base_url = credentials.credentials.get("base_url")
 
         if not base_url:
             raise ValueError("base_url is required")
@@ -89,33 +124,60 @@ class TEIProvider(BaseEmbeddingProvider):
         if not texts:
             raise ValueError("texts cannot be empty")
 
+        url = f"{base_url.rstrip('/')}/embed"
+        batch_size = credentials.credentials.get("batch_size")
+        batch_size = self.batch_size if batch_size is None else int(batch_size)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    f"{base_url.rstrip('/')}/embed",
-                    headers={"Content-Type": "application/json"},
-                    json={"inputs": texts},
-                )
-                response.raise_for_status()
-                embeddings = response.json()
-
-                # TEI 返回的是向量列表
-                # 计算 token 使用量（粗略估计：按字符数 / 4）
-                total_chars = sum(len(text) for text in texts)
-                estimated_tokens = total_chars // 4
-
-                return EmbeddingResult(
-                    model=model,
-                    embeddings=embeddings,
-                    usage=ModelUsage(
-                        prompt_tokens=estimated_tokens,
-                        completion_tokens=0,
-                        total_tokens=estimated_tokens,
-                    ),
-                )
+            if len(texts) <= batch_size:
+                embeddings = self._embed_batch(url, texts)
+            else:
+                # 超过单批上限时分批并发请求，executor.map 按提交顺序返回结果
+                batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+                embeddings = []
+                for batch_embeddings in self.executor.map(lambda batch: self._embed_batch(url, batch), batches):
+                    embeddings.extend(batch_embeddings)
         except httpx.HTTPError as e:
             raise ValueError(f"Failed to embed documents: {str(e)}")
 
+        # TEI 返回的是向量列表
+        # 计算 token 使用量（粗略估计：按字符数 / 4，sum(map(len)) 在 C 层完成累加）
+        estimated_tokens = sum(map(len, texts)) // 4
+
+        return EmbeddingResult(
+            model=model,
+            embeddings=embeddings,
+            usage=ModelUsage(
+                prompt_tokens=estimated_tokens,
+                completion_tokens=0,
+                total_tokens=estimated_tokens,
+            ),
+        )
+
+    def _embed_batch(self, url: str, texts: list[str]) -> list[list[float]]:
+        """
+        发送单个 /embed 请求
+
+        Args:
+            url: /embed 接口地址
+            texts: 本批文本
+
+        Returns:
+            list[list[float]]: 向量列表（与 texts 顺序一致）
+
+        Raises:
+            httpx.HTTPError: 请求失败
+        """
+        response = self.http_client.post(
+            url,
+            headers={"Content-Type": "application/json"},
+            content=orjson.dumps({"inputs": texts}),
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def embed_query(
         self,
         credentials: ProviderCredentials,
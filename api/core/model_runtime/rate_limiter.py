@@ -0,0 +1,132 @@
+"""
+LLM 请求限流
+
+基于 Redis 的令牌桶，按请求预估的 token 数计费
+"""
+
+import logging
+import random
+import time
+
+from extensions.ext_redis import redis_client
+from libs.errors import RateLimitedError
+
+logger = logging.getLogger(__name__)
+
+# 令牌桶脚本：按经过时间补充令牌后尝试扣除 cost
+# （cost 为负数时表示退还，force 为 1 时允许透支）
+# 返回 {是否成功, 令牌不足时需要等待的秒数}；
+# 使用 Redis 服务器时间，避免各 worker 时钟偏差
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local force = ARGV[4] == '1'
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local wait = 0
+if force or cost <= tokens then
+    tokens = math.min(capacity, tokens - cost)
+    allowed = 1
+else
+    wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return {allowed, tostring(wait)}
+"""
+
+
+class TokenBucketLimiter:
+    """
+    Redis 令牌桶限流器
+
+    同一个桶（如同一 API Key + 模型）在所有 worker 之间共享额度；
+    令牌不足时按抖动指数退避重试，仍不足则抛出 RateLimitedError。
+    Redis 不可用时放行请求，不影响正常调用
+    """
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.2, max_delay: float = 5.0):
+        """
+        初始化
+
+        Args:
+            max_retries: 令牌不足时的最大重试次数
+            base_delay: 首次退避时间（秒）
+            max_delay: 单次退避上限（秒）
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._script = None
+
+    def _consume(self, key: str, capacity: int, cost: float, force: bool = False) -> tuple[bool, float]:
+        """
+        执行一次令牌桶脚本
+
+        Args:
+            key: 桶的键
+            capacity: 每分钟令牌数（同时作为桶容量）
+            cost: 扣除的令牌数（负数表示退还）
+            force: 令牌不足时是否仍然扣除（允许透支）
+
+        Returns:
+            tuple[bool, float]: (是否成功, 需要等待的秒数)
+        """
+        if self._script is None:
+            self._script = redis_client.client.register_script(_TOKEN_BUCKET_SCRIPT)
+        allowed, wait = self._script(keys=[key], args=[capacity, capacity / 60, cost, int(force)])
+        return bool(allowed), float(wait)
+
+    def acquire(self, key: str, capacity: int, cost: int) -> int:
+        """
+        申请令牌
+
+        Args:
+            key: 桶的键
+            capacity: 每分钟令牌数
+            cost: 本次请求预估消耗的 token 数（超过容量时按容量计）
+
+        Returns:
+            int: 实际扣除的令牌数（调用方按实际用量修正时以此为基准）
+
+        Raises:
+            RateLimitedError: 重试后令牌仍不足
+        """
+        cost = min(cost, capacity)
+        for attempt in range(self.max_retries + 1):
+            try:
+                allowed, wait = self._consume(key, capacity, cost)
+            except Exception as e:
+                logger.warning("Rate limiter unavailable, request allowed: %s", e)
+                return cost
+            if allowed:
+                return cost
+            if attempt < self.max_retries:
+                delay = min(max(wait, self.base_delay * 2**attempt), self.max_delay)
+                time.sleep(delay * random.uniform(0.5, 1.0))
+        raise RateLimitedError("Model rate limit exceeded, please retry later")
+
+    def adjust(self, key: str, capacity: int, delta: int) -> None:
+        """
+        按实际用量修正已扣除的令牌（失败时忽略）
+
+        Args:
+            key: 桶的键
+            capacity: 每分钟令牌数
+            delta: 实际用量与预估值之差（正数补扣，负数退还）
+        """
+        if not delta:
+            return
+        try:
+            self._consume(key, capacity, delta, force=True)
+        except Exception as e:
+            logger.warning("Rate limiter adjust failed: %s", e)
+
+
+llm_rate_limiter = TokenBucketLimiter()
@@ -0,0 +1,109 @@
+"""
+SSE 增量解码器
+
+直接在字节流上切分 Server-Sent Events，只返回各事件的 data 字段
+"""
+
+from typing import Iterable, Iterator, Optional
+
+
+class SSEDecoder:
+    """
+    字节级 SSE 解码器
+
+    接收的字节块追加到内部 bytearray，每次只从上次扫描位置（回退 1 字节，
+    兼容分隔符跨块的情况）向后查找事件分隔符 b"\\n\\n"，避免重复扫描整个缓冲区；
+    CRLF 换行在写入缓冲区前统一为 LF
+    """
+
+    __slots__ = ("_buf", "_scan_pos", "_pending_cr")
+
+    def __init__(self):
+        """初始化"""
+        self._buf = bytearray()
+        self._scan_pos = 0
+        self._pending_cr = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """
+        写入一个字节块，返回其中已完整的事件
+
+        Args:
+            chunk: 响应字节块
+
+        Returns:
+            list[bytes]: 各事件的 data 字段（多行 data 以 b"\\n" 连接）
+        """
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+            self._pending_cr = False
+        if b"\r" in chunk:
+            # 块末尾的 \r 可能与下一块开头的 \n 组成 CRLF，留到下次处理
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                self._pending_cr = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        buf = self._buf
+        buf.extend(chunk)
+        events = []
+        start = max(self._scan_pos - 1, 0)
+        while True:
+            idx = buf.find(b"\n\n", start)
+            if idx < 0:
+                self._scan_pos = len(buf)
+                return events
+            data = self._parse_event(bytes(buf[:idx]))
+            del buf[: idx + 2]
+            start = 0
+            if data is not None:
+                events.append(data)
+
+    def flush(self) -> Optional[bytes]:
+        """
+        流结束时处理缓冲区中未以空行结尾的最后一个事件
+
+        Returns:
+            Optional[bytes]: 事件的 data 字段；没有剩余事件时返回 None
+        """
+        data = self._parse_event(bytes(self._buf))
+        self._buf.clear()
+        self._scan_pos = 0
+        self._pending_cr = False
+        return data
+
+    @staticmethod
+    def _parse_event(event: bytes) -> Optional[bytes]:
+        """
+        提取事件的 data 字段，忽略注释行和其他字段
+
+        Args:
+            event: 单个事件的原始字节（不含分隔空行）
+
+        Returns:
+            Optional[bytes]: data 字段；事件不含 data 时返回 None
+        """
+        parts = []
+        for line in event.split(b"\n"):
+            if line.startswith(b"data:"):
+                value = line[5:]
+                parts.append(value[1:] if value.startswith(b" ") else value)
+        return b"\n".join(parts) if parts else None
+
+
+def iter_sse_data(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    逐个返回字节流中各事件的 data 字段
+
+    Args:
+        chunks: 响应字节块迭代器（如 httpx.Response.iter_bytes()）
+
+    Yields:
+        bytes: 事件的 data 字段
+    """
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    data = decoder.flush()
+    if data is not None:
+        yield data
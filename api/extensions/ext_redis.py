@@ -12,6 +12,7 @@ class RedisClient:
     """Redis 客户端包装类"""
     
     def __init__(self):
+        self._pool: Optional[redis.BlockingConnectionPool] = None
         self._client: Optional[redis.Redis] = None
     
     def init_app(self, app: Flask) -> None:
@@ -21,19 +22,27 @@ class RedisClient:
         参数:
             app: Flask 应用实例
         """
-        redis_config = {
+        pool_config = {
             'host': app.config['REDIS_HOST'],
             'port': app.config['REDIS_PORT'],
             'db': app.config['REDIS_DB'],
-            'decode_responses': True,
+            'max_connections': app.config.get('REDIS_MAX_CONNECTIONS', 50),
+            # 返回原始 bytes，缓存的响应体可直接写回 HTTP 响应，省去解码/编码
+            'decode_responses': False,
             'socket_connect_timeout': 5,
             'socket_keepalive': True,
+            # 连接池耗尽时等待空闲连接的最长时间（秒），超时抛出 ConnectionError
+            'timeout': app.config.get('REDIS_POOL_TIMEOUT', 5),
         }
         
         if app.config['REDIS_PASSWORD']:
-            redis_config['password'] = app.config['REDIS_PASSWORD']
+            pool_config['password'] = app.config['REDIS_PASSWORD']
         
-        self._client = redis.Redis(**redis_config)
+        # 进程内共享一个连接池；使用阻塞连接池，gevent 下并发协程较多时
+        # 连接数仍以 max_connections 为上限，而不是耗尽后直接报错
+        # 安装 hiredis 后 redis-py 自动使用其 C 解析器
+        self._pool = redis.BlockingConnectionPool(**pool_config)
+        self._client = redis.Redis(connection_pool=self._pool)
     
     @property
     def client(self) -> redis.Redis:
@@ -42,7 +51,7 @@ class RedisClient:
             raise RuntimeError('Redis client not initialized')
         return self._client
     
-    def get(self, key: str) -> Optional[str]:
+    def get(self, key: str) -> Optional[bytes]:
         """获取键值"""
         return self.client.get(key)
     
@@ -51,8 +60,8 @@ class RedisClient:
         return self.client.set(key, value, ex=ex)
     
     def delete(self, *keys: str) -> int:
-        """删除键"""
-        return self.client.delete(*keys)
+        """删除键（使用 UNLINK，值的内存由 Redis 后台线程回收，不阻塞其他命令）"""
+        return self.client.unlink(*keys)
     
     def exists(self, *keys: str) -> int:
         """检查键是否存在"""
@@ -3,11 +3,16 @@
 
 文件存储抽象层
 """
+import io
 import os
+import shutil
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional
+from typing import BinaryIO, Iterator, Optional
 from flask import Flask
 
+# 流式读写的块大小（1 MiB），单个文件的内存占用与文件大小无关
+CHUNK_SIZE = 1024 * 1024
+
 
 class Storage(ABC):
     """存储抽象基类"""
@@ -22,6 +27,11 @@ class Storage(ABC):
         """加载文件"""
         pass
     
+    @abstractmethod
+    def load_stream(self, filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """分块加载文件"""
+        pass
+    
     @abstractmethod
     def delete(self, filename: str) -> bool:
         """删除文件"""
@@ -46,16 +56,62 @@ class LocalStorage(Storage):
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
         with open(filepath, 'wb') as f:
-            f.write(data.read())
+            if not self._sendfile(data, f):
+                shutil.copyfileobj(data, f, CHUNK_SIZE)
         
         return filepath
     
+    @staticmethod
+    def _sendfile(src: BinaryIO, dst: BinaryIO) -> bool:
+        """
+        源数据是磁盘文件时用 os.sendfile 在内核中直接复制
+        
+        参数:
+            src: 源文件对象（从当前位置开始复制）
+            dst: 目标文件对象
+            
+        返回:
+            是否已完成复制；不支持时返回 False，由调用方回退到分块复制
+        """
+        # 只处理真实打开的文件；SpooledTemporaryFile 等调用 fileno() 会先把内存数据落盘
+        if not hasattr(os, 'sendfile') or not isinstance(src, (io.FileIO, io.BufferedReader, io.BufferedRandom)):
+            return False
+        try:
+            in_fd = src.fileno()
+            offset = src.tell()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return False
+        
+        end = os.fstat(in_fd).st_size
+        out_fd = dst.fileno()
+        start = offset
+        try:
+            while offset < end:
+                sent = os.sendfile(out_fd, in_fd, offset, min(end - offset, CHUNK_SIZE * 16))
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset != start:
+                raise
+            return False
+        
+        src.seek(offset)
+        return True
+    
     def load(self, filename: str) -> bytes:
         """从本地加载文件"""
         filepath = os.path.join(self.base_path, filename)
         with open(filepath, 'rb') as f:
             return f.read()
     
+    def load_stream(self, filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """从本地分块加载文件，适用于流式响应等不需要完整内容的场景"""
+        filepath = os.path.join(self.base_path, filename)
+        with open(filepath, 'rb') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+    
     def delete(self, filename: str) -> bool:
         """删除本地文件"""
         filepath = os.path.join(self.base_path, filename)
@@ -6,13 +6,22 @@ Gunicorn 配置文件
 import os
 import multiprocessing
 
+# gevent worker 的协程并发依赖标准库 socket 被 patch。
+# preload_app 会在 master 中先导入应用（SQLAlchemy、redis、httpx），
+# 因此需在导入应用之前完成 monkey patch，否则这些库持有的是阻塞式 socket。
+# psycopg 3 通过 Python 层等待 libpq I/O，patch 后即可让出协程，无需 psycogreen
+from gevent import monkey
+
+monkey.patch_all()
+
 # 绑定地址和端口
 bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
 
 # Worker 配置
 workers = int(os.getenv('WORKERS', multiprocessing.cpu_count() * 2 + 1))
 worker_class = 'gevent'
-worker_connections = 1000
+# 每个 worker 可同时处理的协程数（DB/Redis 等待期间切换到其他请求）
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 1000))
 max_requests = 10000
 max_requests_jitter = 1000
 
@@ -33,9 +42,6 @@ proc_name = 'shadow-agents-api'
 # 预加载应用
 preload_app = True
 
-# 启用线程
-threads = 2
-
 def on_starting(server):
     """服务启动时的回调"""
     print("Gunicorn server is starting...")
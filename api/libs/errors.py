@@ -4,7 +4,11 @@
 定义 API 异常类
 """
 from typing import Optional, Dict, Any
-from flask import jsonify
+
+import orjson
+from flask import Response
+
+from libs.response import json_response, raw_json_response
 
 
 class APIException(Exception):
@@ -13,6 +17,14 @@ class APIException(Exception):
     code = 400
     message = 'Bad Request'
     
+    # 默认消息且无额外数据时的响应体，每个子类首次使用时序列化一次
+    _default_body: Optional[bytes] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        """子类定义新的默认消息或状态码时重置缓存的响应体"""
+        super().__init_subclass__(**kwargs)
+        cls._default_body = None
+    
     def __init__(self, message: Optional[str] = None, code: Optional[int] = None, data: Optional[Dict[str, Any]] = None):
         """
         初始化异常
@@ -29,15 +41,21 @@ class APIException(Exception):
         self.data = data or {}
         super().__init__(self.message)
     
-    def to_response(self):
+    def to_response(self) -> Response:
         """转换为 Flask Response"""
+        cls = type(self)
+        if not self.data and self.message == cls.message:
+            if cls._default_body is None:
+                cls._default_body = orjson.dumps({'error': cls.__name__, 'message': cls.message})
+            return raw_json_response(cls._default_body, self.code)
+        
         response = {
-            'error': self.__class__.__name__,
+            'error': cls.__name__,
             'message': self.message
         }
         if self.data:
             response['data'] = self.data
-        return jsonify(response), self.code
+        return json_response(response, self.code)
 
 
 class BadRequestError(APIException):
@@ -70,6 +88,12 @@ class ConflictError(APIException):
     message = 'Conflict'
 
 
+class RateLimitedError(APIException):
+    """429 请求过于频繁"""
+    code = 429
+    message = 'Too Many Requests'
+
+
 class InternalServerError(APIException):
     """500 服务器内部错误"""
     code = 500
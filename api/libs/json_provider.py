@@ -0,0 +1,30 @@
+"""
+JSON 提供者模块
+
+使用 orjson 解析请求体 JSON
+"""
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    基于 orjson 的 JSON 提供者
+
+    仅替换 loads（request.get_json 经由此方法解析请求体）；
+    dumps 保持 Flask 默认行为，jsonify 的输出格式不变
+    """
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """
+        解析 JSON
+
+        参数:
+            s: JSON 字符串或字节串
+
+        返回:
+            解析后的对象
+        """
+        return orjson.loads(s)
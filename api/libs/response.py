@@ -0,0 +1,54 @@
+"""
+响应工具模块
+
+基于 orjson 构建 JSON 响应
+"""
+from typing import Any
+
+import orjson
+from flask import Response
+
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    构建 JSON 响应
+
+    orjson 原生支持 UUID 和 datetime，调用方无需再手动 str()/isoformat()
+
+    参数:
+        payload: 可被 orjson 序列化的对象
+        status: HTTP 状态码
+
+    返回:
+        Flask Response
+    """
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+def raw_json_response(body: bytes, status: int = 200) -> Response:
+    """
+    使用已序列化的 JSON 响应体构建响应
+
+    参数:
+        body: JSON 字节串
+        status: HTTP 状态码
+
+    返回:
+        Flask Response
+    """
+    return Response(body, status=status, mimetype="application/json")
+
+
+def error_response(message: str, code: str, status: int) -> Response:
+    """
+    构建错误响应，格式与全局错误处理器一致
+
+    参数:
+        message: 错误消息
+        code: 错误代码
+        status: HTTP 状态码
+
+    返回:
+        Flask Response
+    """
+    return json_response({"error": message, "code": code}, status)
@@ -0,0 +1,187 @@
+"""
+SIEVE 缓存模块
+
+按条目数限制容量的线程安全进程内缓存，条目带过期时间
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+
+class _Node:
+    """缓存链表节点"""
+
+    __slots__ = ('key', 'value', 'expires_at', 'visited', 'prev', 'next')
+
+    def __init__(self, key: Hashable, value: Any, expires_at: float):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        self.visited = False
+        self.prev: Optional['_Node'] = None
+        self.next: Optional['_Node'] = None
+
+
+class SieveCache:
+    """
+    SIEVE 淘汰策略缓存
+
+    新条目插入链表头部，命中时只设置 visited 标记（不移动节点）；
+    容量满时指针从尾部向头部扫描，清除沿途 visited 标记并淘汰第一个未访问的条目。
+    相比 LRU，读操作不需要调整链表，淘汰的均摊复杂度为 O(1)
+
+    指定 group 时按值维护分组索引（分组键 -> 条目键集合），
+    delete_group 只访问该分组的条目，不扫描整个缓存
+    """
+
+    def __init__(self, maxsize: int, ttl: float, group: Optional[Callable[[Any], Hashable]] = None):
+        """
+        初始化
+
+        参数:
+            maxsize: 最大条目数（不大于 0 时不缓存任何条目）
+            ttl: 条目最长存活时间（秒）
+            group: 由值计算分组键的函数，不指定时不维护分组索引
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._group = group
+        self._groups: Dict[Hashable, Set[Hashable]] = {}
+        self._data: Dict[Hashable, _Node] = {}
+        self._head: Optional[_Node] = None
+        self._tail: Optional[_Node] = None
+        self._hand: Optional[_Node] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        读取缓存
+
+        参数:
+            key: 键
+
+        返回:
+            值；不存在或已过期时返回 None
+        """
+        with self._lock:
+            node = self._data.get(key)
+            if node is None:
+                return None
+            if node.expires_at <= time.time():
+                self._remove(node)
+                return None
+            node.visited = True
+            return node.value
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None) -> None:
+        """
+        写入缓存
+
+        参数:
+            key: 键
+            value: 值
+            expires_at: 过期时间戳，不会晚于当前时间 + ttl
+        """
+        if self.maxsize <= 0:
+            return
+
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+
+        with self._lock:
+            node = self._data.get(key)
+            if node is not None:
+                self._ungroup(node)
+                node.value = value
+                node.expires_at = deadline
+                node.visited = True
+                self._regroup(node)
+                return
+
+            if len(self._data) >= self.maxsize:
+                self._evict()
+
+            node = _Node(key, value, deadline)
+            node.next = self._head
+            if self._head is not None:
+                self._head.prev = node
+            self._head = node
+            if self._tail is None:
+                self._tail = node
+            self._data[key] = node
+            self._regroup(node)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        删除条目（不存在时忽略）
+
+        参数:
+            key: 键
+        """
+        with self._lock:
+            node = self._data.get(key)
+            if node is not None:
+                self._remove(node)
+
+    def delete_group(self, group_key: Hashable) -> None:
+        """
+        删除分组内的所有条目（分组不存在时忽略）
+
+        参数:
+            group_key: 分组键
+        """
+        with self._lock:
+            for key in list(self._groups.get(group_key, ())):
+                self._remove(self._data[key])
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._data.clear()
+            self._groups.clear()
+            self._head = self._tail = self._hand = None
+
+    def _evict(self) -> None:
+        """淘汰一个条目（调用方需持有锁）"""
+        node = self._hand or self._tail
+        while node.visited:
+            node.visited = False
+            node = node.prev or self._tail
+        self._hand = node.prev
+        self._remove(node)
+
+    def _remove(self, node: _Node) -> None:
+        """从链表和索引中移除节点（调用方需持有锁）"""
+        if self._hand is node:
+            self._hand = node.prev
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+        node.prev = node.next = None
+        del self._data[node.key]
+        self._ungroup(node)
+
+    def _regroup(self, node: _Node) -> None:
+        """将节点加入分组索引（调用方需持有锁）"""
+        if self._group is not None:
+            self._groups.setdefault(self._group(node.value), set()).add(node.key)
+
+    def _ungroup(self, node: _Node) -> None:
+        """将节点移出分组索引（调用方需持有锁）"""
+        if self._group is None:
+            return
+        group_key = self._group(node.value)
+        keys = self._groups.get(group_key)
+        if keys is not None:
+            keys.discard(node.key)
+            if not keys:
+                del self._groups[group_key]
@@ -0,0 +1,49 @@
+"""
+UUIDv7 生成模块
+
+按 RFC 9562 生成时间有序的 UUID，用作主键时插入集中在 B-tree 索引末尾
+"""
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_ms = 0
+_last_seq = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    生成 UUIDv7
+
+    布局为 48 位毫秒时间戳 + 4 位版本 + 12 位 rand_a + 2 位变体 + 62 位 rand_b。
+    同一毫秒内 rand_a 作为计数器递增（起始值随机），保证进程内生成的 ID 严格递增；
+    计数器溢出时借用下一毫秒
+
+    返回:
+        UUID 实例
+    """
+    global _last_ms, _last_seq
+
+    rand = int.from_bytes(os.urandom(10), 'big')
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms > _last_ms:
+            seq = (rand >> 64) & 0x7FF
+        else:
+            ms = _last_ms
+            seq = _last_seq + 1
+            if seq > 0xFFF:
+                ms += 1
+                seq = (rand >> 64) & 0x7FF
+        _last_ms, _last_seq = ms, seq
+
+    value = (
+        (ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | seq << 64
+        | 0b10 << 62
+        | rand & 0x3FFFFFFFFFFFFFFF
+    )
+    return uuid.UUID(int=value)
@@ -12,6 +12,7 @@ import uuid
 import enum
 
 from extensions.ext_database import db
+from libs.uuid7 import uuid7
 
 
 class AccountStatus(enum.Enum):
@@ -33,7 +34,7 @@ class Account(db.Model):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="用户 ID"
     )
     
@@ -4,14 +4,35 @@
 AI 应用的核心模型
 """
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
-from sqlalchemy import String, DateTime, Text, Boolean, Enum as SQLEnum
+from sqlalchemy import String, DateTime, Text, Boolean, Enum as SQLEnum, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import uuid
 import enum
 
 from extensions.ext_database import db
+from libs.uuid7 import uuid7
+from models.types import JSONVariant
+
+# 视图字段：摘要字段用于列表接口，完整字段用于详情/创建/更新
+_SUMMARY_VIEW_FIELDS = ("id", "name", "mode", "icon", "icon_background", "status")
+_VIEW_FIELDS = (
+    "id",
+    "name",
+    "mode",
+    "description",
+    "icon",
+    "icon_background",
+    "status",
+    "enable_site",
+    "enable_api",
+    "created_at",
+    "updated_at",
+)
+_get_summary_view_fields = attrgetter(*_SUMMARY_VIEW_FIELDS)
+_get_view_fields = attrgetter(*_VIEW_FIELDS)
 
 
 class AppMode(enum.Enum):
@@ -40,7 +61,7 @@ class App(db.Model):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="应用 ID"
     )
     
@@ -140,6 +161,28 @@ class App(db.Model):
         cascade="all, delete-orphan"
     )
     
+    # 租户正常应用列表的部分覆盖索引：只收录正常状态的应用，并带上列表摘要所需的列，
+    # get_active_apps_by_tenant(summary_only=True) 可走仅索引扫描
+    # （SQLEnum 按枚举名存储，因此条件写作 'NORMAL'）
+    __table_args__ = (
+        db.Index(
+            "ix_apps_tenant_active",
+            "tenant_id",
+            postgresql_where=text("status = 'NORMAL'"),
+            postgresql_include=["id", "name", "mode", "icon", "icon_background"],
+        ),
+        # 同一租户内正常应用的名称唯一（不区分大小写），同时支持按名称查找；
+        # 已归档的应用不占用名称。已有数据库的迁移见 scripts/migration/uq_apps_tenant_lower_name.sql
+        db.Index(
+            "uq_apps_tenant_lower_name",
+            "tenant_id",
+            text("lower(name)"),
+            unique=True,
+            postgresql_where=text("status = 'NORMAL'"),
+            sqlite_where=text("status = 'NORMAL'"),
+        ),
+    )
+    
     def __repr__(self) -> str:
         """字符串表示"""
         return f"<App {self.name} mode={self.mode.value}>"
@@ -173,6 +216,22 @@ class App(db.Model):
         
         return result
     
+    def to_view_dict(self, summary: bool = False) -> dict:
+        """
+        转换为接口响应字典
+        
+        与 to_dict 不同，UUID/datetime/枚举保持原始对象，由 orjson 直接编码
+        
+        参数:
+            summary: 是否只返回列表摘要字段
+            
+        返回:
+            应用信息字典
+        """
+        if summary:
+            return dict(zip(_SUMMARY_VIEW_FIELDS, _get_summary_view_fields(self)))
+        return dict(zip(_VIEW_FIELDS, _get_view_fields(self)))
+    
     @property
     def is_active(self) -> bool:
         """是否为正常状态"""
@@ -191,7 +250,7 @@ class AppModelConfig(db.Model):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         comment="配置 ID"
     )
     
@@ -217,7 +276,7 @@ class AppModelConfig(db.Model):
         comment="模型名称"
     )
     configs: Mapped[dict] = mapped_column(
-        db.JSON,
+        JSONVariant,
         nullable=False,
         default=dict,
         comment="模型参数配置"
@@ -230,7 +289,7 @@ class AppModelConfig(db.Model):
         comment="开场白"
     )
     suggested_questions: Mapped[Optional[list]] = mapped_column(
-        db.JSON,
+        JSONVariant,
         nullable=True,
         comment="建议问题列表"
     )
@@ -240,7 +299,7 @@ class AppModelConfig(db.Model):
         comment="系统提示词"
     )
     user_input_form: Mapped[Optional[dict]] = mapped_column(
-        db.JSON,
+        JSONVariant,
         nullable=True,
         comment="用户输入表单配置"
     )
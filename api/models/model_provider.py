@@ -2,17 +2,20 @@
 模型提供商配置模型
 """
 
-import json
 import uuid
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, String, Text
+import orjson
+from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from extensions.ext_database import db
+from libs.uuid7 import uuid7
+from models.types import JSONVariant
 
 
 class ProviderType(str, Enum):
@@ -22,12 +25,27 @@ class ProviderType(str, Enum):
     TEI = "tei"
 
 
+# 视图字段：基础字段用于状态类接口（激活/停用），完整字段用于详情/创建/更新
+_VIEW_FIELDS = ("id", "name", "is_active", "updated_at")
+_FULL_VIEW_FIELDS = _VIEW_FIELDS + (
+    "tenant_id",
+    "provider_type",
+    "config",
+    "quota_config",
+    "created_by",
+    "updated_by",
+    "created_at",
+)
+_get_view_fields = attrgetter(*_VIEW_FIELDS)
+_get_full_view_fields = attrgetter(*_FULL_VIEW_FIELDS)
+
+
 class ModelProvider(db.Model):
     """模型提供商配置模型"""
 
     __tablename__ = "model_providers"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tenant_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tenants.id"), nullable=False, index=True
     )
@@ -35,8 +53,8 @@ class ModelProvider(db.Model):
     provider_type: Mapped[ProviderType] = mapped_column(SQLEnum(ProviderType), nullable=False, index=True)
     encrypted_credentials: Mapped[str] = mapped_column(Text, nullable=False)  # 加密后的凭证 JSON
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True, index=True)
-    config: Mapped[dict] = mapped_column(JSON, nullable=True)  # 额外配置（如默认模型、超时等）
-    quota_config: Mapped[dict] = mapped_column(JSON, nullable=True)  # 配额配置
+    config: Mapped[dict] = mapped_column(JSONVariant, nullable=True)  # 额外配置（如默认模型、超时等）
+    quota_config: Mapped[dict] = mapped_column(JSONVariant, nullable=True)  # 配额配置
     created_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=True)
     updated_by: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
@@ -80,6 +98,26 @@ class ModelProvider(db.Model):
 
         return data
 
+    def to_view_dict(self, full: bool = False) -> dict:
+        """
+        转换为接口响应字典（不包含凭证）
+
+        与 to_dict 不同，UUID/datetime/枚举保持原始对象，由 orjson 直接编码
+
+        Args:
+            full: 是否返回完整字段（默认仅返回状态类接口所需的基础字段）
+
+        Returns:
+            dict: 响应字典
+        """
+        if full:
+            data = dict(zip(_FULL_VIEW_FIELDS, _get_full_view_fields(self)))
+            # 与 to_dict 一致，未设置的配置返回空字典而不是 null
+            data["config"] = data["config"] or {}
+            data["quota_config"] = data["quota_config"] or {}
+            return data
+        return dict(zip(_VIEW_FIELDS, _get_view_fields(self)))
+
     @staticmethod
     def encrypt_credentials(credentials: dict) -> str:
         """
@@ -94,8 +132,8 @@ class ModelProvider(db.Model):
         Note:
             这里暂时使用简单的 JSON 序列化，实际应该使用加密算法（如 Fernet）
         """
-        # TODO: 实现真正的加密逻辑
-        return json.dumps(credentials)
+        # TODO: 实现真正的加密逻辑（Fernet 实例应在模块级创建并复用）
+        return orjson.dumps(credentials).decode()
 
     @staticmethod
     def decrypt_credentials(encrypted_credentials: str) -> dict:
@@ -112,4 +150,4 @@ class ModelProvider(db.Model):
             这里暂时使用简单的 JSON 反序列化，实际应该使用解密算法（如 Fernet）
         """
         # TODO: 实现真正的解密逻辑
-        return json.loads(encrypted_credentials)
+        return orjson.loads(encrypted_credentials)
@@ -7,6 +7,7 @@
 import enum
 import uuid
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 
 from sqlalchemy import DateTime, String
@@ -15,6 +16,11 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from extensions.ext_database import db
+from libs.uuid7 import uuid7
+
+# 接口响应字段：按固定字段表一次性取值，避免逐字段构造字典
+_VIEW_FIELDS = ("id", "name", "plan", "status", "created_at", "updated_at")
+_get_view_fields = attrgetter(*_VIEW_FIELDS)
 
 
 class TenantPlan(enum.Enum):
@@ -43,7 +49,7 @@ class Tenant(db.Model):
     __tablename__ = "tenants"
 
     # 主键
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="租户 ID")
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, comment="租户 ID")
 
     # 基本信息
     name: Mapped[str] = mapped_column(String(100), nullable=False, comment="租户名称")
@@ -89,6 +95,17 @@ class Tenant(db.Model):
             "updated_at": self.updated_at.isoformat(),
         }
 
+    def to_view_dict(self) -> dict:
+        """
+        转换为接口响应字典
+
+        与 to_dict 不同，UUID/datetime/枚举保持原始对象，由 orjson 直接编码
+
+        返回:
+            租户信息字典
+        """
+        return dict(zip(_VIEW_FIELDS, _get_view_fields(self)))
+
     @property
     def is_active(self) -> bool:
         """是否为激活状态"""
@@ -113,7 +130,7 @@ class TenantAccountJoin(db.Model):
     __tablename__ = "tenant_account_joins"
 
     # 主键
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, comment="关联 ID")
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7, comment="关联 ID")
 
     # 外键
     tenant_id: Mapped[uuid.UUID] = mapped_column(
@@ -0,0 +1,9 @@
+"""
+通用列类型
+"""
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# PostgreSQL 下使用 JSONB（以解析后的二进制格式存储，读取和包含查询无需重新解析文本），
+# 其他数据库（如测试用的 SQLite）退回通用 JSON
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
@@ -3,9 +3,12 @@ Account Repository
 
 账户数据访问层
 """
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List
 from uuid import UUID
 
+from sqlalchemy import lambda_stmt, literal, select, update
+
+from core.auth.account_cache import invalidate_accounts
 from models.account import Account, AccountStatus
 from repositories.base_repository import BaseRepository
 
@@ -27,9 +30,10 @@ class AccountRepository(BaseRepository[Account]):
         返回:
             账户实例或 None
         """
-        return self.session.query(Account).filter(
-            Account.email == email
-        ).first()
+        # 登录热路径：lambda_stmt 按 lambda 代码位置缓存语句构造和编译结果，
+        # email 作为绑定参数传入
+        stmt = lambda_stmt(lambda: select(Account).where(Account.email == email).limit(1))
+        return self.session.execute(stmt).scalar_one_or_none()
     
     def get_active_accounts(self, limit: Optional[int] = None) -> List[Account]:
         """
@@ -64,6 +68,27 @@ class AccountRepository(BaseRepository[Account]):
             Account.status == status
         ).all()
     
+    def stream_by_status(self, status: AccountStatus, batch_size: int = 1000) -> Iterator[Account]:
+        """
+        逐批读取指定状态的账户（服务端游标，峰值内存只与 batch_size 有关）
+        
+        用于批量任务遍历大量账户；迭代期间会占用一个数据库连接，应尽快消费完
+        
+        参数:
+            status: 账户状态
+            batch_size: 每批从游标获取的行数
+            
+        返回:
+            账户迭代器
+        """
+        stmt = (
+            select(Account)
+            .where(Account.status == status)
+            .order_by(Account.id)
+            .execution_options(yield_per=batch_size)
+        )
+        yield from self.session.scalars(stmt)
+    
     def email_exists(self, email: str) -> bool:
         """
         检查邮箱是否已存在
@@ -74,15 +99,13 @@ class AccountRepository(BaseRepository[Account]):
         返回:
             是否存在
         """
-        return self.session.query(
-            self.session.query(Account).filter(
-                Account.email == email
-            ).exists()
-        ).scalar()
+        return self.session.execute(
+            select(literal(1)).where(Account.email == email).limit(1)
+        ).scalar() is not None
     
     def update_status(self, id: UUID, status: AccountStatus) -> Optional[Account]:
         """
-        更新账户状态
+        更新账户状态（同时删除该账户的认证缓存，状态变化对下一个请求生效）
         
         参数:
             id: 账户 ID
@@ -91,7 +114,31 @@ class AccountRepository(BaseRepository[Account]):
         返回:
             更新后的账户或 None
         """
-        return self.update(id, status=status)
+        account = self.update(id, status=status)
+        invalidate_accounts([id])
+        return account
+    
+    def bulk_update_status(self, ids: Iterable[UUID], status: AccountStatus) -> int:
+        """
+        批量更新账户状态（单条 UPDATE 语句，同时删除这些账户的认证缓存）
+        
+        参数:
+            ids: 账户 ID 列表
+            status: 新状态
+            
+        返回:
+            更新的记录数
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        
+        result = self._execute(
+            update(Account).where(Account.id.in_(ids)).values(status=status)
+        )
+        self._commit()
+        invalidate_accounts(ids)
+        return result.rowcount
     
     def ban_account(self, id: UUID) -> Optional[Account]:
         """
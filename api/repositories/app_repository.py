@@ -3,12 +3,24 @@ App Repository
 
 应用数据访问层
 """
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
 
+from sqlalchemy import func, select
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+from libs.uuid7 import uuid7
 from models.app import App, AppMode, AppStatus, AppModelConfig
 from repositories.base_repository import BaseRepository
 
+# 列表摘要所需的列，列表查询只取这些列，避免读取描述等较大字段
+_SUMMARY_COLUMNS = (App.id, App.name, App.mode, App.icon, App.icon_background, App.status)
+
+# 完整列表用 selectinload 一次取回所有应用的模型配置（共 2 条查询），
+# 避免 to_dict 逐个懒加载 model_config；其余关系禁止懒加载，访问时直接报错
+_FULL_LIST_OPTIONS = (selectinload(App.model_config), raiseload('*'))
+
 
 class AppRepository(BaseRepository[App]):
     """应用 Repository"""
@@ -17,34 +29,86 @@ class AppRepository(BaseRepository[App]):
         """初始化"""
         super().__init__(App)
     
-    def get_by_tenant(self, tenant_id: UUID) -> List[App]:
+    def get_by_tenant(self, tenant_id: UUID, summary_only: bool = False) -> List[App]:
         """
         获取租户的所有应用
         
         参数:
             tenant_id: 租户 ID
+            summary_only: 是否只加载列表摘要所需的列
             
         返回:
             应用列表
         """
-        return self.session.query(App).filter(
+        query = self.session.query(App).filter(
             App.tenant_id == tenant_id
-        ).all()
+        )
+        if summary_only:
+            query = query.options(load_only(*_SUMMARY_COLUMNS), raiseload('*'))
+        else:
+            query = query.options(*_FULL_LIST_OPTIONS)
+        return query.all()
     
-    def get_active_apps_by_tenant(self, tenant_id: UUID) -> List[App]:
+    def get_active_apps_by_tenant(self, tenant_id: UUID, summary_only: bool = False) -> List[App]:
         """
         获取租户的所有正常状态应用
         
         参数:
             tenant_id: 租户 ID
+            summary_only: 是否只加载列表摘要所需的列
             
         返回:
             应用列表
         """
-        return self.session.query(App).filter(
+        query = self.session.query(App).filter(
             App.tenant_id == tenant_id,
             App.status == AppStatus.NORMAL
-        ).all()
+        )
+        if summary_only:
+            query = query.options(load_only(*_SUMMARY_COLUMNS), raiseload('*'))
+        else:
+            query = query.options(*_FULL_LIST_OPTIONS)
+        return query.all()
+    
+    def get_tenant_apps_stamp(self, tenant_id: UUID, include_archived: bool = False) -> Tuple[int, Optional[datetime]]:
+        """
+        获取租户应用列表的版本戳（应用数量与最近更新时间）
+
+        只执行一次聚合查询，用于判断列表是否发生变化
+
+        参数:
+            tenant_id: 租户 ID
+            include_archived: 是否包含已归档的应用
+
+        返回:
+            (应用数量, 最近更新时间)
+        """
+        query = self.session.query(func.count(App.id), func.max(App.updated_at)).filter(
+            App.tenant_id == tenant_id
+        )
+        if not include_archived:
+            query = query.filter(App.status == AppStatus.NORMAL)
+        count, last_updated = query.one()
+        return count, last_updated
+    
+    def get_by_tenant_and_name(self, tenant_id: UUID, name: str) -> Optional[App]:
+        """
+        根据名称获取租户的正常应用（不区分大小写，使用 uq_apps_tenant_lower_name 索引）
+        
+        参数:
+            tenant_id: 租户 ID
+            name: 应用名称
+            
+        返回:
+            应用实例或 None
+        """
+        return self.session.execute(
+            select(App).where(
+                App.tenant_id == tenant_id,
+                func.lower(App.name) == func.lower(name),
+                App.status == AppStatus.NORMAL,
+            ).limit(1)
+        ).scalar_one_or_none()
     
     def get_by_mode(self, mode: AppMode) -> List[App]:
         """
@@ -56,7 +120,7 @@ class AppRepository(BaseRepository[App]):
         返回:
             应用列表
         """
-        return self.session.query(App).filter(
+        return self.session.query(App).options(*_FULL_LIST_OPTIONS).filter(
             App.mode == mode
         ).all()
     
@@ -70,7 +134,7 @@ class AppRepository(BaseRepository[App]):
         返回:
             应用列表
         """
-        return self.session.query(App).filter(
+        return self.session.query(App).options(*_FULL_LIST_OPTIONS).filter(
             App.status == status
         ).all()
     
@@ -129,17 +193,16 @@ class AppRepository(BaseRepository[App]):
         返回:
             创建的应用实例
         """
-        # 创建应用
-        app = App(**app_data)
+        # 在客户端生成应用 ID，配置可直接引用，无需先 flush 一次获取 app.id；
+        # 两条 INSERT 在同一次提交中按外键依赖顺序执行
+        app = App(**{'id': uuid7(), **app_data})
         self.session.add(app)
-        self.session.flush()  # 获取 app.id
         
         # 创建模型配置
         if config_data:
-            config = AppModelConfig(app_id=app.id, **config_data)
-            self.session.add(config)
+            self.session.add(AppModelConfig(app_id=app.id, **config_data))
         
-        self.session.commit()
+        self._commit()
         self.session.refresh(app)
         return app
     
@@ -182,9 +245,11 @@ class AppRepository(BaseRepository[App]):
         返回:
             应用数量
         """
-        return self.session.query(App).filter(
-            App.tenant_id == tenant_id
-        ).count()
+        # 直接 SELECT count(id)，不像 Query.count() 那样包一层 SELECT * 子查询，
+        # 可只扫描 tenant_id 索引
+        return self.session.execute(
+            select(func.count(App.id)).where(App.tenant_id == tenant_id)
+        ).scalar_one()
     
     def enable_site(self, id: UUID, enable: bool = True) -> Optional[App]:
         """
@@ -3,10 +3,12 @@
 
 提供通用的 CRUD 操作
 """
-from typing import Generic, TypeVar, Type, Optional, List
+from typing import Any, Dict, Generic, TypeVar, Type, Optional, List
 from uuid import UUID
 
+from sqlalchemy import insert, inspect, literal, select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 from extensions.ext_database import db
 
 # 泛型类型变量
@@ -29,6 +31,12 @@ class BaseRepository(Generic[T]):
         """
         self.model = model
         self.session: Session = db.session
+        # update() 可写的字段：映射的列属性，不含主键（排除关系、方法等其他类属性）
+        mapper = inspect(model)
+        self._updatable_keys = frozenset(
+            attr.key for attr in mapper.column_attrs
+            if not any(column.primary_key for column in attr.columns)
+        )
     
     def create(self, **kwargs) -> T:
         """
@@ -42,10 +50,60 @@ class BaseRepository(Generic[T]):
         """
         instance = self.model(**kwargs)
         self.session.add(instance)
-        self.session.commit()
+        self._commit()
         self.session.refresh(instance)
         return instance
     
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        批量创建记录（executemany 单次提交，不逐条构造和刷新 ORM 实例）
+        
+        参数:
+            rows: 每条记录的字段字典
+            
+        返回:
+            插入的记录数
+        """
+        if not rows:
+            return 0
+        
+        self._execute(insert(self.model), rows)
+        self._commit()
+        return len(rows)
+    
+    def _execute(self, statement: Any, params: Any = None) -> Any:
+        """
+        执行语句，失败（如违反唯一约束）时回滚，会话可继续使用
+        
+        参数:
+            statement: SQLAlchemy 语句
+            params: 绑定参数（字典，或 executemany 的字典列表）
+            
+        返回:
+            执行结果
+            
+        抛出:
+            sqlalchemy.exc.SQLAlchemyError: 执行失败
+        """
+        try:
+            return self.session.execute(statement, params)
+        except Exception:
+            self.session.rollback()
+            raise
+    
+    def _commit(self) -> None:
+        """
+        提交事务，失败（如违反唯一约束）时回滚，会话可继续使用
+        
+        抛出:
+            sqlalchemy.exc.SQLAlchemyError: 提交失败
+        """
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+    
     def get_by_id(self, id: UUID) -> Optional[T]:
         """
         根据 ID 获取记录
@@ -56,9 +114,8 @@ class BaseRepository(Generic[T]):
         返回:
             模型实例或 None
         """
-        return self.session.query(self.model).filter(
-            self.model.id == id
-        ).first()
+        # 按主键获取：会话标识映射中已有该实例时直接返回，不发出查询
+        return self.session.get(self.model, id)
     
     def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[T]:
         """
@@ -82,25 +139,39 @@ class BaseRepository(Generic[T]):
     
     def update(self, id: UUID, **kwargs) -> Optional[T]:
         """
-        更新记录
+        更新记录（UPDATE ... RETURNING 一条语句完成，返回的实例属性已加载）
         
         参数:
             id: 记录 ID
-            **kwargs: 要更新的字段和值
+            **kwargs: 要更新的字段和值（非列字段和主键被忽略）
             
         返回:
             更新后的模型实例或 None
         """
-        instance = self.get_by_id(id)
-        if not instance:
-            return None
+        values = {key: value for key, value in kwargs.items() if key in self._updatable_keys}
+        if not values:
+            return self.get_by_id(id)
         
-        for key, value in kwargs.items():
-            if hasattr(instance, key):
-                setattr(instance, key, value)
+        # 单条 UPDATE ... RETURNING，省去先查询再刷新的往返；
+        # populate_existing 使标识映射中已有的实例也使用 RETURNING 取回的值
+        instance = self._execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+        if instance is None:
+            self._commit()
+            return None
         
-        self.session.commit()
-        self.session.refresh(instance)
+        # 提交会使实例的属性过期，首次读取时重新 SELECT；
+        # 提交成功后将 RETURNING 取回的列值写回为已提交状态，不再发出查询
+        state = inspect(instance)
+        returned = {attr.key: state.dict[attr.key] for attr in state.mapper.column_attrs if attr.key in state.dict}
+        self._commit()
+        for key, value in returned.items():
+            set_committed_value(instance, key, value)
         return instance
     
     def delete(self, id: UUID) -> bool:
@@ -140,8 +211,7 @@ class BaseRepository(Generic[T]):
         返回:
             是否存在
         """
-        return self.session.query(
-            self.session.query(self.model).filter(
-                self.model.id == id
-            ).exists()
-        ).scalar()
+        # SELECT 1 ... LIMIT 1，编译结果由 SQLAlchemy 语句缓存复用
+        return self.session.execute(
+            select(literal(1)).where(self.model.id == id).limit(1)
+        ).scalar() is not None
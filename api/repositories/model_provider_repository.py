@@ -5,9 +5,24 @@
 import uuid
 from typing import Optional
 
+from sqlalchemy.orm import load_only
+
 from models import ModelProvider, ProviderType
 from repositories.base_repository import BaseRepository
 
+# 列表摘要所需的列，不读取加密凭证等字段
+_SUMMARY_COLUMNS = (
+    ModelProvider.id,
+    ModelProvider.tenant_id,
+    ModelProvider.name,
+    ModelProvider.provider_type,
+    ModelProvider.is_active,
+    ModelProvider.config,
+    ModelProvider.quota_config,
+    ModelProvider.created_at,
+    ModelProvider.updated_at,
+)
+
 
 class ModelProviderRepository(BaseRepository[ModelProvider]):
     """模型提供商配置仓储"""
@@ -15,13 +30,16 @@ class ModelProviderRepository(BaseRepository[ModelProvider]):
     def __init__(self):
         super().__init__(ModelProvider)
 
-    def get_by_tenant_id(self, tenant_id: uuid.UUID, include_inactive: bool = False) -> list[ModelProvider]:
+    def get_by_tenant_id(
+        self, tenant_id: uuid.UUID, include_inactive: bool = False, summary_only: bool = False
+    ) -> list[ModelProvider]:
         """
         根据租户 ID 获取提供商配置列表
 
         Args:
             tenant_id: 租户 ID
             include_inactive: 是否包含未激活的配置
+            summary_only: 是否只加载列表摘要所需的列
 
         Returns:
             list[ModelProvider]: 提供商配置列表
@@ -31,10 +49,17 @@ class ModelProviderRepository(BaseRepository[ModelProvider]):
         if not include_inactive:
             query = query.filter(ModelProvider.is_active == True)
 
+        if summary_only:
+            query = query.options(load_only(*_SUMMARY_COLUMNS))
+
         return query.order_by(ModelProvider.created_at.desc()).all()
 
     def get_by_tenant_and_type(
-        self, tenant_id: uuid.UUID, provider_type: ProviderType, include_inactive: bool = False
+        self,
+        tenant_id: uuid.UUID,
+        provider_type: ProviderType,
+        include_inactive: bool = False,
+        summary_only: bool = False,
     ) -> list[ModelProvider]:
         """
         根据租户 ID 和提供商类型获取配置列表
@@ -43,6 +68,7 @@ class ModelProviderRepository(BaseRepository[ModelProvider]):
             tenant_id: 租户 ID
             provider_type: 提供商类型
             include_inactive: 是否包含未激活的配置
+            summary_only: 是否只加载列表摘要所需的列
 
         Returns:
             list[ModelProvider]: 提供商配置列表
@@ -56,6 +82,9 @@ class ModelProviderRepository(BaseRepository[ModelProvider]):
         if not include_inactive:
             query = query.filter(ModelProvider.is_active == True)
 
+        if summary_only:
+            query = query.options(load_only(*_SUMMARY_COLUMNS))
+
         return query.order_by(ModelProvider.created_at.desc()).all()
 
     def get_active_by_tenant_and_name(self, tenant_id: uuid.UUID, name: str) -> Optional[ModelProvider]:
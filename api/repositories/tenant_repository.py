@@ -4,9 +4,11 @@ Tenant Repository
 租户数据访问层
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import and_
+
 from models.account import Account
 from models.tenant import (
     Tenant,
@@ -163,6 +165,74 @@ class TenantRepository(BaseRepository[Tenant]):
             .first()
         )
 
+    def get_with_membership(self, tenant_id: UUID, account_id: UUID) -> Tuple[Optional[Tenant], Optional[TenantRole]]:
+        """
+        获取租户及账户在其中的角色（单次 LEFT JOIN 查询）
+
+        参数:
+            tenant_id: 租户 ID
+            account_id: 账户 ID
+
+        返回:
+            (租户, 角色)；租户不存在时为 (None, None)，不是成员时角色为 None
+        """
+        row = (
+            self.session.query(Tenant, TenantAccountJoin.role)
+            .outerjoin(
+                TenantAccountJoin,
+                and_(TenantAccountJoin.tenant_id == Tenant.id, TenantAccountJoin.account_id == account_id),
+            )
+            .filter(Tenant.id == tenant_id)
+            .first()
+        )
+        if row is None:
+            return None, None
+        return row[0], row[1]
+
+    def get_member_roles(self, tenant_ids: Iterable[UUID], account_id: UUID) -> Dict[UUID, TenantRole]:
+        """
+        批量获取账户在多个租户中的角色（单次查询）
+
+        参数:
+            tenant_ids: 租户 ID 列表
+            account_id: 账户 ID
+
+        返回:
+            租户 ID -> 角色（不是成员的租户不在结果中）
+        """
+        tenant_ids = list(tenant_ids)
+        if not tenant_ids:
+            return {}
+
+        rows = (
+            self.session.query(TenantAccountJoin.tenant_id, TenantAccountJoin.role)
+            .filter(TenantAccountJoin.account_id == account_id, TenantAccountJoin.tenant_id.in_(tenant_ids))
+            .all()
+        )
+        return {tenant_id: role for tenant_id, role in rows}
+
+    def get_member_joins(self, tenant_id: UUID, account_ids: Iterable[UUID]) -> Dict[UUID, TenantAccountJoin]:
+        """
+        批量获取租户中多个成员的关联记录（单次查询）
+
+        参数:
+            tenant_id: 租户 ID
+            account_ids: 账户 ID 列表
+
+        返回:
+            账户 ID -> 关联记录（不是成员的账户不在结果中）
+        """
+        account_ids = list(account_ids)
+        if not account_ids:
+            return {}
+
+        joins = (
+            self.session.query(TenantAccountJoin)
+            .filter(TenantAccountJoin.tenant_id == tenant_id, TenantAccountJoin.account_id.in_(account_ids))
+            .all()
+        )
+        return {join.account_id: join for join in joins}
+
     def update_member_role(self, tenant_id: UUID, account_id: UUID, role: TenantRole) -> Optional[TenantAccountJoin]:
         """
         更新成员角色
@@ -10,6 +10,7 @@ from services.exceptions import (
     AuthenticationError,
     AuthorizationError,
     BusinessLogicError,
+    InvalidUUIDError,
     ResourceConflictError,
     ResourceNotFoundError,
     ServiceError,
@@ -22,6 +23,7 @@ __all__ = [
     # Exceptions
     "ServiceError",
     "ValidationError",
+    "InvalidUUIDError",
     "AuthenticationError",
     "AuthorizationError",
     "ResourceNotFoundError",
@@ -4,9 +4,12 @@
 处理应用创建、配置、管理等业务逻辑
 """
 
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
+
 from models.app import App, AppMode, AppStatus
 from models.tenant import TenantRole
 from repositories.app_repository import AppRepository
@@ -14,6 +17,7 @@ from repositories.tenant_repository import TenantRepository
 from services.exceptions import (
     AuthorizationError,
     BusinessLogicError,
+    ResourceConflictError,
     ResourceNotFoundError,
     ValidationError,
 )
@@ -33,6 +37,20 @@ class AppService:
         self.app_repo = app_repo or AppRepository()
         self.tenant_repo = tenant_repo or TenantRepository()
 
+    def _raise_if_name_taken(self, tenant_id: UUID, name: str) -> None:
+        """
+        写入违反约束时，判断是否因租户内应用重名导致
+
+        参数:
+            tenant_id: 租户 ID
+            name: 应用名称
+
+        异常:
+            ResourceConflictError: 租户内已存在同名应用
+        """
+        if self.app_repo.get_by_tenant_and_name(tenant_id, name) is not None:
+            raise ResourceConflictError(f"App name already exists: {name}")
+
     def create_app(
         self,
         tenant_id: UUID,
@@ -62,6 +80,7 @@ class AppService:
             ValidationError: 数据验证失败
             ResourceNotFoundError: 租户不存在
             AuthorizationError: 无权限操作
+            ResourceConflictError: 租户内已存在同名应用
         """
         # 验证名称
         if not name or len(name.strip()) == 0:
@@ -79,19 +98,23 @@ class AppService:
         if not self.tenant_repo.is_member(tenant_id, account_id):
             raise AuthorizationError("Not a member of this tenant")
 
-        # 创建应用
-        app = self.app_repo.create(
-            name=name.strip(),
-            tenant_id=tenant_id,
-            mode=mode,
-            description=description,
-            icon=icon or "🤖",
-            icon_background=icon_background or "#E0F2FE",
-            enable_site=True,
-            enable_api=True,
-            status=AppStatus.NORMAL,
-            created_by=account_id,
-        )
+        # 创建应用（名称唯一性由 uq_apps_tenant_lower_name 索引保证，不预先查询）
+        try:
+            app = self.app_repo.create(
+                name=name.strip(),
+                tenant_id=tenant_id,
+                mode=mode,
+                description=description,
+                icon=icon or "🤖",
+                icon_background=icon_background or "#E0F2FE",
+                enable_site=True,
+                enable_api=True,
+                status=AppStatus.NORMAL,
+                created_by=account_id,
+            )
+        except IntegrityError:
+            self._raise_if_name_taken(tenant_id, name.strip())
+            raise
 
         return app
 
@@ -114,6 +137,7 @@ class AppService:
             ValidationError: 数据验证失败
             ResourceNotFoundError: 租户不存在
             AuthorizationError: 无权限操作
+            ResourceConflictError: 租户内已存在同名应用
         """
         # 检查租户是否存在
         tenant = self.tenant_repo.get_by_id(tenant_id)
@@ -141,7 +165,11 @@ class AppService:
             app_data["status"] = AppStatus.NORMAL
 
         # 创建应用及配置
-        app = self.app_repo.create_with_config(app_data, config_data)
+        try:
+            app = self.app_repo.create_with_config(app_data, config_data)
+        except IntegrityError:
+            self._raise_if_name_taken(tenant_id, app_data.get("name", ""))
+            raise
 
         return app
 
@@ -160,6 +188,7 @@ class AppService:
         异常:
             ResourceNotFoundError: 应用不存在
             AuthorizationError: 无权限操作
+            ResourceConflictError: 租户内已存在同名应用
         """
         # 检查应用是否存在
         app = self.app_repo.get_by_id(app_id)
@@ -171,7 +200,12 @@ class AppService:
             raise AuthorizationError("Not a member of this tenant")
 
         # 更新应用
-        updated_app = self.app_repo.update(app_id, **updates)
+        try:
+            updated_app = self.app_repo.update(app_id, **updates)
+        except IntegrityError:
+            if "name" in updates:
+                self._raise_if_name_taken(app.tenant_id, updates["name"])
+            raise
         return updated_app
 
     def update_app_config(self, app_id: UUID, account_id: UUID, config_data: Dict) -> App:
@@ -272,6 +306,7 @@ class AppService:
         异常:
             ResourceNotFoundError: 应用不存在
             AuthorizationError: 无权限操作
+            ResourceConflictError: 租户内已存在同名的正常应用
         """
         # 检查应用是否存在
         app = self.app_repo.get_by_id(app_id)
@@ -282,11 +317,23 @@ class AppService:
         if not self.tenant_repo.is_member(app.tenant_id, account_id):
             raise AuthorizationError("Not a member of this tenant")
 
-        # 取消归档
-        unarchived_app = self.app_repo.unarchive(app_id)
+        # 取消归档（归档期间名称可能已被其他应用占用）
+        tenant_id, name = app.tenant_id, app.name
+        try:
+            unarchived_app = self.app_repo.unarchive(app_id)
+        except IntegrityError:
+            self._raise_if_name_taken(tenant_id, name)
+            raise
         return unarchived_app
 
-    def get_tenant_apps(self, tenant_id: UUID, account_id: UUID, include_archived: bool = False) -> List[App]:
+    def get_tenant_apps(
+        self,
+        tenant_id: UUID,
+        account_id: UUID,
+        include_archived: bool = False,
+        summary_only: bool = False,
+        check_access: bool = True,
+    ) -> List[App]:
         """
         获取租户的应用列表
 
@@ -294,10 +341,57 @@ class AppService:
             tenant_id: 租户 ID
             account_id: 账户 ID
             include_archived: 是否包含已归档的应用
+            summary_only: 是否只加载列表摘要所需的列（其余字段访问时会触发额外查询）
+            check_access: 是否检查租户存在及成员权限；同一请求内已通过
+                get_tenant_apps_stamp 检查过时可传 False，省去重复查询
 
         返回:
             应用列表
 
+        异常:
+            ResourceNotFoundError: 租户不存在
+            AuthorizationError: 无权限操作
+        """
+        if check_access:
+            self._check_tenant_access(tenant_id, account_id)
+
+        # 获取应用列表
+        if include_archived:
+            apps = self.app_repo.get_by_tenant(tenant_id, summary_only=summary_only)
+        else:
+            apps = self.app_repo.get_active_apps_by_tenant(tenant_id, summary_only=summary_only)
+
+        return apps
+
+    def get_tenant_apps_stamp(
+        self, tenant_id: UUID, account_id: UUID, include_archived: bool = False
+    ) -> Tuple[int, Optional[datetime]]:
+        """
+        获取租户应用列表的版本戳
+
+        应用新增、删除或任一应用更新（含归档）都会改变版本戳，
+        可据此判断客户端缓存的列表是否仍然有效
+
+        参数:
+            tenant_id: 租户 ID
+            account_id: 账户 ID
+            include_archived: 是否包含已归档的应用
+
+        返回:
+            (应用数量, 最近更新时间)
+
+        异常:
+            ResourceNotFoundError: 租户不存在
+            AuthorizationError: 无权限操作
+        """
+        self._check_tenant_access(tenant_id, account_id)
+
+        return self.app_repo.get_tenant_apps_stamp(tenant_id, include_archived)
+
+    def _check_tenant_access(self, tenant_id: UUID, account_id: UUID) -> None:
+        """
+        检查租户存在且账户是其成员
+
         异常:
             ResourceNotFoundError: 租户不存在
             AuthorizationError: 无权限操作
@@ -311,14 +405,6 @@ class AppService:
         if not self.tenant_repo.is_member(tenant_id, account_id):
             raise AuthorizationError("Not a member of this tenant")
 
-        # 获取应用列表
-        if include_archived:
-            apps = self.app_repo.get_by_tenant(tenant_id)
-        else:
-            apps = self.app_repo.get_active_apps_by_tenant(tenant_id)
-
-        return apps
-
     def get_app_detail(self, app_id: UUID, account_id: UUID) -> App:
         """
         获取应用详情（包含配置）
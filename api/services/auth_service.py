@@ -4,11 +4,14 @@
 处理用户注册、登录、JWT 令牌等认证相关业务逻辑
 """
 
+import hmac
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple, TypeVar
 from uuid import UUID
 
 import jwt
+from gevent import monkey
+from gevent.threadpool import ThreadPool
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from models.account import Account, AccountStatus
@@ -20,6 +23,8 @@ from services.exceptions import (
     ValidationError,
 )
 
+R = TypeVar("R")
+
 
 class AuthService:
     """认证服务类"""
@@ -29,6 +34,7 @@ class AuthService:
         account_repo: Optional[AccountRepository] = None,
         secret_key: str = "change-me-in-production",
         token_expiry_hours: int = 24,
+        password_hash_concurrency: int = 4,
     ):
         """
         初始化
@@ -37,10 +43,16 @@ class AuthService:
             account_repo: 账户仓储
             secret_key: JWT 密钥
             token_expiry_hours: 令牌过期时间（小时）
+            password_hash_concurrency: 同时进行的密码哈希计算上限（gevent worker 下的哈希线程数）
         """
         self.account_repo = account_repo or AccountRepository()
         self.secret_key = secret_key
         self.token_expiry_hours = token_expiry_hours
+        # 密码哈希是 CPU 密集操作：gevent worker 下 threading 已被 patch 为协程，
+        # 信号量限制不了从不让出的计算，因此放到独立的真实线程池执行并限制线程数
+        # （hashlib 计算期间释放 GIL），等待结果的协程让出，不阻塞同一 worker 的其他请求
+        self._password_hash_concurrency = password_hash_concurrency
+        self._password_hash_pool: Optional[ThreadPool] = None
 
     def register(self, email: str, password: str, name: str) -> Account:
         """
@@ -75,7 +87,7 @@ class AuthService:
             raise ResourceConflictError(f"Email already exists: {email}")
 
         # 创建账户
-        password_hash = generate_password_hash(password)
+        password_hash = self._hash_password(password)
         account = self.account_repo.create(
             email=email, password_hash=password_hash, name=name.strip(), status=AccountStatus.ACTIVE
         )
@@ -109,7 +121,7 @@ class AuthService:
             raise AuthenticationError("Account is inactive")
 
         # 验证密码
-        if not check_password_hash(account.password_hash, password):
+        if not self._check_password(account.password_hash, password):
             raise AuthenticationError("Invalid email or password")
 
         # 更新最后登录时间
@@ -133,30 +145,57 @@ class AuthService:
         异常:
             AuthenticationError: 令牌无效或过期
         """
-        try:
-            # 解码令牌
-            payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
-            account_id = payload.get("account_id")
-
-            if not account_id:
-                raise AuthenticationError("Invalid token")
+        payload = self.decode_token(token)
+        return self.get_active_account(UUID(payload["account_id"]))
 
-            # 获取账户
-            account = self.account_repo.get_by_id(UUID(account_id))
-            if not account:
-                raise AuthenticationError("Account not found")
+    def decode_token(self, token: str) -> dict:
+        """
+        解码并校验 JWT 令牌（签名与过期时间），不查询数据库
 
-            # 检查账户状态
-            if not account.is_active:
-                raise AuthenticationError("Account is not active")
+        参数:
+            token: JWT 令牌
 
-            return account
+        返回:
+            令牌载荷
 
+        异常:
+            AuthenticationError: 令牌无效或过期
+        """
+        try:
+            payload = jwt.decode(token, self.secret_key, algorithms=["HS256"])
         except jwt.ExpiredSignatureError:
             raise AuthenticationError("Token has expired")
         except jwt.InvalidTokenError:
             raise AuthenticationError("Invalid token")
 
+        if not payload.get("account_id"):
+            raise AuthenticationError("Invalid token")
+
+        return payload
+
+    def get_active_account(self, account_id: UUID) -> Account:
+        """
+        获取处于激活状态的账户
+
+        参数:
+            account_id: 账户 ID
+
+        返回:
+            账户实例
+
+        异常:
+            AuthenticationError: 账户不存在或未激活
+        """
+        account = self.account_repo.get_by_id(account_id)
+        if not account:
+            raise AuthenticationError("Account not found")
+
+        # 检查账户状态
+        if not account.is_active:
+            raise AuthenticationError("Account is not active")
+
+        return account
+
     def change_password(self, account_id: UUID, old_password: str, new_password: str) -> Account:
         """
         修改密码
@@ -180,7 +219,7 @@ class AuthService:
             raise ResourceNotFoundError("Account", str(account_id))
 
         # 验证旧密码
-        if not check_password_hash(account.password_hash, old_password):
+        if not self._check_password(account.password_hash, old_password):
             raise AuthenticationError("Old password is incorrect")
 
         # 验证新密码
@@ -188,7 +227,7 @@ class AuthService:
             raise ValidationError("New password must be at least 6 characters")
 
         # 更新密码
-        new_password_hash = generate_password_hash(new_password)
+        new_password_hash = self._hash_password(new_password)
         updated_account = self.account_repo.update(account_id, password_hash=new_password_hash)
 
         return updated_account
@@ -218,11 +257,72 @@ class AuthService:
             raise ValidationError("Password must be at least 6 characters")
 
         # 更新密码
-        new_password_hash = generate_password_hash(new_password)
+        new_password_hash = self._hash_password(new_password)
         updated_account = self.account_repo.update(account.id, password_hash=new_password_hash)
 
         return updated_account
 
+    @staticmethod
+    def _secrets_equal(provided: str, expected: str) -> bool:
+        """
+        以恒定时间比较密钥类字符串（验证码、重置令牌等）
+
+        禁止对密钥使用 ==，否则比较耗时会随相同前缀长度变化，产生时序侧信道
+
+        参数:
+            provided: 用户提交的值
+            expected: 服务端保存的值
+
+        返回:
+            是否相等
+        """
+        return hmac.compare_digest(provided.encode("utf-8"), expected.encode("utf-8"))
+
+    def _run_password_hash(self, func: Callable[..., R], *args) -> R:
+        """
+        执行密码哈希计算
+
+        gevent worker 下在密码哈希线程池中执行（线程数即并发上限，线程池在首次使用时创建，
+        不会在 preload 的 master 进程中启动线程）；未 patch threading 时直接在当前线程执行
+
+        参数:
+            func: 哈希函数
+            *args: 参数
+
+        返回:
+            哈希函数的返回值
+        """
+        if not monkey.is_module_patched("threading"):
+            return func(*args)
+        if self._password_hash_pool is None:
+            self._password_hash_pool = ThreadPool(self._password_hash_concurrency)
+        return self._password_hash_pool.apply(func, args)
+
+    def _hash_password(self, password: str) -> str:
+        """
+        计算密码哈希（受并发上限约束）
+
+        参数:
+            password: 明文密码
+
+        返回:
+            密码哈希
+        """
+        return self._run_password_hash(generate_password_hash, password)
+
+    def _check_password(self, password_hash: str, password: str) -> bool:
+        """
+        校验密码（受并发上限约束）
+
+        参数:
+            password_hash: 密码哈希
+            password: 明文密码
+
+        返回:
+            密码是否匹配
+        """
+        return self._run_password_hash(check_password_hash, password_hash, password)
+
     def _generate_token(self, account_id: UUID, email: str) -> str:
         """
         生成 JWT 令牌
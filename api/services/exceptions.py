@@ -28,6 +28,14 @@ class ValidationError(ServiceError):
         super().__init__(message, "VALIDATION_ERROR")
 
 
+class InvalidUUIDError(ValidationError):
+    """UUID 格式错误异常"""
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.code = "INVALID_UUID"
+
+
 class AuthenticationError(ServiceError):
     """认证异常"""
 
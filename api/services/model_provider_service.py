@@ -122,7 +122,11 @@ class ModelProviderService:
         return provider
 
     def list_providers(
-        self, tenant_id: uuid.UUID, include_inactive: bool = False, provider_type: Optional[ProviderType] = None
+        self,
+        tenant_id: uuid.UUID,
+        include_inactive: bool = False,
+        provider_type: Optional[ProviderType] = None,
+        summary_only: bool = False,
     ) -> list[ModelProvider]:
         """
         获取提供商配置列表
@@ -131,6 +135,7 @@ class ModelProviderService:
             tenant_id: 租户 ID
             include_inactive: 是否包含未激活的配置
             provider_type: 提供商类型过滤
+            summary_only: 是否只加载列表摘要所需的列（不读取加密凭证）
 
         Returns:
             list[ModelProvider]: 提供商配置列表
@@ -144,9 +149,11 @@ class ModelProviderService:
             raise ResourceNotFoundError("Tenant", str(tenant_id))
 
         if provider_type:
-            return self.provider_repo.get_by_tenant_and_type(tenant_id, provider_type, include_inactive)
+            return self.provider_repo.get_by_tenant_and_type(
+                tenant_id, provider_type, include_inactive, summary_only=summary_only
+            )
         else:
-            return self.provider_repo.get_by_tenant_id(tenant_id, include_inactive)
+            return self.provider_repo.get_by_tenant_id(tenant_id, include_inactive, summary_only=summary_only)
 
     def update_provider(
         self,
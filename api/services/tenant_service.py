@@ -7,6 +7,7 @@
 from typing import List, Optional
 from uuid import UUID
 
+from libs.sieve_cache import SieveCache
 from models.account import Account
 from models.tenant import Tenant, TenantPlan, TenantRole, TenantStatus
 from repositories.account_repository import AccountRepository
@@ -24,7 +25,10 @@ class TenantService:
     """租户服务类"""
 
     def __init__(
-        self, tenant_repo: Optional[TenantRepository] = None, account_repo: Optional[AccountRepository] = None
+        self,
+        tenant_repo: Optional[TenantRepository] = None,
+        account_repo: Optional[AccountRepository] = None,
+        membership_cache: Optional[SieveCache] = None,
     ):
         """
         初始化
@@ -32,9 +36,24 @@ class TenantService:
         参数:
             tenant_repo: 租户仓储
             account_repo: 账户仓储
+            membership_cache: 成员关系缓存，键为 (tenant_id, account_id)；为 None 时每次查询数据库
         """
         self.tenant_repo = tenant_repo or TenantRepository()
         self.account_repo = account_repo or AccountRepository()
+        self.membership_cache = membership_cache
+
+    def _invalidate_membership(self, tenant_id: UUID, account_id: UUID) -> None:
+        """
+        清除成员关系缓存
+
+        仅清除本进程的缓存，其他进程依赖缓存 TTL 过期
+
+        参数:
+            tenant_id: 租户 ID
+            account_id: 账户 ID
+        """
+        if self.membership_cache is not None:
+            self.membership_cache.delete((tenant_id, account_id))
 
     def create_tenant(self, name: str, owner_account_id: UUID, plan: TenantPlan = TenantPlan.FREE) -> Tenant:
         """
@@ -75,6 +94,7 @@ class TenantService:
 
         # 添加所有者
         self.tenant_repo.add_member(tenant.id, owner_account_id, TenantRole.OWNER)
+        self._invalidate_membership(tenant.id, owner_account_id)
 
         return tenant
 
@@ -114,6 +134,7 @@ class TenantService:
 
         # 添加成员
         self.tenant_repo.add_member(tenant_id, account_id, role)
+        self._invalidate_membership(tenant_id, account_id)
 
     def remove_member(self, tenant_id: UUID, account_id: UUID, operator_account_id: UUID) -> None:
         """
@@ -154,6 +175,7 @@ class TenantService:
 
         # 移除成员
         self.tenant_repo.remove_member(tenant_id, account_id)
+        self._invalidate_membership(tenant_id, account_id)
 
     def update_member_role(
         self, tenant_id: UUID, account_id: UUID, new_role: TenantRole, operator_account_id: UUID
@@ -197,6 +219,7 @@ class TenantService:
 
         # 更新角色
         self.tenant_repo.update_member_role(tenant_id, account_id, new_role)
+        self._invalidate_membership(tenant_id, account_id)
 
     def get_tenant_members(self, tenant_id: UUID) -> List[Account]:
         """
@@ -249,8 +272,16 @@ class TenantService:
         返回:
             是否是成员
         """
-        member_role = self.tenant_repo.get_member_role(tenant_id, account_id)
-        return member_role is not None
+        cache = self.membership_cache
+        if cache is None:
+            return self.tenant_repo.get_member_role(tenant_id, account_id) is not None
+
+        key = (tenant_id, account_id)
+        is_member = cache.get(key)
+        if is_member is None:
+            is_member = self.tenant_repo.get_member_role(tenant_id, account_id) is not None
+            cache.set(key, is_member)
+        return is_member
 
     def check_permission(self, tenant_id: UUID, account_id: UUID, required_role: TenantRole) -> bool:
         """
@@ -13,6 +13,7 @@ from flask.testing import FlaskClient
 
 from configs.app_config import Config
 from extensions.ext_database import db
+from libs.json_provider import OrjsonProvider
 
 
 class TestConfig(Config):
@@ -29,10 +30,8 @@ class TestConfig(Config):
     WTF_CSRF_ENABLED = False
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
-    @property
-    def SQLALCHEMY_DATABASE_URI(self) -> str:
-        """使用内存 SQLite 数据库进行测试"""
-        return "sqlite:///:memory:"
+    # 使用内存 SQLite 数据库进行测试
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
 
 
 @pytest.fixture(scope="function")
@@ -52,7 +51,7 @@ def app() -> Generator[Flask, None, None]:
     test_app.config["SECRET_KEY"] = test_config.SECRET_KEY
     test_app.config["JWT_SECRET_KEY"] = test_config.JWT_SECRET_KEY
     test_app.config["WTF_CSRF_ENABLED"] = test_config.WTF_CSRF_ENABLED
-    test_app.config["SQLALCHEMY_DATABASE_URI"] = test_config.SQLALCHEMY_DATABASE_URI  # 会调用 property
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = test_config.SQLALCHEMY_DATABASE_URI
     test_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = test_config.SQLALCHEMY_TRACK_MODIFICATIONS
 
     # 初始化数据库
@@ -87,19 +86,18 @@ def app_with_blueprints() -> Generator[Flask, None, None]:
 
     用于集成测试
     """
-    from app_factory import create_app
-
     # 创建测试配置实例
     test_config = TestConfig()
 
     # 创建应用并手动设置配置
     test_app = Flask(__name__)
+    test_app.json = OrjsonProvider(test_app)
     test_app.config["TESTING"] = test_config.TESTING
     test_app.config["DEBUG"] = test_config.DEBUG
     test_app.config["SECRET_KEY"] = test_config.SECRET_KEY
     test_app.config["JWT_SECRET_KEY"] = test_config.JWT_SECRET_KEY
     test_app.config["WTF_CSRF_ENABLED"] = test_config.WTF_CSRF_ENABLED
-    test_app.config["SQLALCHEMY_DATABASE_URI"] = test_config.SQLALCHEMY_DATABASE_URI  # 调用 property
+    test_app.config["SQLALCHEMY_DATABASE_URI"] = test_config.SQLALCHEMY_DATABASE_URI
     test_app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = test_config.SQLALCHEMY_TRACK_MODIFICATIONS
 
     # 手动初始化扩展和注册蓝图
@@ -116,46 +114,10 @@ def app_with_blueprints() -> Generator[Flask, None, None]:
     test_app.register_blueprint(app_bp)
     test_app.register_blueprint(model_provider_bp)
 
-    # 注册错误处理器（简化版，直接在这里注册）
-    from flask import jsonify
-
-    from services.exceptions import (
-        AuthenticationError,
-        AuthorizationError,
-        BusinessLogicError,
-        ResourceConflictError,
-        ResourceNotFoundError,
-        ServiceError,
-        ValidationError,
-    )
-
-    @test_app.errorhandler(ValidationError)
-    def handle_validation_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "VALIDATION_ERROR"}), 400
-
-    @test_app.errorhandler(AuthenticationError)
-    def handle_authentication_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "AUTHENTICATION_ERROR"}), 401
-
-    @test_app.errorhandler(AuthorizationError)
-    def handle_authorization_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "AUTHORIZATION_ERROR"}), 403
-
-    @test_app.errorhandler(ResourceNotFoundError)
-    def handle_not_found_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "NOT_FOUND"}), 404
-
-    @test_app.errorhandler(ResourceConflictError)
-    def handle_conflict_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "CONFLICT"}), 409
-
-    @test_app.errorhandler(BusinessLogicError)
-    def handle_business_logic_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "BUSINESS_ERROR"}), 422
+    # 注册全局错误处理器（与生产环境一致）
+    from app_factory import register_error_handlers
 
-    @test_app.errorhandler(ServiceError)
-    def handle_service_error(e):
-        return jsonify({"error": str(e), "code": e.code if hasattr(e, "code") else "SERVICE_ERROR"}), 500
+    register_error_handlers(test_app)
 
     with test_app.app_context():
         # 创建所有表
@@ -176,6 +138,27 @@ def client_integration(app_with_blueprints: Flask) -> FlaskClient:
     return app_with_blueprints.test_client()
 
 
+@pytest.fixture(scope="function")
+def fake_redis(mocker):
+    """
+    用内存字典替换 Redis 客户端（只模拟 get/set/delete）
+
+    返回 patch 函数：传入一个或多个 redis_client 的 patch 目标
+    （如 "core.auth.account_cache.redis_client"），各目标共享同一个字典，返回该字典
+    """
+    store = {}
+
+    def patch(*targets: str) -> dict:
+        for target in targets:
+            client = mocker.patch(target)
+            client.get.side_effect = store.get
+            client.set.side_effect = lambda key, value, ex=None: store.__setitem__(key, value)
+            client.delete.side_effect = lambda *keys: [store.pop(key, None) for key in keys]
+        return store
+
+    return patch
+
+
 @pytest.fixture(scope="function")
 def db_session(app: Flask):
     """
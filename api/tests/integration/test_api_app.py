@@ -3,6 +3,7 @@
 """
 
 import uuid
+from types import SimpleNamespace
 
 import pytest
 from werkzeug.security import generate_password_hash
@@ -94,6 +95,19 @@ class TestAppAPI:
         data = response.get_json()
         assert data["code"] == "VALIDATION_ERROR"
 
+    def test_create_app_invalid_tenant_id(self, client_integration, auth_headers):
+        """测试创建应用使用无效租户 ID"""
+        response = client_integration.post(
+            "/api/console/apps",
+            headers=auth_headers,
+            json={"tenant_id": "not-a-uuid", "name": "Test App"},
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["code"] == "VALIDATION_ERROR"
+        assert data["error"].startswith("tenant_id")
+
     def test_create_app_not_tenant_member(self, client_integration, auth_headers, session):
         """测试非租户成员创建应用"""
         # 创建一个租户，但不添加当前用户为成员
@@ -157,6 +171,38 @@ class TestAppAPI:
         assert "App 1" in app_names
         assert "App 2" in app_names
 
+    def test_get_apps_etag(self, client_integration, auth_headers, session, test_account):
+        """测试应用列表 ETag 协商缓存"""
+        from models import App, AppMode, TenantAccountJoin, TenantRole
+
+        tenant = Tenant(name="Test Tenant", plan=TenantPlan.FREE, status=TenantStatus.ACTIVE)
+        session.add(tenant)
+        session.flush()
+
+        join = TenantAccountJoin(tenant_id=tenant.id, account_id=test_account.id, role=TenantRole.OWNER)
+        session.add(join)
+        session.add(App(name="App 1", tenant_id=tenant.id, mode=AppMode.CHAT, created_by=test_account.id))
+        session.commit()
+
+        url = f"/api/console/apps?tenant_id={tenant.id}"
+        first = client_integration.get(url, headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        # 列表未变化时返回 304
+        second = client_integration.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.data == b""
+
+        # 新增应用后 ETag 变化
+        session.add(App(name="App 2", tenant_id=tenant.id, mode=AppMode.CHAT, created_by=test_account.id))
+        session.commit()
+
+        third = client_integration.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert third.status_code == 200
+        assert len(third.get_json()) == 2
+        assert third.headers["ETag"] != etag
+
     def test_get_apps_with_archived(self, client_integration, auth_headers, session, test_account):
         """测试获取包含已归档的应用列表"""
         from models import App, AppMode, AppStatus, TenantAccountJoin, TenantRole
@@ -236,6 +282,70 @@ class TestAppAPI:
 
         assert response.status_code == 403
 
+    def test_get_app_invalid_uuid(self, client_integration, auth_headers, session):
+        """测试使用非法 UUID 获取应用详情"""
+        for bad_id in ["not-a-uuid", "12345678123456781234567812345678", "{12345678-1234-5678-1234-567812345678}"]:
+            response = client_integration.get(f"/api/console/apps/{bad_id}", headers=auth_headers)
+
+            assert response.status_code == 400
+            data = response.get_json()
+            assert data["code"] == "INVALID_UUID"
+            assert data["error"] == f"Invalid app ID: {bad_id}"
+
+    def test_get_app_cached_detail(self, client_integration, auth_headers, session, test_account, fake_redis, mocker):
+        """测试应用详情缓存命中与更新后失效"""
+        from controllers.console.app.app_bp import _set_cached_app
+        from models import App, AppMode, TenantAccountJoin, TenantRole
+
+        store = fake_redis("controllers.console.app.app_bp.redis_client")
+
+        def set_if_not_older(keys, args):
+            current = store.get(keys[0])
+            if current is not None and int(current.split(b"\n", 1)[0]) > int(args[0]):
+                return 0
+            store[keys[0]] = args[1]
+            return 1
+
+        mocker.patch("controllers.console.app.app_bp._app_cache_set_script", set_if_not_older)
+
+        tenant = Tenant(name="Test Tenant", plan=TenantPlan.FREE, status=TenantStatus.ACTIVE)
+        session.add(tenant)
+        session.flush()
+
+        join = TenantAccountJoin(tenant_id=tenant.id, account_id=test_account.id, role=TenantRole.OWNER)
+        session.add(join)
+
+        app = App(name="Cached App", tenant_id=tenant.id, mode=AppMode.CHAT, created_by=test_account.id)
+        session.add(app)
+        session.commit()
+
+        # 首次请求写入缓存，第二次请求命中缓存
+        first = client_integration.get(f"/api/console/apps/{app.id}", headers=auth_headers)
+        assert first.status_code == 200
+        assert f"app:v1:{app.id}" in store
+
+        second = client_integration.get(f"/api/console/apps/{app.id}", headers=auth_headers)
+        assert second.status_code == 200
+        assert second.get_json() == first.get_json()
+
+        # 更新后缓存失效（写入只有版本的墓碑）
+        stale = SimpleNamespace(id=app.id, tenant_id=tenant.id, updated_at=app.updated_at)
+        client_integration.put(f"/api/console/apps/{app.id}", headers=auth_headers, json={"name": "Renamed"})
+        assert store[f"app:v1:{app.id}"].endswith(b"\n")
+
+        # 与更新并发的读请求无法写回更新前的响应体
+        _set_cached_app(stale, first.data)
+
+        response = client_integration.get(f"/api/console/apps/{app.id}", headers=auth_headers)
+        assert response.get_json()["name"] == "Renamed"
+
+        # 命中缓存时仍需校验成员权限
+        session.delete(join)
+        session.commit()
+
+        response = client_integration.get(f"/api/console/apps/{app.id}", headers=auth_headers)
+        assert response.status_code == 403
+
     def test_update_app_success(self, client_integration, auth_headers, session, test_account):
         """测试更新应用信息"""
         from models import App, AppMode, TenantAccountJoin, TenantRole
@@ -263,6 +373,26 @@ class TestAppAPI:
         assert data["name"] == "New Name"
         assert data["description"] == "New description"
 
+    @pytest.mark.parametrize("body", [[1], {"app_id": "x"}, {"model_config": {}}, {"name": None}])
+    def test_update_app_invalid_body(self, client_integration, auth_headers, session, test_account, body):
+        """测试更新应用时请求体不合法返回 400"""
+        from models import App, AppMode, TenantAccountJoin, TenantRole
+
+        tenant = Tenant(name="Test Tenant", plan=TenantPlan.FREE, status=TenantStatus.ACTIVE)
+        session.add(tenant)
+        session.flush()
+
+        join = TenantAccountJoin(tenant_id=tenant.id, account_id=test_account.id, role=TenantRole.OWNER)
+        session.add(join)
+
+        app = App(name="Old Name", tenant_id=tenant.id, mode=AppMode.CHAT, created_by=test_account.id)
+        session.add(app)
+        session.commit()
+
+        response = client_integration.put(f"/api/console/apps/{app.id}", headers=auth_headers, json=body)
+
+        assert response.status_code == 400
+
     def test_delete_app_success(self, client_integration, auth_headers, session, test_account):
         """测试删除应用"""
         from models import App, AppMode, TenantAccountJoin, TenantRole
@@ -12,6 +12,7 @@ import pytest
 
 from configs.app_config import Config
 from models import Account, AccountStatus
+from repositories import AccountRepository
 
 
 class TestAuthAPI:
@@ -47,6 +48,17 @@ class TestAuthAPI:
         data = response.get_json()
         assert "error" in data
 
+    def test_register_body_too_large(self, client_integration):
+        """测试注册请求体超过上限"""
+        response = client_integration.post(
+            "/api/console/auth/register",
+            json={"email": "test@example.com", "password": "password123", "name": "x" * 8192},
+        )
+
+        assert response.status_code == 413
+        data = response.get_json()
+        assert data["code"] == "PAYLOAD_TOO_LARGE"
+
     def test_register_invalid_email(self, client_integration):
         """测试注册无效邮箱"""
         response = client_integration.post(
@@ -160,6 +172,68 @@ class TestAuthAPI:
         assert "name" in data
         assert "status" in data
 
+    def test_get_me_cached_account(self, client_integration, auth_headers, test_account, fake_redis):
+        """测试认证账户快照缓存命中后不再查询账户表"""
+        store = fake_redis("core.auth.account_cache.redis_client")
+
+        first = client_integration.get("/api/console/auth/me", headers=auth_headers)
+        assert first.status_code == 200
+        assert f"account:v1:{test_account.id}" in store
+
+        with patch("services.auth_service.AuthService.get_active_account") as get_active_account:
+            second = client_integration.get("/api/console/auth/me", headers=auth_headers)
+            get_active_account.assert_not_called()
+
+        assert second.status_code == 200
+        assert second.get_json() == first.get_json()
+
+        # 登出后快照失效
+        client_integration.post("/api/console/auth/logout", headers=auth_headers)
+        assert f"account:v1:{test_account.id}" not in store
+
+    def test_logout_revokes_token(self, client_integration, auth_headers, fake_redis):
+        """测试登出后令牌被吊销"""
+        fake_redis("controllers.console.auth.auth_bp.redis_client", "core.auth.account_cache.redis_client")
+
+        assert client_integration.get("/api/console/auth/me", headers=auth_headers).status_code == 200
+
+        client_integration.post("/api/console/auth/logout", headers=auth_headers)
+
+        response = client_integration.get("/api/console/auth/me", headers=auth_headers)
+        assert response.status_code == 401
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    def test_banned_account_token_rejected(self, client_integration, auth_headers, test_account, fake_redis, bulk):
+        """测试封禁账户后，已缓存的令牌在下一个请求即失效"""
+        store = fake_redis("core.auth.account_cache.redis_client")
+
+        assert client_integration.get("/api/console/auth/me", headers=auth_headers).status_code == 200
+        assert f"account:v1:{test_account.id}" in store
+
+        repo = AccountRepository()
+        if bulk:
+            repo.bulk_update_status([test_account.id], AccountStatus.BANNED)
+        else:
+            repo.ban_account(test_account.id)
+
+        assert f"account:v1:{test_account.id}" not in store
+        response = client_integration.get("/api/console/auth/me", headers=auth_headers)
+        assert response.status_code == 401
+
+    def test_get_me_preflight(self, client_integration):
+        """测试 CORS 预检请求无需认证"""
+        response = client_integration.options("/api/console/auth/me")
+
+        assert response.status_code == 200
+        assert "GET" in response.headers["Allow"]
+
+    def test_ping(self, client_integration):
+        """测试健康检查无需认证"""
+        response = client_integration.get("/api/console/auth/ping")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"status": "ok"}
+
     def test_get_me_without_token(self, client_integration):
         """测试未提供 token 获取当前用户"""
         response = client_integration.get("/api/console/auth/me")
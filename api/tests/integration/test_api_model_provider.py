@@ -126,10 +126,37 @@ class TestModelProviderAPI:
             json={"name": "Test Provider", "provider_type": "OPENAI", "credentials": {"api_key": "invalid"}},
         )
 
-        assert response.status_code == 400
+        assert response.status_code == 422
         data = response.get_json()
         assert "error" in data
 
+    def test_add_provider_non_string_type(self, client_integration, auth_headers, test_tenant):
+        """测试添加提供商配置，类型不是字符串"""
+        response = client_integration.post(
+            f"/api/console/tenants/{test_tenant.id}/model-providers",
+            headers=auth_headers,
+            json={"name": "Test Provider", "provider_type": 1, "credentials": {"api_key": "key"}},
+        )
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "Provider type is required"}
+
+    def test_internal_error_hides_details(
+        self, client_integration, auth_headers, test_tenant, mocker: MockerFixture
+    ):
+        """测试未预期的异常不向客户端暴露内部信息"""
+        mocker.patch(
+            "services.model_provider_service.ModelProviderService.list_providers",
+            side_effect=RuntimeError("connection to server at 10.0.0.1 failed"),
+        )
+
+        response = client_integration.get(
+            f"/api/console/tenants/{test_tenant.id}/model-providers", headers=auth_headers
+        )
+
+        assert response.status_code == 500
+        assert response.get_json() == {"error": "Internal server error"}
+
     def test_list_providers(self, client_integration, auth_headers, test_tenant, session, mocker: MockerFixture):
         """测试获取提供商配置列表"""
         # Mock 凭证验证
@@ -223,6 +250,26 @@ class TestModelProviderAPI:
         data = response.get_json()
         assert "error" in data
 
+    def test_get_provider_invalid_id(self, client_integration, auth_headers, test_tenant):
+        """测试提供商 ID 格式不正确"""
+        response = client_integration.get(
+            f"/api/console/tenants/{test_tenant.id}/model-providers/not-a-uuid", headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["code"] == "INVALID_UUID"
+        assert data["error"] == "Invalid provider ID: not-a-uuid"
+
+    def test_list_providers_invalid_tenant_id(self, client_integration, auth_headers):
+        """测试租户 ID 格式不正确"""
+        response = client_integration.get("/api/console/tenants/not-a-uuid/model-providers", headers=auth_headers)
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["code"] == "INVALID_UUID"
+        assert data["error"] == "Invalid tenant ID: not-a-uuid"
+
     def test_update_provider_name(self, client_integration, auth_headers, test_tenant, session, mocker: MockerFixture):
         """测试更新提供商配置名称"""
         # Mock 凭证验证
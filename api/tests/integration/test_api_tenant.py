@@ -34,6 +34,17 @@ class TestTenantAPI:
         data = response.get_json()
         assert data["code"] == "VALIDATION_ERROR"
 
+    def test_create_tenant_invalid_plan(self, client_integration, auth_headers):
+        """测试创建租户使用无效套餐"""
+        response = client_integration.post(
+            "/api/console/tenants", headers=auth_headers, json={"name": "My Tenant", "plan": "gold"}
+        )
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["code"] == "VALIDATION_ERROR"
+        assert data["error"].startswith("plan:")
+
     def test_create_tenant_duplicate_name(self, client_integration, auth_headers, session):
         """测试创建重复名称的租户"""
         # 先创建一个租户
@@ -78,12 +89,33 @@ class TestTenantAPI:
             assert "role" in tenant
             assert tenant["role"] == "owner"
 
+    def test_internal_error_hides_details(self, client_integration, auth_headers, mocker):
+        """测试未预期的异常不向客户端暴露内部信息"""
+        mocker.patch(
+            "services.tenant_service.TenantService.get_account_tenants",
+            side_effect=RuntimeError("connection to server at 10.0.0.1 failed"),
+        )
+
+        response = client_integration.get("/api/console/tenants", headers=auth_headers)
+
+        assert response.status_code == 500
+        assert response.get_json() == {"error": "Internal server error", "code": "INTERNAL_ERROR"}
+
     def test_get_tenants_without_auth(self, client_integration):
         """测试未认证获取租户列表"""
         response = client_integration.get("/api/console/tenants")
 
         assert response.status_code == 401
 
+    def test_get_tenant_invalid_uuid(self, client_integration, auth_headers):
+        """测试租户 ID 格式错误"""
+        response = client_integration.get("/api/console/tenants/not-a-uuid", headers=auth_headers)
+
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data["code"] == "INVALID_UUID"
+        assert data["error"] == "Invalid tenant ID: not-a-uuid"
+
     def test_get_tenant_success(self, client_integration, auth_headers, session):
         """测试获取租户详情"""
         # 先创建一个租户
@@ -384,8 +416,9 @@ class TestTenantAPI:
             f"/api/console/tenants/{tenant_id}/members/{test_account.id}", headers=auth_headers
         )
 
-        # 应该返回错误（服务层会抛出异常）
-        assert response.status_code != 200
+        # 服务层抛出业务逻辑错误，返回 422
+        assert response.status_code == 422
+        assert response.get_json()["code"] == "BUSINESS_LOGIC_ERROR"
 
     def test_update_member_role_success(self, client_integration, auth_headers, session, test_account):
         """测试更新成员角色（仅 OWNER）"""
@@ -469,5 +502,6 @@ class TestTenantAPI:
             f"/api/console/tenants/{tenant_id}/members/{member.id}/role", headers=auth_headers, json={"role": "owner"}
         )
 
-        # 服务层会抛出业务逻辑错误
-        assert response.status_code != 200
+        # 服务层抛出业务逻辑错误，返回 422
+        assert response.status_code == 422
+        assert response.get_json()["code"] == "BUSINESS_LOGIC_ERROR"
@@ -0,0 +1,69 @@
+"""
+EmbeddingBatcher 单元测试
+"""
+
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.model_runtime.entities import (
+    EmbeddingResult,
+    ModelUsage,
+    ProviderCredentials,
+    ProviderType,
+)
+from core.model_runtime.providers import EmbeddingBatcher
+
+
+class TestEmbeddingBatcher:
+    """EmbeddingBatcher 测试类"""
+
+    @pytest.fixture
+    def credentials(self):
+        """创建测试凭证"""
+        return ProviderCredentials(provider_type=ProviderType.TEI, credentials={"base_url": "http://localhost:8080"})
+
+    @pytest.fixture
+    def provider(self, mocker: MockerFixture):
+        """创建按文本长度返回向量的 Mock 提供商"""
+        provider = mocker.Mock()
+        provider.embed_documents.side_effect = lambda credentials, model, texts: EmbeddingResult(
+            model=model, embeddings=[[float(len(text))] for text in texts], usage=ModelUsage()
+        )
+        return provider
+
+    def test_concurrent_queries_share_one_request(self, provider, credentials):
+        """测试并发查询合并为一次 embed_documents 调用"""
+        batcher = EmbeddingBatcher(provider, max_batch=4, max_wait_ms=1000)
+        texts = ["a", "bb", "ccc", "dddd"]
+        results = {}
+
+        def worker(text):
+            results[text] = batcher.embed_query(credentials, "tei-embedding", text)
+
+        threads = [threading.Thread(target=worker, args=(text,)) for text in texts]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        # 凑满 max_batch 后立即发送，每个调用方取回自己的向量
+        assert provider.embed_documents.call_count == 1
+        assert sorted(provider.embed_documents.call_args.args[2]) == sorted(texts)
+        assert results == {text: [float(len(text))] for text in texts}
+
+    def test_single_query_sent_after_wait(self, provider, credentials):
+        """测试单条查询在等待窗口结束后发送"""
+        batcher = EmbeddingBatcher(provider, max_batch=64, max_wait_ms=1)
+
+        assert batcher.embed_query(credentials, "tei-embedding", "hello") == [5.0]
+        provider.embed_documents.assert_called_once_with(credentials, "tei-embedding", ["hello"])
+
+    def test_error_propagates(self, provider, credentials):
+        """测试合并请求失败时异常传递给调用方"""
+        provider.embed_documents.side_effect = RuntimeError("boom")
+        batcher = EmbeddingBatcher(provider, max_batch=64, max_wait_ms=1)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            batcher.embed_query(credentials, "tei-embedding", "hello")
@@ -0,0 +1,74 @@
+"""
+SieveCache 单元测试
+"""
+
+import time
+
+from libs.sieve_cache import SieveCache
+
+
+class TestSieveCache:
+    """SieveCache 测试类"""
+
+    def test_get_set(self):
+        """测试读写"""
+        cache = SieveCache(maxsize=2, ttl=60)
+        cache.set(b"a", 1)
+
+        assert cache.get(b"a") == 1
+        assert cache.get(b"b") is None
+
+    def test_evicts_unvisited_entry(self):
+        """测试容量满时淘汰未访问的条目"""
+        cache = SieveCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert len(cache) == 2
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_expired_entry(self):
+        """测试过期条目视为未命中"""
+        cache = SieveCache(maxsize=2, ttl=60)
+        cache.set("a", 1, expires_at=time.time() - 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_maxsize_disables_cache(self):
+        """测试容量不大于 0 时不缓存"""
+        cache = SieveCache(maxsize=0, ttl=60)
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_delete_group(self):
+        """测试按分组删除"""
+        cache = SieveCache(maxsize=4, ttl=60, group=lambda value: value % 2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        cache.delete_group(1)
+
+        assert len(cache) == 1
+        assert cache.get("b") == 2
+
+    def test_group_index_follows_eviction_and_update(self):
+        """测试淘汰和覆盖写入后分组索引保持一致"""
+        cache = SieveCache(maxsize=2, ttl=60, group=lambda value: value % 2)
+        cache.set("a", 1)
+        cache.set("b", 3)
+        cache.set("c", 2)
+        cache.set("b", 4)
+
+        cache.delete_group(0)
+
+        assert len(cache) == 0
+        assert cache._groups == {}
@@ -0,0 +1,33 @@
+"""
+UUIDv7 单元测试
+"""
+
+import time
+
+from libs.uuid7 import uuid7
+
+
+class TestUUID7:
+    """uuid7 测试类"""
+
+    def test_version_and_variant(self):
+        """测试版本号和变体位"""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_embeds_millisecond_timestamp(self):
+        """测试高 48 位为毫秒时间戳"""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after + 1
+
+    def test_monotonic(self):
+        """测试同一进程内生成的 ID 严格递增"""
+        values = [uuid7() for _ in range(10000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
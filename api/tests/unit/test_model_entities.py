@@ -46,12 +46,33 @@ class TestModelEntities:
         assert total.completion_tokens == 30
         assert total.total_tokens == 45
 
+    def test_model_usage_inplace_addition(self):
+        """测试模型使用量原地累加"""
+        usage = ModelUsage()
+        original = usage
+        usage += ModelUsage(prompt_tokens=5, completion_tokens=10, total_tokens=15)
+        usage += ModelUsage(prompt_tokens=1, completion_tokens=2, total_tokens=3)
+        assert usage is original
+        assert usage.prompt_tokens == 6
+        assert usage.completion_tokens == 12
+        assert usage.total_tokens == 18
+
     def test_llm_message_creation(self):
         """测试 LLM 消息创建"""
         message = LLMMessage(role="user", content="Hello")
         assert message.role == "user"
         assert message.content == "Hello"
 
+    def test_llm_message_to_openai_dict(self):
+        """测试消息字典在创建时构建并复用"""
+        message = LLMMessage(role="user", content="Hello")
+        assert message.to_openai_dict() == {"role": "user", "content": "Hello"}
+        assert message.to_openai_dict() is message.to_openai_dict()
+        assert message == LLMMessage(role="user", content="Hello")
+
+        with pytest.raises(AttributeError):
+            message.content = "Changed"
+
     def test_llm_result_creation(self):
         """测试 LLM 结果创建"""
         usage = ModelUsage(prompt_tokens=10, completion_tokens=20, total_tokens=30)
@@ -80,6 +101,23 @@ class TestModelEntities:
         assert result.model == "text-embedding-ada-002"
         assert len(result.embeddings) == 2
         assert result.embeddings[0] == [0.1, 0.2, 0.3]
+
+    def test_embedding_result_to_numpy(self):
+        """测试向量结果转换为数组与 int8 量化"""
+        np = pytest.importorskip("numpy")
+
+        usage = ModelUsage(prompt_tokens=10, total_tokens=10)
+        result = EmbeddingResult(model="bge", embeddings=[[0.1, -0.2, 0.3], [0.0, 0.0, 0.0]], usage=usage)
+
+        vectors = result.to_numpy()
+        assert vectors.shape == (2, 3)
+        assert vectors.dtype == np.float32
+
+        quantized, scales = result.quantize_int8()
+        assert quantized.dtype == np.int8
+        assert quantized[0].tolist() == [42, -85, 127]
+        restored = quantized.astype(np.float32) * scales[:, None]
+        assert np.allclose(restored, vectors, atol=0.01)
         assert result.usage.prompt_tokens == 10
 
     def test_provider_credentials_creation(self):
@@ -91,6 +129,9 @@ class TestModelEntities:
         assert creds.provider_type == ProviderType.OPENAI
         assert creds.get("api_key") == "sk-123"
         assert creds.get("base_url") == "https://api.openai.com/v1"
+        assert creds["api_key"] == "sk-123"
+        with pytest.raises(TypeError):
+            creds.credentials["api_key"] = "sk-456"
         assert creds.get("missing_key", "default") == "default"
 
     def test_model_config_creation(self):
@@ -218,7 +218,23 @@ class TestAppModel:
             assert isinstance(data["name"], str)
             assert isinstance(data["mode"], str)
             assert isinstance(data["status"], str)
-    
+
+    def test_app_to_view_dict(self, app, factory):
+        """测试转换为接口响应字典"""
+        with app.app_context():
+            tenant = factory.create_tenant()
+            application = factory.create_app(tenant=tenant, name="Test App")
+
+            data = application.to_view_dict()
+            summary = application.to_view_dict(summary=True)
+
+            # 验证字段且保持原始类型
+            assert data["id"] == application.id
+            assert data["mode"] is AppMode.CHAT
+            assert isinstance(data["created_at"], datetime)
+            assert "tenant_id" not in data
+            assert set(summary) == {"id", "name", "mode", "icon", "icon_background", "status"}
+
     def test_app_to_dict_with_config(self, app, factory):
         """测试转换为字典（包含配置）"""
         with app.app_context():
@@ -76,6 +76,55 @@ class TestModelProviderModel:
         data_with_creds = provider.to_dict(include_credentials=True)
         assert "encrypted_credentials" in data_with_creds
 
+    def test_to_view_dict(self, session):
+        """测试转换为接口响应字典"""
+        tenant = Tenant(name="Test Tenant", plan=TenantPlan.FREE, status=TenantStatus.ACTIVE)
+        session.add(tenant)
+        session.flush()
+
+        provider = ModelProvider(
+            tenant_id=tenant.id,
+            name="OpenAI GPT-4",
+            provider_type=ProviderType.OPENAI,
+            encrypted_credentials=ModelProvider.encrypt_credentials({"api_key": "sk-test-key"}),
+            config={"timeout": 30},
+        )
+        session.add(provider)
+        session.commit()
+
+        # 基础字段
+        data = provider.to_view_dict()
+        assert set(data) == {"id", "name", "is_active", "updated_at"}
+        assert data["id"] == provider.id
+
+        # 完整字段保持原始类型，且不包含凭证
+        full = provider.to_view_dict(full=True)
+        assert full["tenant_id"] == tenant.id
+        assert full["provider_type"] is ProviderType.OPENAI
+        assert full["config"] == {"timeout": 30}
+        assert "encrypted_credentials" not in full
+
+    def test_to_view_dict_empty_config(self, session):
+        """测试未设置配置时完整字段返回空字典"""
+        tenant = Tenant(name="Test Tenant", plan=TenantPlan.FREE, status=TenantStatus.ACTIVE)
+        session.add(tenant)
+        session.flush()
+
+        provider = ModelProvider(
+            tenant_id=tenant.id,
+            name="OpenAI GPT-4",
+            provider_type=ProviderType.OPENAI,
+            encrypted_credentials=ModelProvider.encrypt_credentials({"api_key": "sk-test-key"}),
+            config=None,
+            quota_config=None,
+        )
+        session.add(provider)
+        session.commit()
+
+        full = provider.to_view_dict(full=True)
+        assert full["config"] == {}
+        assert full["quota_config"] == {}
+
     def test_encrypt_decrypt_credentials(self):
         """测试凭证加密解密"""
         credentials = {"api_key": "sk-test-key", "base_url": "https://api.openai.com/v1"}
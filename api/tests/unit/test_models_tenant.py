@@ -193,3 +193,16 @@ class TestTenantModel:
             assert isinstance(data["name"], str)
             assert isinstance(data["plan"], str)
             assert isinstance(data["status"], str)
+    
+    def test_tenant_to_view_dict(self, app, factory):
+        """测试转换为接口响应字典"""
+        with app.app_context():
+            tenant = factory.create_tenant()
+            
+            data = tenant.to_view_dict()
+            
+            # 验证字段完整且保持原始类型
+            assert set(data) == {"id", "name", "plan", "status", "created_at", "updated_at"}
+            assert data["id"] == tenant.id
+            assert data["plan"] is TenantPlan.FREE
+            assert isinstance(data["created_at"], datetime)
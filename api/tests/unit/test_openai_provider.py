@@ -3,10 +3,14 @@ OpenAI Provider 单元测试
 """
 
 import json
+import threading
 
+import httpx
+import orjson
 import pytest
 from pytest_mock import MockerFixture
 
+from configs.app_config import Config
 from core.model_runtime.entities import (
     LLMMessage,
     LLMResult,
@@ -15,7 +19,9 @@ from core.model_runtime.entities import (
     ProviderCredentials,
     ProviderType,
 )
-from core.model_runtime.providers import OpenAIProvider
+from core.model_runtime.providers import OpenAIProvider, provider_cache
+from core.model_runtime.rate_limiter import llm_rate_limiter
+from libs.errors import RateLimitedError
 
 
 class TestOpenAIProvider:
@@ -24,6 +30,7 @@ class TestOpenAIProvider:
     @pytest.fixture
     def provider(self):
         """创建 OpenAI Provider 实例"""
+        provider_cache.clear_local_cache()
         return OpenAIProvider()
 
     @pytest.fixture
@@ -48,6 +55,17 @@ class TestOpenAIProvider:
         result = provider.validate_credentials(credentials)
         assert result is True
 
+    def test_validate_credentials_cached(self, provider, credentials, mocker: MockerFixture):
+        """测试验证通过的凭证在缓存期内不再请求接口"""
+        mocker.patch("core.model_runtime.providers.provider_cache.redis_client.get", side_effect=RuntimeError)
+        mocker.patch("core.model_runtime.providers.provider_cache.redis_client.set", side_effect=RuntimeError)
+        mock_client = mocker.Mock()
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        assert provider.validate_credentials(credentials) is True
+        assert provider.validate_credentials(credentials) is True
+        assert mock_client.get.call_count == 1
+
     def test_validate_credentials_missing_api_key(self, provider):
         """测试凭证验证缺少 API Key"""
         creds = ProviderCredentials(provider_type=ProviderType.OPENAI, credentials={})
@@ -59,7 +77,7 @@ class TestOpenAIProvider:
         # Mock httpx.Client.get
         mock_response = mocker.Mock()
         mock_response.raise_for_status = mocker.Mock()
-        mock_response.json.return_value = {"data": [{"id": "gpt-3.5-turbo"}, {"id": "gpt-4"}, {"id": "gpt-4-turbo"}]}
+        mock_response.content = orjson.dumps({"data": [{"id": "gpt-3.5-turbo"}, {"id": "gpt-4"}, {"id": "gpt-4-turbo"}]})
         mock_client = mocker.Mock()
         mock_client.get.return_value = mock_response
         mock_client.__enter__ = mocker.Mock(return_value=mock_client)
@@ -76,11 +94,11 @@ class TestOpenAIProvider:
         # Mock httpx.Client.post
         mock_response = mocker.Mock()
         mock_response.raise_for_status = mocker.Mock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "model": "gpt-3.5-turbo",
             "choices": [{"message": {"content": "Hello! How can I help?"}, "finish_reason": "stop"}],
             "usage": {"prompt_tokens": 10, "completion_tokens": 8, "total_tokens": 18},
-        }
+        })
         mock_client = mocker.Mock()
         mock_client.post.return_value = mock_response
         mock_client.__enter__ = mocker.Mock(return_value=mock_client)
@@ -100,6 +118,123 @@ class TestOpenAIProvider:
         assert result.usage.total_tokens == 18
         assert result.finish_reason == "stop"
 
+    def test_invoke_deterministic_uses_cache(self, provider, credentials, fake_redis, mocker: MockerFixture):
+        """测试 temperature=0 的调用命中响应缓存后不再请求接口"""
+        store = fake_redis("core.model_runtime.providers.llm_cache.redis_client")
+
+        mock_response = mocker.Mock()
+        mock_response.raise_for_status = mocker.Mock()
+        mock_response.content = orjson.dumps({
+            "model": "gpt-3.5-turbo",
+            "choices": [{"message": {"content": "4"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+        })
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        messages = [LLMMessage(role="user", content="2+2?")]
+        config = ModelConfig(model="gpt-3.5-turbo", temperature=0)
+
+        first = provider.invoke(credentials, config, messages)
+        second = provider.invoke(credentials, config, messages)
+
+        assert mock_client.post.call_count == 1
+        assert second == first
+        assert second.usage.total_tokens == 11
+
+        # 非确定性调用不读写缓存
+        provider.invoke(credentials, ModelConfig(model="gpt-3.5-turbo", temperature=0.7), messages)
+        assert mock_client.post.call_count == 2
+        assert len(store) == 1
+
+    def test_invoke_cache_not_shared_across_api_keys(self, provider, credentials, fake_redis, mocker: MockerFixture):
+        """测试不同 API Key 的确定性调用互不命中缓存"""
+        store = fake_redis("core.model_runtime.providers.llm_cache.redis_client")
+
+        mock_response = mocker.Mock()
+        mock_response.raise_for_status = mocker.Mock()
+        mock_response.content = orjson.dumps({
+            "model": "gpt-3.5-turbo",
+            "choices": [{"message": {"content": "4"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 1, "total_tokens": 11},
+        })
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        other = ProviderCredentials(
+            provider_type=credentials.provider_type,
+            credentials={**credentials.credentials, "api_key": "sk-other-key"},
+        )
+        messages = [LLMMessage(role="user", content="2+2?")]
+        config = ModelConfig(model="gpt-3.5-turbo", temperature=0)
+
+        provider.invoke(credentials, config, messages)
+        provider.invoke(other, config, messages)
+
+        assert mock_client.post.call_count == 2
+        assert len(store) == 2
+        assert all("sk-" not in key for key in store)
+
+    def test_invoke_adjusts_rate_limit_against_charged_tokens(self, provider, mocker: MockerFixture):
+        """测试预估值超过 tpm_limit 时按实际扣除的令牌数修正额度"""
+        consume = mocker.patch.object(llm_rate_limiter, "_consume", return_value=(True, 0.0))
+        mock_response = mocker.Mock()
+        mock_response.raise_for_status = mocker.Mock()
+        mock_response.content = orjson.dumps({
+            "model": "gpt-3.5-turbo",
+            "choices": [{"message": {"content": "ok"}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 100, "completion_tokens": 400, "total_tokens": 500},
+        })
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        credentials = ProviderCredentials(
+            provider_type=ProviderType.OPENAI,
+            credentials={"api_key": "sk-test-key", "tpm_limit": 6000},
+        )
+        config = ModelConfig(model="gpt-3.5-turbo", max_tokens=10000)
+        provider.invoke(credentials, config, [LLMMessage(role="user", content="hi")])
+
+        # 预估 10000 超过容量，实际扣除 6000；修正量以 6000 为基准
+        charges = [call.args[2] for call in consume.call_args_list]
+        assert charges == [6000, 500 - 6000]
+
+    def test_invoke_failure_refunds_rate_limit(self, provider, mocker: MockerFixture):
+        """测试调用失败（如上游 429）时退还全部已扣除的令牌"""
+        consume = mocker.patch.object(llm_rate_limiter, "_consume", return_value=(True, 0.0))
+        mock_client = mocker.Mock()
+        mock_client.post.side_effect = httpx.ConnectError("refused")
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        credentials = ProviderCredentials(
+            provider_type=ProviderType.OPENAI,
+            credentials={"api_key": "sk-test-key", "tpm_limit": 6000},
+        )
+        config = ModelConfig(model="gpt-3.5-turbo", max_tokens=1000)
+        with pytest.raises(ValueError, match="Failed to invoke model"):
+            provider.invoke(credentials, config, [LLMMessage(role="user", content="hi")])
+
+        charges = [call.args[2] for call in consume.call_args_list]
+        assert charges == [1000, -1000]
+
+    def test_invoke_slot_timeout(self, provider, credentials, mocker: MockerFixture):
+        """测试调用名额耗尽时等待超时返回限流错误"""
+        slots = threading.BoundedSemaphore(1)
+        slots.acquire()
+        mocker.patch.object(OpenAIProvider, "_request_slots", slots)
+        mocker.patch.object(Config, "LLM_REQUEST_SLOT_TIMEOUT", 0.01)
+        mock_client = mocker.Mock()
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        config = ModelConfig(model="gpt-3.5-turbo", temperature=0.7)
+        with pytest.raises(RateLimitedError):
+            provider.invoke(credentials, config, [LLMMessage(role="user", content="hi")])
+
+        mock_client.post.assert_not_called()
+
     def test_invoke_empty_messages(self, provider, credentials):
         """测试调用时消息为空"""
         config = ModelConfig(model="gpt-3.5-turbo")
@@ -119,7 +254,7 @@ class TestOpenAIProvider:
         # Mock httpx.Client.stream
         mock_response = mocker.Mock()
         mock_response.raise_for_status = mocker.Mock()
-        mock_response.iter_lines.return_value = iter(sse_lines)
+        mock_response.iter_bytes.return_value = iter(["\n\n".join(sse_lines).encode() + b"\n\n"])
         mock_response.__enter__ = mocker.Mock(return_value=mock_response)
         mock_response.__exit__ = mocker.Mock(return_value=False)
 
@@ -139,6 +274,52 @@ class TestOpenAIProvider:
         assert chunks[1].delta == "!"
         assert all(isinstance(chunk, LLMResultChunk) for chunk in chunks)
 
+    def test_stream_invoke_reuse_chunk(self, provider, credentials, mocker: MockerFixture):
+        """测试流式调用复用输出块"""
+        sse_lines = [
+            'data: {"model":"gpt-3.5-turbo","choices":[{"delta":{"content":"Hello"},"index":0}]}',
+            'data: {"model":"gpt-3.5-turbo","choices":[{"delta":{"content":"!"},"index":0}]}',
+            "data: [DONE]",
+        ]
+
+        mock_response = mocker.Mock()
+        mock_response.raise_for_status = mocker.Mock()
+        mock_response.iter_bytes.return_value = iter(["\n\n".join(sse_lines).encode() + b"\n\n"])
+        mock_response.__enter__ = mocker.Mock(return_value=mock_response)
+        mock_response.__exit__ = mocker.Mock(return_value=False)
+
+        mock_client = mocker.Mock()
+        mock_client.stream.return_value = mock_response
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        messages = [LLMMessage(role="user", content="Hello")]
+        config = ModelConfig(model="gpt-3.5-turbo", stream=True)
+
+        seen = [(id(chunk), chunk.delta) for chunk in provider.stream_invoke(credentials, config, messages, reuse_chunk=True)]
+
+        assert [delta for _, delta in seen] == ["Hello", "!"]
+        assert seen[0][0] == seen[1][0]
+
+    def test_stream_invoke_failure_refunds_rate_limit(self, provider, mocker: MockerFixture):
+        """测试流式调用失败时退还全部已扣除的令牌"""
+        consume = mocker.patch.object(llm_rate_limiter, "_consume", return_value=(True, 0.0))
+        mock_client = mocker.Mock()
+        mock_client.stream.side_effect = httpx.ConnectError("refused")
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        credentials = ProviderCredentials(
+            provider_type=ProviderType.OPENAI,
+            credentials={"api_key": "sk-test-key", "tpm_limit": 6000},
+        )
+        config = ModelConfig(model="gpt-3.5-turbo", max_tokens=1000, stream=True)
+        with pytest.raises(ValueError, match="Failed to stream invoke model"):
+            list(provider.stream_invoke(credentials, config, [LLMMessage(role="user", content="hi")]))
+
+        charges = [call.args[2] for call in consume.call_args_list]
+        assert charges == [1000, -1000]
+
     def test_stream_invoke_empty_messages(self, provider, credentials):
         """测试流式调用时消息为空"""
         config = ModelConfig(model="gpt-3.5-turbo", stream=True)
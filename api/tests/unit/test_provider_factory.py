@@ -2,6 +2,9 @@
 模型提供商工厂测试
 """
 
+import threading
+import time
+
 import pytest
 
 from core.model_runtime.entities import ProviderType
@@ -54,3 +57,26 @@ class TestModelProviderFactory:
         provider1 = ModelProviderFactory.get_llm_provider(ProviderType.OPENAI)
         provider2 = ModelProviderFactory.get_llm_provider(ProviderType.OPENAI)
         assert provider1 is provider2
+
+    def test_concurrent_first_use_creates_single_instance(self, mocker):
+        """测试并发首次获取时只创建一个实例"""
+        mocker.patch.object(ModelProviderFactory, "_llm_providers", {})
+
+        def slow_init():
+            time.sleep(0.01)
+            return object()
+
+        ctor = mocker.patch("core.model_runtime.providers.provider_factory.OpenAIProvider", side_effect=slow_init)
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(ModelProviderFactory.get_llm_provider(ProviderType.OPENAI)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert ctor.call_count == 1
+        assert len({id(provider) for provider in results}) == 1
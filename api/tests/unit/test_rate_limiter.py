@@ -0,0 +1,51 @@
+"""
+令牌桶限流器单元测试
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from core.model_runtime.rate_limiter import TokenBucketLimiter
+from libs.errors import RateLimitedError
+
+
+class TestTokenBucketLimiter:
+    """TokenBucketLimiter 测试类"""
+
+    @pytest.fixture
+    def limiter(self, mocker: MockerFixture):
+        """创建不实际等待的限流器"""
+        mocker.patch("core.model_runtime.rate_limiter.time.sleep")
+        return TokenBucketLimiter(max_retries=2)
+
+    def test_acquire_retries_then_succeeds(self, limiter, mocker: MockerFixture):
+        """测试令牌不足时退避重试"""
+        consume = mocker.patch.object(limiter, "_consume", side_effect=[(False, 0.5), (True, 0.0)])
+
+        limiter.acquire("bucket", 6000, 100)
+
+        assert consume.call_count == 2
+
+    def test_acquire_raises_after_retries(self, limiter, mocker: MockerFixture):
+        """测试重试后仍不足时抛出 RateLimitedError"""
+        consume = mocker.patch.object(limiter, "_consume", return_value=(False, 1.0))
+
+        with pytest.raises(RateLimitedError):
+            limiter.acquire("bucket", 6000, 100)
+
+        assert consume.call_count == 3
+
+    def test_acquire_allows_when_redis_unavailable(self, limiter, mocker: MockerFixture):
+        """测试 Redis 不可用时放行"""
+        mocker.patch.object(limiter, "_consume", side_effect=ConnectionError("redis down"))
+
+        limiter.acquire("bucket", 6000, 100)
+
+    def test_cost_capped_at_capacity(self, limiter, mocker: MockerFixture):
+        """测试预估值超过容量时按容量扣除"""
+        consume = mocker.patch.object(limiter, "_consume", return_value=(True, 0.0))
+
+        charged = limiter.acquire("bucket", 1000, 5000)
+
+        consume.assert_called_once_with("bucket", 1000, 1000)
+        assert charged == 1000
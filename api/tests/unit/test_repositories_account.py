@@ -49,6 +49,17 @@ class TestAccountRepository:
             assert found is not None
             assert found.id == account.id
             assert found.email == "unique@example.com"
+
+    def test_get_by_email_rebinds_parameter(self, app, factory):
+        """测试缓存的语句每次使用新的邮箱参数"""
+        with app.app_context():
+            repo = AccountRepository()
+            first = factory.create_account(email="first@example.com")
+            second = factory.create_account(email="second@example.com")
+
+            assert repo.get_by_email("first@example.com").id == first.id
+            assert repo.get_by_email("second@example.com").id == second.id
+            assert repo.get_by_email("missing@example.com") is None
     
     def test_email_exists(self, app, factory):
         """测试邮箱是否存在"""
@@ -87,6 +98,20 @@ class TestAccountRepository:
             
             assert len(banned_accounts) == 2
             assert all(acc.status == AccountStatus.BANNED for acc in banned_accounts)
+
+    def test_stream_by_status(self, app, factory):
+        """测试逐批读取指定状态的账户"""
+        with app.app_context():
+            repo = AccountRepository()
+
+            for i in range(5):
+                factory.create_account(email=f"banned{i}@example.com", status=AccountStatus.BANNED)
+            factory.create_account(email="active@example.com", status=AccountStatus.ACTIVE)
+
+            streamed = list(repo.stream_by_status(AccountStatus.BANNED, batch_size=2))
+
+            assert len(streamed) == 5
+            assert [acc.id for acc in streamed] == sorted(acc.id for acc in streamed)
     
     def test_update(self, app, factory):
         """测试更新账户"""
@@ -99,6 +124,31 @@ class TestAccountRepository:
             assert updated is not None
             assert updated.name == "New Name"
     
+    def test_update_returns_loaded_instance(self, app, factory):
+        """测试更新后读取属性不再发出查询"""
+        from sqlalchemy import event
+
+        with app.app_context():
+            repo = AccountRepository()
+            account = factory.create_account(name="Old Name")
+            account_id = account.id
+
+            statements = []
+            engine = repo.session.get_bind()
+
+            def listener(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                updated = repo.update(account_id, name="New Name")
+                assert (updated.name, updated.email) == ("New Name", account.email)
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+
+            assert len(statements) == 1
+            assert statements[0].lstrip().upper().startswith("UPDATE")
+
     def test_update_status(self, app, factory):
         """测试更新状态"""
         with app.app_context():
@@ -132,6 +182,39 @@ class TestAccountRepository:
             assert activated is not None
             assert activated.status == AccountStatus.ACTIVE
     
+    def test_bulk_create_and_update_status(self, app, factory):
+        """测试批量创建账户和批量更新状态"""
+        with app.app_context():
+            repo = AccountRepository()
+            
+            count = repo.bulk_create([
+                {"email": f"bulk{i}@example.com", "password_hash": "hash", "name": f"User {i}"}
+                for i in range(3)
+            ])
+            
+            assert count == 3
+            accounts = repo.get_all()
+            assert len(accounts) == 3
+            assert all(account.status == AccountStatus.ACTIVE for account in accounts)
+            
+            updated = repo.bulk_update_status([a.id for a in accounts[:2]], AccountStatus.BANNED)
+            
+            assert updated == 2
+            assert len(repo.get_by_status(AccountStatus.BANNED)) == 2
+
+    def test_bulk_create_rolls_back_on_failure(self, app, factory):
+        """测试批量创建失败时回滚，会话可继续使用"""
+        from sqlalchemy.exc import IntegrityError
+
+        with app.app_context():
+            repo = AccountRepository()
+            factory.create_account(email="taken@example.com")
+
+            with pytest.raises(IntegrityError):
+                repo.bulk_create([{"email": "taken@example.com", "password_hash": "hash", "name": "Dup"}])
+
+            assert repo.count() == 1
+    
     def test_delete(self, app, factory):
         """测试删除账户"""
         with app.app_context():
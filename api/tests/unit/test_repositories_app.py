@@ -56,6 +56,47 @@ class TestAppRepository:
             assert len(active_apps) == 2
             assert all(a.status == AppStatus.NORMAL for a in active_apps)
     
+    def test_get_by_tenant_summary_only(self, app, factory):
+        """测试只加载摘要列获取租户的应用"""
+        from sqlalchemy import inspect
+
+        with app.app_context():
+            repo = AppRepository()
+            tenant = factory.create_tenant()
+            
+            tenant_id = tenant.id
+            factory.create_app(tenant, name="App 1")
+            repo.session.expunge_all()
+            
+            apps = repo.get_by_tenant(tenant_id, summary_only=True)
+            
+            assert len(apps) == 1
+            assert apps[0].name == "App 1"
+            assert "description" in inspect(apps[0]).unloaded
+
+    def test_get_by_tenant_eager_loads_model_config(self, app, factory):
+        """测试租户应用列表预加载模型配置，其他关系禁止懒加载"""
+        from sqlalchemy import inspect
+        from sqlalchemy.exc import InvalidRequestError
+
+        with app.app_context():
+            repo = AppRepository()
+            tenant = factory.create_tenant()
+
+            tenant_id = tenant.id
+            repo.create_with_config(
+                {"name": "App 1", "tenant_id": tenant_id, "mode": AppMode.CHAT},
+                {"provider": "openai", "model": "gpt-4", "configs": {}},
+            )
+            repo.session.expunge_all()
+
+            apps = repo.get_by_tenant(tenant_id)
+
+            assert "model_config" not in inspect(apps[0]).unloaded
+            assert apps[0].to_dict()["model_config"]["model"] == "gpt-4"
+            with pytest.raises(InvalidRequestError):
+                apps[0].tenant
+    
     def test_get_by_mode(self, app, factory):
         """测试根据模式获取应用"""
         with app.app_context():
@@ -193,6 +234,48 @@ class TestAppRepository:
             count = repo.count_by_tenant(tenant.id)
             
             assert count == 3
+
+    def test_get_by_tenant_and_name(self, app, factory):
+        """测试按名称获取租户应用（不区分大小写）"""
+        with app.app_context():
+            repo = AppRepository()
+            tenant = factory.create_tenant()
+            other = factory.create_tenant(name="Other Tenant")
+
+            application = factory.create_app(tenant, name="My App")
+
+            assert repo.get_by_tenant_and_name(tenant.id, "my app").id == application.id
+            assert repo.get_by_tenant_and_name(other.id, "My App") is None
+
+    def test_duplicate_name_in_tenant_rejected(self, app, factory):
+        """测试同一租户内不能创建同名应用"""
+        from sqlalchemy.exc import IntegrityError
+
+        with app.app_context():
+            repo = AppRepository()
+            tenant = factory.create_tenant()
+            factory.create_app(tenant, name="My App")
+
+            with pytest.raises(IntegrityError):
+                repo.create(name="MY APP", tenant_id=tenant.id, mode=AppMode.CHAT)
+
+            # 回滚后会话仍可使用
+            assert repo.count_by_tenant(tenant.id) == 1
+
+    def test_archived_app_name_reusable(self, app, factory):
+        """测试已归档应用不占用名称"""
+        from sqlalchemy.exc import IntegrityError
+
+        with app.app_context():
+            repo = AppRepository()
+            tenant = factory.create_tenant()
+            archived = factory.create_app(tenant, name="My App", status=AppStatus.ARCHIVED)
+
+            application = repo.create(name="my app", tenant_id=tenant.id, mode=AppMode.CHAT)
+
+            assert repo.get_by_tenant_and_name(tenant.id, "My App").id == application.id
+            with pytest.raises(IntegrityError):
+                repo.unarchive(archived.id)
     
     def test_enable_site(self, app, factory):
         """测试启用网站"""
@@ -229,6 +312,19 @@ class TestAppRepository:
             
             assert updated is not None
             assert updated.name == "New Name"
+
+    def test_update_ignores_non_column_keys(self, app, factory):
+        """测试更新时忽略关系和方法等非列属性"""
+        with app.app_context():
+            repo = AppRepository()
+            tenant = factory.create_tenant()
+            application = factory.create_app(tenant, name="Old Name")
+            app_id = application.id
+
+            updated = repo.update(app_id, model_config={}, to_dict=1, name="New Name")
+
+            assert updated.id == app_id
+            assert updated.name == "New Name"
     
     def test_delete(self, app, factory):
         """测试删除应用"""
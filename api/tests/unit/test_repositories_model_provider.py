@@ -75,6 +75,28 @@ class TestModelProviderRepository:
         providers_all = repository.get_by_tenant_id(tenant.id, include_inactive=True)
         assert len(providers_all) == 3
 
+    def test_get_by_tenant_id_summary_only(self, repository, tenant, session):
+        """测试只加载摘要列获取提供商配置列表"""
+        from sqlalchemy import inspect
+
+        tenant_id = tenant.id
+        session.add(
+            ModelProvider(
+                tenant_id=tenant_id,
+                name="OpenAI",
+                provider_type=ProviderType.OPENAI,
+                encrypted_credentials=ModelProvider.encrypt_credentials({"api_key": "key1"}),
+            )
+        )
+        session.commit()
+        session.expunge_all()
+
+        providers = repository.get_by_tenant_id(tenant_id, summary_only=True)
+
+        assert len(providers) == 1
+        assert providers[0].name == "OpenAI"
+        assert "encrypted_credentials" in inspect(providers[0]).unloaded
+
     def test_get_by_tenant_and_type(self, repository, tenant, session):
         """测试根据租户 ID 和类型获取提供商配置"""
         provider1 = ModelProvider(
@@ -1,6 +1,8 @@
 """
 Tenant Repository 测试
 """
+from uuid import uuid4
+
 import pytest
 
 from models.tenant import Tenant, TenantStatus, TenantPlan, TenantRole
@@ -134,6 +136,36 @@ class TestTenantRepository:
             
             assert role == TenantRole.ADMIN
     
+    def test_get_member_roles(self, app, factory):
+        """测试批量获取成员角色"""
+        with app.app_context():
+            repo = TenantRepository()
+            tenant1 = factory.create_tenant(name="Tenant 1")
+            tenant2 = factory.create_tenant(name="Tenant 2")
+            tenant3 = factory.create_tenant(name="Tenant 3")
+            account = factory.create_account()
+            factory.create_tenant_account_join(tenant1, account, role=TenantRole.OWNER)
+            factory.create_tenant_account_join(tenant2, account, role=TenantRole.MEMBER)
+            
+            roles = repo.get_member_roles([tenant1.id, tenant2.id, tenant3.id], account.id)
+            
+            assert roles == {tenant1.id: TenantRole.OWNER, tenant2.id: TenantRole.MEMBER}
+            assert repo.get_member_roles([], account.id) == {}
+    
+    def test_get_member_joins(self, app, factory):
+        """测试批量获取成员关联记录"""
+        with app.app_context():
+            repo = TenantRepository()
+            tenant = factory.create_tenant()
+            account1 = factory.create_account(email="user1@example.com")
+            account2 = factory.create_account(email="user2@example.com")
+            factory.create_tenant_account_join(tenant, account1, role=TenantRole.ADMIN)
+            
+            joins = repo.get_member_joins(tenant.id, [account1.id, account2.id])
+            
+            assert list(joins) == [account1.id]
+            assert joins[account1.id].role == TenantRole.ADMIN
+    
     def test_update_member_role(self, app, factory):
         """测试更新成员角色"""
         with app.app_context():
@@ -174,6 +206,25 @@ class TestTenantRepository:
             
             assert repo.is_member(tenant.id, account.id) is True
     
+    def test_get_with_membership(self, app, factory):
+        """测试单次查询获取租户及成员角色"""
+        with app.app_context():
+            repo = TenantRepository()
+            tenant = factory.create_tenant()
+            member = factory.create_account()
+            outsider = factory.create_account(email="outsider@example.com")
+            repo.add_member(tenant.id, member.id, TenantRole.ADMIN)
+            
+            found, role = repo.get_with_membership(tenant.id, member.id)
+            assert found.id == tenant.id
+            assert role == TenantRole.ADMIN
+            
+            found, role = repo.get_with_membership(tenant.id, outsider.id)
+            assert found.id == tenant.id
+            assert role is None
+            
+            assert repo.get_with_membership(uuid4(), member.id) == (None, None)
+    
     def test_update(self, app, factory):
         """测试更新租户"""
         with app.app_context():
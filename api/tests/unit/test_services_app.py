@@ -5,12 +5,14 @@
 from unittest.mock import Mock
 
 import pytest
+from sqlalchemy.exc import IntegrityError
 
 from models.app import App, AppMode, AppStatus
 from models.tenant import Tenant, TenantRole
 from services.app_service import AppService
 from services.exceptions import (
     AuthorizationError,
+    ResourceConflictError,
     ResourceNotFoundError,
     ValidationError,
 )
@@ -97,6 +99,23 @@ class TestAppService:
 
         assert "not a member" in str(exc_info.value).lower()
 
+    def test_create_app_duplicate_name(self, app_service, mock_app_repo, mock_tenant_repo):
+        """测试创建同名应用"""
+        tenant_id = "tenant-123"
+        account_id = "account-456"
+
+        mock_tenant_repo.get_by_id.return_value = Tenant(id=tenant_id)
+        mock_tenant_repo.is_member.return_value = True
+
+        # Mock 唯一索引冲突
+        mock_app_repo.create.side_effect = IntegrityError("INSERT", {}, Exception("unique"))
+        mock_app_repo.get_by_tenant_and_name.return_value = App(name="Test App", tenant_id=tenant_id)
+
+        with pytest.raises(ResourceConflictError):
+            app_service.create_app(tenant_id, account_id, " Test App ", AppMode.CHAT)
+
+        mock_app_repo.get_by_tenant_and_name.assert_called_once_with(tenant_id, "Test App")
+
     def test_create_app_with_config_success(self, app_service, mock_app_repo, mock_tenant_repo):
         """测试创建应用及配置成功"""
         tenant_id = "tenant-123"
@@ -270,6 +289,25 @@ class TestAppService:
         assert result.status == AppStatus.NORMAL
         mock_app_repo.unarchive.assert_called_once_with(app_id)
 
+    def test_unarchive_app_name_taken(self, app_service, mock_app_repo, mock_tenant_repo):
+        """测试取消归档时名称已被其他正常应用占用"""
+        app_id = "app-123"
+        account_id = "account-456"
+
+        mock_app_repo.get_by_id.return_value = App(
+            id=app_id, tenant_id="tenant-123", name="Test App", status=AppStatus.ARCHIVED
+        )
+        mock_tenant_repo.is_member.return_value = True
+
+        # Mock 唯一索引冲突
+        mock_app_repo.unarchive.side_effect = IntegrityError("UPDATE", {}, Exception("unique"))
+        mock_app_repo.get_by_tenant_and_name.return_value = App(name="Test App", tenant_id="tenant-123")
+
+        with pytest.raises(ResourceConflictError):
+            app_service.unarchive_app(app_id, account_id)
+
+        mock_app_repo.get_by_tenant_and_name.assert_called_once_with("tenant-123", "Test App")
+
     def test_get_tenant_apps_success(self, app_service, mock_app_repo, mock_tenant_repo):
         """测试获取租户应用列表成功"""
         tenant_id = "tenant-123"
@@ -292,7 +330,7 @@ class TestAppService:
         assert len(result) == 2
         assert result[0].name == "App 1"
         assert result[1].name == "App 2"
-        mock_app_repo.get_active_apps_by_tenant.assert_called_once_with(tenant_id)
+        mock_app_repo.get_active_apps_by_tenant.assert_called_once_with(tenant_id, summary_only=False)
 
     def test_get_tenant_apps_include_archived(self, app_service, mock_app_repo, mock_tenant_repo):
         """测试获取租户应用列表包含已归档"""
@@ -315,7 +353,7 @@ class TestAppService:
 
         # 验证结果
         assert len(result) == 2
-        mock_app_repo.get_by_tenant.assert_called_once_with(tenant_id)
+        mock_app_repo.get_by_tenant.assert_called_once_with(tenant_id, summary_only=False)
 
     def test_get_tenant_apps_not_tenant_member(self, app_service, mock_tenant_repo):
         """测试获取租户应用时不是租户成员"""
@@ -331,6 +369,19 @@ class TestAppService:
         with pytest.raises(AuthorizationError):
             app_service.get_tenant_apps(tenant_id, account_id)
 
+    def test_get_tenant_apps_skip_access_check(self, app_service, mock_app_repo, mock_tenant_repo):
+        """测试已检查过权限时获取租户应用列表不再查询租户和成员"""
+        tenant_id = "tenant-123"
+        account_id = "account-456"
+
+        mock_app_repo.get_active_apps_by_tenant.return_value = []
+
+        app_service.get_tenant_apps(tenant_id, account_id, summary_only=True, check_access=False)
+
+        mock_tenant_repo.get_by_id.assert_not_called()
+        mock_tenant_repo.is_member.assert_not_called()
+        mock_app_repo.get_active_apps_by_tenant.assert_called_once_with(tenant_id, summary_only=True)
+
     def test_get_app_detail_success(self, app_service, mock_app_repo, mock_tenant_repo):
         """测试获取应用详情成功"""
         app_id = "app-123"
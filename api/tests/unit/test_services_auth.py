@@ -339,3 +339,24 @@ class TestAuthService:
 
         # 验证调用了 update
         mock_account_repo.update.assert_called_once()
+
+    def test_secrets_equal(self, auth_service):
+        """测试恒定时间密钥比较"""
+        assert auth_service._secrets_equal("123456", "123456") is True
+        assert auth_service._secrets_equal("123456", "123457") is False
+        assert auth_service._secrets_equal("123", "123456") is False
+
+    def test_password_hash_runs_in_threadpool_under_gevent(self, mock_account_repo):
+        """测试 gevent worker 下密码哈希在受限的线程池中执行"""
+        service = AuthService(account_repo=mock_account_repo, password_hash_concurrency=2)
+
+        with patch("services.auth_service.monkey.is_module_patched", return_value=True), patch(
+            "services.auth_service.ThreadPool"
+        ) as thread_pool:
+            thread_pool.return_value.apply.side_effect = lambda func, args: func(*args)
+            password_hash = service._hash_password("password123")
+
+            assert service._check_password(password_hash, "password123") is True
+
+        thread_pool.assert_called_once_with(2)
+        assert thread_pool.return_value.apply.call_count == 2
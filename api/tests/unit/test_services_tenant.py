@@ -6,6 +6,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from libs.sieve_cache import SieveCache
 from models.account import Account
 from models.tenant import Tenant, TenantPlan, TenantRole, TenantStatus
 from services.exceptions import (
@@ -344,6 +345,30 @@ class TestTenantService:
         assert result[0].name == "Tenant 1"
         assert result[1].name == "Tenant 2"
 
+    def test_is_member_uses_cache(self, mock_tenant_repo, mock_account_repo):
+        """测试成员关系缓存命中及成员变更后失效"""
+        service = TenantService(
+            tenant_repo=mock_tenant_repo,
+            account_repo=mock_account_repo,
+            membership_cache=SieveCache(maxsize=16, ttl=60),
+        )
+        tenant_id = "tenant-123"
+        account_id = "account-789"
+
+        mock_tenant_repo.get_member_role.return_value = None
+        assert service.is_member(tenant_id, account_id) is False
+        assert service.is_member(tenant_id, account_id) is False
+        assert mock_tenant_repo.get_member_role.call_count == 1
+
+        # 添加成员后缓存失效
+        mock_tenant_repo.get_by_id.return_value = Mock()
+        mock_account_repo.get_by_id.return_value = Mock()
+        mock_tenant_repo.is_member.return_value = False
+        mock_tenant_repo.get_member_role.return_value = TenantRole.OWNER
+        service.add_member(tenant_id, account_id, TenantRole.MEMBER, "owner-456")
+
+        assert service.is_member(tenant_id, account_id) is True
+
     def test_check_permission_owner_has_all_permissions(self, tenant_service, mock_tenant_repo):
         """测试 OWNER 拥有所有权限"""
         tenant_id = "tenant-123"
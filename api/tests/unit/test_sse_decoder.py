@@ -0,0 +1,28 @@
+"""
+SSE 解码器单元测试
+"""
+
+from core.model_runtime.sse_decoder import SSEDecoder, iter_sse_data
+
+
+class TestSSEDecoder:
+    """SSEDecoder 测试类"""
+
+    def test_event_split_across_chunks(self):
+        """测试事件及分隔符跨字节块"""
+        decoder = SSEDecoder()
+
+        assert decoder.feed(b'data: {"a"') == []
+        assert decoder.feed(b": 1}\n") == []
+        assert decoder.feed(b"\ndata: [DO") == [b'{"a": 1}']
+        assert decoder.feed(b"NE]\n\n") == [b"[DONE]"]
+
+    def test_crlf_comments_and_multiline_data(self):
+        """测试 CRLF 换行、注释行和多行 data"""
+        chunks = [b": keep-alive\r\n\r", b"\nevent: message\r\ndata: line1\r\ndata:line2\r\n\r\n"]
+
+        assert list(iter_sse_data(chunks)) == [b"line1\nline2"]
+
+    def test_flush_trailing_event(self):
+        """测试流结束时未以空行结尾的事件"""
+        assert list(iter_sse_data([b"data: first\n\ndata: last"])) == [b"first", b"last"]
@@ -2,6 +2,7 @@
 TEI Provider 单元测试
 """
 
+import orjson
 import pytest
 from pytest_mock import MockerFixture
 
@@ -10,7 +11,7 @@ from core.model_runtime.entities import (
     ProviderCredentials,
     ProviderType,
 )
-from core.model_runtime.providers import TEIProvider
+from core.model_runtime.providers import TEIProvider, provider_cache
 
 
 class TestTEIProvider:
@@ -19,6 +20,7 @@ class TestTEIProvider:
     @pytest.fixture
     def provider(self):
         """创建 TEI Provider 实例"""
+        provider_cache.clear_local_cache()
         return TEIProvider()
 
     @pytest.fixture
@@ -57,7 +59,7 @@ class TestTEIProvider:
         # Mock httpx.Client.post
         mock_response = mocker.Mock()
         mock_response.raise_for_status = mocker.Mock()
-        mock_response.json.return_value = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+        mock_response.content = orjson.dumps([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
         mock_client = mocker.Mock()
         mock_client.post.return_value = mock_response
         mock_client.__enter__ = mocker.Mock(return_value=mock_client)
@@ -74,6 +76,38 @@ class TestTEIProvider:
         assert result.embeddings[1] == [0.4, 0.5, 0.6]
         assert result.usage.prompt_tokens > 0
 
+    def test_embed_documents_in_parallel_batches(self, provider, mocker: MockerFixture):
+        """测试超过 batch_size 时分批请求并保持顺序"""
+
+        def post(url, headers=None, content=None):
+            texts = orjson.loads(content)["inputs"]
+            response = mocker.Mock()
+            response.content = orjson.dumps([[float(text)] for text in texts])
+            return response
+
+        mock_client = mocker.Mock()
+        mock_client.post.side_effect = post
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        credentials = ProviderCredentials(
+            provider_type=ProviderType.TEI, credentials={"base_url": "http://localhost:8080", "batch_size": 2}
+        )
+        texts = [str(i) for i in range(5)]
+        result = provider.embed_documents(credentials, "tei-embedding", texts)
+
+        assert mock_client.post.call_count == 3
+        assert result.embeddings == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+
+    @pytest.mark.parametrize("batch_size", [0, -1, "0"])
+    def test_embed_documents_invalid_batch_size(self, provider, batch_size):
+        """测试 batch_size 小于 1 时报错"""
+        credentials = ProviderCredentials(
+            provider_type=ProviderType.TEI, credentials={"base_url": "http://localhost:8080", "batch_size": batch_size}
+        )
+
+        with pytest.raises(ValueError, match="batch_size must be at least 1"):
+            provider.embed_documents(credentials, "tei-embedding", ["hello"])
+
     def test_embed_documents_empty_texts(self, provider, credentials):
         """测试向量化空文本列表"""
         with pytest.raises(ValueError, match="texts cannot be empty"):
@@ -84,7 +118,7 @@ class TestTEIProvider:
         # Mock httpx.Client.post
         mock_response = mocker.Mock()
         mock_response.raise_for_status = mocker.Mock()
-        mock_response.json.return_value = [[0.1, 0.2, 0.3]]
+        mock_response.content = orjson.dumps([[0.1, 0.2, 0.3]])
         mock_client = mocker.Mock()
         mock_client.post.return_value = mock_response
         mock_client.__enter__ = mocker.Mock(return_value=mock_client)
@@ -97,3 +131,13 @@ class TestTEIProvider:
         assert isinstance(embedding, list)
         assert len(embedding) == 3
         assert embedding == [0.1, 0.2, 0.3]
+
+    def test_http_client_reused_until_closed(self, provider):
+        """测试 HTTP 客户端跨调用复用，关闭后重新创建"""
+        client = provider.http_client
+        assert provider.http_client is client
+
+        provider.close()
+        assert client.is_closed
+        assert provider.http_client is not client
+        provider.close()
@@ -0,0 +1,36 @@
+-- 为已有数据库添加 uq_apps_tenant_lower_name 索引
+--
+-- 同一租户内正常应用的名称唯一（不区分大小写），已归档的应用不占用名称。
+-- 存在重名的正常应用时不做任何修改并报错，列出冲突的租户和名称，
+-- 需先手动重命名或归档冲突的应用后重新执行。可重复执行。
+--
+-- 用法:
+--   psql -v ON_ERROR_STOP=1 -U postgres -d shadow_agents -f scripts/migration/uq_apps_tenant_lower_name.sql
+
+BEGIN;
+
+DO $$
+DECLARE
+    duplicates TEXT;
+BEGIN
+    SELECT string_agg(format('tenant_id=%s name=%s (%s apps)', tenant_id, lower_name, n), E'\n')
+    INTO duplicates
+    FROM (
+        SELECT tenant_id, lower(name) AS lower_name, count(*) AS n
+        FROM apps
+        WHERE status = 'NORMAL'
+        GROUP BY tenant_id, lower(name)
+        HAVING count(*) > 1
+    ) AS d;
+
+    IF duplicates IS NOT NULL THEN
+        RAISE EXCEPTION E'Duplicate app names (case-insensitive) among NORMAL apps, rename or archive them first:\n%', duplicates;
+    END IF;
+END
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_apps_tenant_lower_name
+    ON apps (tenant_id, lower(name))
+    WHERE status = 'NORMAL';
+
+COMMIT;